@@ -10,6 +10,7 @@ Complete evaluation pipeline for cybersecurity policy frameworks:
 
 Usage:
     python cyber_policy_bench.py --models 2 --questions 3 --setup-db
+    python cyber_policy_bench.py score experiment_results/detailed_results.json
 """
 
 import os
@@ -18,7 +19,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 # Fix tokenizer parallelism warning
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -26,18 +27,64 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 # Import core components
 from src.utils import (
     get_config_value,
+    load_json,
     setup_logging,
     Timer,
     ValidationError,
     validate_config,
     get_enabled_evaluation_modes,
 )
-from src.vectorize import FrameworkProcessor
-from src.db import VectorDatabase
+from src.cache import JsonlCache
+from src.control_catalog import build_control_catalog
+from src.hedging import get_hedging_policy
+from src.circuit_breaker import get_circuit_breaker_stats
 from src.evaluator import CyberPolicyEvaluator, EvaluationMode
-from src.scorer import AccuracyScorer, TwoJudgeScorer, ScoringMethod
+from src.scorer import (
+    AccuracyScorer,
+    EnsembleJudgeScorer,
+    TwoJudgeScorer,
+    ScoringMethod,
+    get_pre_judge,
+    get_semantic_similarity_scorer,
+)
 from src.models import get_model_manager
+from src.pipeline import stream_into_scoring
 from src.reporter import create_benchmark_reporter
+from src.rescore import rescore_saved_results
+from src.context_store import CONTEXTS_DIRNAME, ContextStore
+from src.result_writer import (
+    SCORED_STREAM_FILENAME,
+    ResultStreamWriter,
+    compact_result_stream,
+    iter_result_stream,
+    write_result_records,
+    write_result_stream,
+)
+from src.aggregates import (
+    ModelAggregate,
+    aggregate_stream,
+    load_aggregates,
+    merge_aggregates,
+    save_aggregates,
+)
+
+# Document processing and the vector database are imported only when needed,
+# so the score subcommand starts without loading them
+if TYPE_CHECKING:
+    from src.db import VectorDatabase
+
+# Subdirectory of the run directory used while appending models
+APPEND_DIRNAME = "appending"
+
+# Scoring methods applied to every evaluation result
+SCORING_METHODS = [ScoringMethod.CONTROL_REFERENCE, ScoringMethod.LLM_JUDGE]
+
+
+def get_scoring_methods() -> List[ScoringMethod]:
+    """Scoring methods for this run, adding embedding similarity if enabled."""
+    if get_config_value("Scoring", "semantic_similarity", True, bool):
+        return SCORING_METHODS + [ScoringMethod.SEMANTIC_SIMILARITY]
+    return list(SCORING_METHODS)
 
 
 def validate_setup() -> bool:
@@ -76,8 +123,10 @@ def validate_setup() -> bool:
     return True
 
 
-def setup_vector_database() -> VectorDatabase:
+def setup_vector_database() -> "VectorDatabase":
     """Set up vector database from existing chunks or create new ones."""
+    from src.db import VectorDatabase
+
     logger = setup_logging()
 
     chunks_dir = Path(get_config_value("Paths", "chunks_dir", "./output/chunks"))
@@ -93,6 +142,8 @@ def setup_vector_database() -> VectorDatabase:
                 framework_processor = OptimizedFrameworkProcessor()
                 logger.info("Using optimized framework processor with smart chunking")
             except ImportError:
+                from src.vectorize import FrameworkProcessor
+
                 framework_processor = FrameworkProcessor()
                 logger.info("Using standard framework processor")
 
@@ -128,19 +179,60 @@ def setup_vector_database() -> VectorDatabase:
     return vector_db
 
 
-async def run_evaluation(
-    vector_db: VectorDatabase, num_models: int = 2, num_questions: int = 3
-) -> Dict:
-    """Run the complete evaluation pipeline."""
+def setup_control_catalog() -> None:
+    """Rebuild the control catalog used for citation verification."""
     logger = setup_logging()
+
+    with Timer("Control catalog build"):
+        catalog = build_control_catalog()
+
+    stats = catalog.get_stats()
     logger.info(
-        f"Starting evaluation pipeline: {num_models} models, {num_questions} questions"
+        f"Control catalog ready: {stats['total_controls']} control identifiers "
+        f"from {len(stats['frameworks'])} frameworks"
     )
 
-    with Timer("Model evaluation"):
-        # Initialize evaluator
-        evaluator = CyberPolicyEvaluator(vector_db=vector_db)
 
+def open_response_journal() -> Optional[JsonlCache]:
+    """Open the append-only model response journal if response caching is enabled."""
+    if not get_config_value("Options", "cache_responses", True, bool):
+        return None
+
+    cache_dir = Path(get_config_value("Paths", "cache_dir", "./experiment_cache"))
+    return JsonlCache(cache_dir / "response_journal.jsonl")
+
+
+def open_verdict_cache() -> Optional[JsonlCache]:
+    """Open the persistent judge verdict cache if verdict caching is enabled."""
+    if not get_config_value("Options", "cache_judge_verdicts", True, bool):
+        return None
+
+    cache_dir = Path(get_config_value("Paths", "cache_dir", "./experiment_cache"))
+    return JsonlCache(cache_dir / "judge_verdicts.jsonl")
+
+
+async def prepare_evaluation(
+    vector_db: "VectorDatabase",
+    num_models: int,
+    num_questions: int,
+    journal: Optional[JsonlCache] = None,
+    resume: bool = True,
+    model_ids: Optional[List[str]] = None,
+) -> Tuple[CyberPolicyEvaluator, List[str], List[Dict], List[EvaluationMode]]:
+    """Create the evaluator and select the models, questions and modes to run.
+
+    ``model_ids`` evaluates exactly those models instead of the top ``num_models``.
+    """
+    logger = setup_logging()
+
+    # Initialize evaluator
+    evaluator = CyberPolicyEvaluator(
+        vector_db=vector_db, journal=journal, resume=resume
+    )
+
+    if model_ids:
+        models = list(model_ids)
+    else:
         # Get models from model manager
         model_manager = get_model_manager()
         await model_manager.refresh_models()
@@ -150,59 +242,269 @@ async def run_evaluation(
         )
         models = eval_models[:num_models]
 
-        # Load evaluation questions
-        questions = evaluator.load_evaluation_questions()[:num_questions]
+    # Load evaluation questions
+    questions = evaluator.load_evaluation_questions()[:num_questions]
+
+    # Get enabled evaluation modes from configuration
+    modes = get_enabled_evaluation_modes()
+
+    logger.info(f"Testing models: {models}")
+    logger.info(f"Evaluation modes: {[m.value for m in modes]}")
+
+    return evaluator, models, questions, modes
+
+
+async def run_evaluation(
+    vector_db: "VectorDatabase",
+    num_models: int = 2,
+    num_questions: int = 3,
+    resume: bool = True,
+    model_ids: Optional[List[str]] = None,
+    output_dir: Optional[Path] = None,
+) -> Dict:
+    """Run the complete evaluation pipeline.
+
+    Evaluation output is written to ``output_dir`` (the run directory if None).
+    """
+    logger = setup_logging()
+    logger.info(
+        f"Starting evaluation pipeline: {num_models} models, {num_questions} questions"
+    )
 
-        # Get enabled evaluation modes from configuration
-        modes = get_enabled_evaluation_modes()
+    journal = open_response_journal()
+    if journal is not None:
+        logger.info(
+            f"Response journal: {journal.path} ({len(journal)} entries, resume={'on' if resume else 'off'})"
+        )
 
-        logger.info(f"Testing models: {models}")
-        logger.info(f"Evaluation modes: {[m.value for m in modes]}")
+    with Timer("Model evaluation"):
+        evaluator, models, questions, modes = await prepare_evaluation(
+            vector_db, num_models, num_questions, journal, resume, model_ids
+        )
 
         # Run evaluation
-        evaluation_results = await evaluator.run_evaluation(models, questions, modes)
+        try:
+            evaluation_results = await evaluator.run_evaluation(
+                models, questions, modes, output_dir=str(output_dir or get_run_dir())
+            )
+        finally:
+            if journal is not None:
+                journal.close()
 
     return evaluation_results
 
 
-async def score_evaluation_results(evaluation_results: Dict) -> Dict:
-    """Score the evaluation results using configured judge system."""
+def create_scorer(verdict_cache: Optional[JsonlCache] = None):
+    """Create the scorer selected by [Scoring] scoring_method."""
+    scoring_method = get_config_value("Scoring", "scoring_method", "dual")
+
+    if scoring_method == "dual":
+        return TwoJudgeScorer(verdict_cache=verdict_cache)
+    if scoring_method == "ensemble":
+        return EnsembleJudgeScorer(verdict_cache=verdict_cache)
+    return AccuracyScorer(verdict_cache=verdict_cache)
+
+
+def log_judge_statistics(scorer) -> None:
+    """Log judge statistics if the scorer tracks them."""
+    logger = setup_logging()
+
+    if hasattr(scorer, "get_verdict_cache_stats"):
+        cache_stats = scorer.get_verdict_cache_stats()
+        logger.info(
+            f"Judge verdict cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.1%} hit rate)"
+        )
+
+    pre_judge_stats = get_pre_judge().get_stats()
+    for model_name, stats in pre_judge_stats["models"].items():
+        logger.info(
+            f"Pre-judge for {model_name}: skipped judge on {stats['skipped']}/"
+            f"{stats['assessed']} responses ({stats['skip_rate']:.1%}; "
+            f"{stats['confident_fail']} fail, {stats['confident_pass']} pass)"
+        )
+
+    if not hasattr(scorer, "get_judge_statistics"):
+        return
+
+    judge_stats = scorer.get_judge_statistics()
+    logger.info("Judge performance statistics:")
+    logger.info(f"  Total attempts: {judge_stats['total_scoring_attempts']}")
+    if "dual_success_rate" in judge_stats:
+        logger.info(f"  Success rate: {judge_stats['dual_success_rate']:.2%}")
+    if judge_stats.get("judge_timeouts"):
+        logger.info(f"  Judge timeouts: {judge_stats['judge_timeouts']}")
+    if judge_stats.get("judge_parse_failures"):
+        logger.info(
+            f"  Unparseable judge replies: {judge_stats['judge_parse_failures']}"
+        )
+    if "average_judges_used" in judge_stats:
+        logger.info(
+            f"  Ensemble: {judge_stats['average_judges_used']:.2f} judges per item, "
+            f"consensus rate {judge_stats['consensus_rate']:.2%}"
+        )
+    cascade_stats = judge_stats.get("cascade", {})
+    if cascade_stats.get("enabled"):
+        logger.info(
+            f"  Cascade: judge 2 called for {cascade_stats['triggered']} items "
+            f"({cascade_stats['trigger_rate']:.1%} trigger rate)"
+        )
+
+
+async def score_evaluation_results(
+    evaluation_results: Dict, output_dir: Optional[Path] = None
+) -> Path:
+    """Score the evaluation results using configured judge system.
+
+    Batch scoring needs every result at once; the scored results are written
+    to ``output_dir``'s result stream (the run directory if None) and dropped.
+
+    Returns:
+        Path of the scored result stream
+    """
     logger = setup_logging()
     logger.info("Starting scoring with configured judge system")
 
+    verdict_cache = open_verdict_cache()
+
     with Timer("Result scoring"):
-        scoring_method = get_config_value("Scoring", "scoring_method", "dual")
+        scorer = create_scorer(verdict_cache)
+
+        try:
+            scored_results = await scorer.score_evaluation_results(
+                evaluation_results, get_scoring_methods()
+            )
+        finally:
+            if verdict_cache is not None:
+                verdict_cache.close()
+
+        # Print judge statistics if available
+        log_judge_statistics(scorer)
+
+    if output_dir is None:
+        output_dir = get_run_dir()
+    return write_result_stream(
+        scored_results,
+        output_dir / SCORED_STREAM_FILENAME,
+        ContextStore(output_dir / CONTEXTS_DIRNAME),
+    )
+
+
+async def run_pipelined_benchmark(
+    vector_db: "VectorDatabase",
+    num_models: int = 2,
+    num_questions: int = 3,
+    resume: bool = True,
+    model_ids: Optional[List[str]] = None,
+    output_dir: Optional[Path] = None,
+) -> Path:
+    """Evaluate and score concurrently, streaming each result into scoring.
 
-        if scoring_method == "dual":
-            scorer = TwoJudgeScorer()
-        else:
-            scorer = AccuracyScorer()
+    Result streams are written to ``output_dir`` (the run directory if None).
+    Scored results go straight to the stream and are not kept, so memory
+    depends on the pipeline's queue size and concurrency, not the run size.
 
-        scoring_methods = [ScoringMethod.CONTROL_REFERENCE, ScoringMethod.LLM_JUDGE]
-        scored_results = await scorer.score_evaluation_results(
-            evaluation_results, scoring_methods
+    Returns:
+        Path of the scored result stream
+    """
+    logger = setup_logging()
+    logger.info(
+        f"Starting pipelined evaluation + scoring: {num_models} models, {num_questions} questions"
+    )
+
+    journal = open_response_journal()
+    verdict_cache = open_verdict_cache()
+
+    # Scored results reach disk as they finish and are reported from there
+    if output_dir is None:
+        output_dir = get_run_dir()
+    result_writer = ResultStreamWriter(
+        output_dir / SCORED_STREAM_FILENAME,
+        ContextStore(output_dir / CONTEXTS_DIRNAME),
+    )
+
+    with Timer("Pipelined evaluation and scoring"):
+        evaluator, models, questions, modes = await prepare_evaluation(
+            vector_db, num_models, num_questions, journal, resume, model_ids
         )
+        scorer = create_scorer(verdict_cache)
+
+        try:
+            await stream_into_scoring(
+                lambda sink: evaluator.run_evaluation(
+                    models,
+                    questions,
+                    modes,
+                    output_dir=output_dir,
+                    result_sink=sink,
+                    collect_results=False,
+                ),
+                scorer,
+                get_scoring_methods(),
+                result_writer=result_writer,
+            )
+        finally:
+            result_writer.close()
+            if journal is not None:
+                journal.close()
+            if verdict_cache is not None:
+                verdict_cache.close()
+
+        log_judge_statistics(scorer)
+
+    return result_writer.path
 
-        # Print judge statistics if available
-        if hasattr(scorer, "get_judge_statistics"):
-            judge_stats = scorer.get_judge_statistics()
-            logger.info(f"Judge performance statistics:")
-            logger.info(f"  Total attempts: {judge_stats['total_scoring_attempts']}")
-            if "dual_success_rate" in judge_stats:
-                logger.info(f"  Success rate: {judge_stats['dual_success_rate']:.2%}")
 
-    return scored_results
+async def run_rescoring(
+    results_path: str, output_dir: Path, questions_file: Optional[str] = None
+) -> Path:
+    """Rescore saved results or a response journal without querying any eval model.
 
+    Rescored results are streamed to ``output_dir`` as they finish.
 
-def generate_summary_report(scored_results: Dict) -> Dict:
-    """Generate summary statistics and report."""
+    Returns:
+        Path of the scored result stream
+    """
+    logger = setup_logging()
+    logger.info(f"Rescoring saved results from {results_path}")
+
+    verdict_cache = open_verdict_cache()
+    result_writer = ResultStreamWriter(
+        output_dir / SCORED_STREAM_FILENAME,
+        ContextStore(output_dir / CONTEXTS_DIRNAME),
+        ContextStore.for_results(results_path),
+    )
+
+    with Timer("Result rescoring"):
+        scorer = create_scorer(verdict_cache)
+
+        try:
+            await rescore_saved_results(
+                results_path,
+                scorer,
+                get_scoring_methods(),
+                questions_file,
+                result_writer=result_writer,
+            )
+        finally:
+            result_writer.close()
+            if verdict_cache is not None:
+                verdict_cache.close()
+
+        log_judge_statistics(scorer)
+
+    return result_writer.path
+
+
+def generate_summary_report(aggregates: Dict[str, ModelAggregate]) -> Dict:
+    """Generate summary statistics and report from per-model aggregates."""
     logger = setup_logging()
     logger.info("Generating summary report")
 
     from src.utils import get_timestamp
 
     summary = {
-        "total_models": len(scored_results),
+        "total_models": len(aggregates),
         "models": {},
         "mode_performance": {},
         "overall_stats": {},
@@ -214,63 +516,165 @@ def generate_summary_report(scored_results: Dict) -> Dict:
                     "VectorDatabase", "db_path", "./vector_db"
                 ),
             },
+            "hedging": get_hedging_policy().get_stats(),
+            "pre_judge": get_pre_judge().get_stats(),
+            "circuit_breakers": get_circuit_breaker_stats(),
         },
     }
 
-    all_scores = []
-    mode_scores = {mode.value: [] for mode in EvaluationMode}
-
-    for model_name, results in scored_results.items():
-        model_scores = []
-        model_by_mode = {mode.value: [] for mode in EvaluationMode}
-
-        for result in results:
-            score = result.get("accuracy_score", 0.0)
-            model_scores.append(score)
-            all_scores.append(score)
+    modes = [mode.value for mode in EvaluationMode]
+    total_score = 0.0
+    total_evaluations = 0
+    mode_totals = {mode: 0.0 for mode in modes}
+    mode_counts = {mode: 0 for mode in modes}
 
-            mode = result.get("evaluation_mode", "unknown")
-            if mode in model_by_mode:
-                model_by_mode[mode].append(score)
-                mode_scores[mode].append(score)
+    for model_name, aggregate in aggregates.items():
+        total_score += aggregate.summary_total
+        total_evaluations += aggregate.total_evaluations
+        for mode in modes:
+            mode_totals[mode] += aggregate.summary_total_by_mode.get(mode, 0.0)
+            mode_counts[mode] += aggregate.evaluations_by_mode.get(mode, 0)
 
         summary["models"][model_name] = {
-            "total_evaluations": len(results),
-            "average_score": (
-                sum(model_scores) / len(model_scores) if model_scores else 0.0
-            ),
+            "total_evaluations": aggregate.total_evaluations,
+            "average_score": aggregate.summary_average,
             "score_by_mode": {
-                mode: sum(scores) / len(scores) if scores else 0.0
-                for mode, scores in model_by_mode.items()
+                mode: aggregate.summary_average_for_mode(mode) for mode in modes
             },
         }
 
     # Overall statistics
     summary["overall_stats"] = {
-        "average_score": sum(all_scores) / len(all_scores) if all_scores else 0.0,
-        "total_evaluations": len(all_scores),
+        "average_score": total_score / total_evaluations if total_evaluations else 0.0,
+        "total_evaluations": total_evaluations,
     }
 
     # Mode performance
     summary["mode_performance"] = {
-        mode: sum(scores) / len(scores) if scores else 0.0
-        for mode, scores in mode_scores.items()
+        mode: mode_totals[mode] / mode_counts[mode] if mode_counts[mode] else 0.0
+        for mode in modes
     }
 
+    for model_name, breaker_stats in summary["metadata"]["circuit_breakers"].items():
+        logger.warning(
+            f"Circuit for {model_name} opened {breaker_stats['times_opened']} time(s), "
+            f"{breaker_stats['rejected_calls']} calls failed fast"
+        )
+
+    hedging_stats = summary["metadata"]["hedging"]
+    if hedging_stats["enabled"]:
+        logger.info(
+            f"Hedged {hedging_stats['hedged_calls']}/{hedging_stats['total_calls']} calls "
+            f"({hedging_stats['hedge_rate']:.1%}), backup won {hedging_stats['hedge_wins']}"
+        )
+
     return summary
 
 
-def save_results(scored_results: Dict, summary: Dict) -> Path:
-    """Save all results to files."""
-    output_dir = Path(get_config_value("Paths", "output_dir", "./experiment_results"))
+def get_run_dir() -> Path:
+    """Run output directory ([Paths] output_dir)."""
+    return Path(get_config_value("Paths", "output_dir", "./experiment_results"))
+
+
+def get_append_dir() -> Path:
+    """Scratch directory for the output of models being appended to the run.
+
+    Appended models are evaluated and scored here so their result files do not
+    overwrite the run's own until ``append_to_run`` has merged them.
+    """
+    return get_run_dir() / APPEND_DIRNAME
+
+
+def append_to_run(new_stream: Path, run_dir: Path) -> Dict[str, ModelAggregate]:
+    """Merge newly scored models into an existing run's results and aggregates.
+
+    Only the new models are aggregated; the other models' aggregates are read
+    from the run directory. A model that is already in the run is replaced.
+    The run's result stream is rewritten record by record with the new
+    models' results appended.
+
+    Returns:
+        Aggregates of every model in the run
+    """
+    logger = setup_logging()
+
+    run_stream = run_dir / SCORED_STREAM_FILENAME
+    run_contexts = ContextStore(run_dir / CONTEXTS_DIRNAME)
+    results_path = run_dir / "detailed_results.json"
+    if not run_stream.exists() and results_path.exists():
+        # Runs saved before result streams existed are converted once
+        write_result_stream(load_json(results_path), run_stream, run_contexts)
+
+    aggregates = load_aggregates(run_dir)
+    if aggregates is None:
+        # Runs saved before aggregates existed are aggregated once
+        aggregates = aggregate_stream(run_stream) if run_stream.exists() else {}
+
+    new_aggregates = aggregate_stream(new_stream)
+    replaced = [model for model in new_aggregates if model in aggregates]
+    if replaced:
+        logger.warning(f"Replacing existing results for {replaced}")
+
+    def merged_records():
+        if run_stream.exists():
+            for record in iter_result_stream(run_stream):
+                if record.get("model_name") not in new_aggregates:
+                    yield record
+        yield from iter_result_stream(new_stream)
+
+    write_result_records(
+        merged_records(),
+        run_stream,
+        run_contexts,
+        ContextStore.for_results(new_stream),
+    )
+    aggregates = merge_aggregates(aggregates, new_aggregates)
+
+    logger.info(
+        f"Appended {len(new_aggregates)} model(s) to {run_dir} "
+        f"({len(aggregates)} models in run)"
+    )
+    return aggregates
+
+
+def save_results(
+    stream_path: Path,
+    summary: Dict,
+    output_dir: Optional[Path] = None,
+    aggregates: Optional[Dict[str, ModelAggregate]] = None,
+) -> Path:
+    """Save all results to files ([Paths] output_dir if no directory is given).
+
+    The scored result stream (contexts kept in its content-addressed context
+    store, results keeping only their ``context_hash``) is copied to the
+    output directory's scored_results.jsonl unless it is already there, and
+    compacted into detailed_results.json one record at a time.
+    """
+    if output_dir is None:
+        output_dir = get_run_dir()
+    output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Save detailed results
     from src.utils import save_json
 
-    save_json(scored_results, output_dir / "detailed_results.json")
+    stream_path = Path(stream_path)
+    run_stream = output_dir / SCORED_STREAM_FILENAME
+    if stream_path.resolve() != run_stream.resolve():
+        write_result_records(
+            iter_result_stream(stream_path),
+            run_stream,
+            ContextStore(output_dir / CONTEXTS_DIRNAME),
+            ContextStore.for_results(stream_path),
+        )
+    compact_result_stream(run_stream, output_dir / "detailed_results.json")
     save_json(summary, output_dir / "summary.json")
 
+    # Per-model aggregates let later runs append models without re-reading these
+    if aggregates is None:
+        aggregates = aggregate_stream(run_stream)
+    save_aggregates(aggregates, output_dir)
+
     logger = setup_logging()
     logger.info(f"Results saved to {output_dir}/")
 
@@ -300,6 +704,62 @@ def print_summary_report(summary: Dict) -> None:
                 print(f"    {mode.replace('_', ' ').title()}: {score:.3f}")
 
 
+def report_results(
+    stream_path: Path,
+    output_dir: Optional[Path] = None,
+    aggregates: Optional[Dict[str, ModelAggregate]] = None,
+) -> Path:
+    """Summarize, save and report a scored result stream.
+
+    Every statistic comes from per-model aggregates, read from the stream one
+    record at a time if not given, so the results are never loaded whole.
+    """
+    logger = setup_logging()
+
+    if aggregates is None:
+        aggregates = aggregate_stream(stream_path)
+
+    summary = generate_summary_report(aggregates)
+    output_dir = save_results(stream_path, summary, output_dir, aggregates)
+    print_summary_report(summary)
+
+    # Generate comprehensive reports using BenchmarkReporter
+    logger.info("Generating comprehensive reports...")
+    reporter = create_benchmark_reporter(output_dir=str(output_dir))
+    report_paths = reporter.generate_all_reports({}, summary, aggregates=aggregates)
+
+    print(f"\nReports generated:")
+    for report_type, path in report_paths.items():
+        print(f"  {report_type}: {path}")
+
+    return output_dir
+
+
+async def run_score_command(args: argparse.Namespace) -> None:
+    """Rescore saved results and write them to a separate output directory."""
+    logger = setup_logging()
+
+    if not Path(args.results).exists():
+        logger.error(f"Results file not found: {args.results}")
+        sys.exit(1)
+
+    output_dir = args.output_dir
+    if output_dir is None:
+        output_dir = get_run_dir() / "rescored"
+    output_dir = Path(output_dir)
+
+    # The rescored stream would truncate its own input
+    if (output_dir / SCORED_STREAM_FILENAME).resolve() == Path(args.results).resolve():
+        logger.error(f"Rescored results would overwrite {args.results}")
+        sys.exit(1)
+
+    with Timer("Rescoring pipeline"):
+        print("=== Cyber Policy Benchmark - Rescoring ===")
+        stream_path = await run_rescoring(args.results, output_dir, args.questions_file)
+        report_results(stream_path, output_dir)
+        print("\n=== RESCORING COMPLETE ===")
+
+
 async def main() -> None:
     """Main execution pipeline: Setup → Evaluate → Score → Report."""
     parser = argparse.ArgumentParser(
@@ -327,11 +787,56 @@ async def main() -> None:
         action="store_true",
         help="Skip configuration and setup validation",
     )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Stream evaluation results into scoring instead of running the stages back to back",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Re-query every cell instead of reusing the response journal",
+    )
+    parser.add_argument(
+        "--append",
+        action="append",
+        metavar="MODEL",
+        help="Evaluate and score only MODEL (repeatable) and add it to the existing "
+        "run in [Paths] output_dir, keeping the other models' results",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    score_parser = subparsers.add_parser(
+        "score",
+        help="Rescore saved results without re-running evaluation",
+        description="Rescore a detailed_results.json file or a response journal "
+        "(.jsonl) with the current scoring configuration. Judge verdicts are "
+        "reused from the verdict cache; no eval model or vector database is used.",
+    )
+    score_parser.add_argument(
+        "results",
+        help="Path to detailed_results.json, scored_results.jsonl or response_journal.jsonl",
+    )
+    score_parser.add_argument(
+        "--questions-file",
+        default=None,
+        help="Prompts file used to recover ideal answers for journals "
+        "(default: [Paths] prompts_file)",
+    )
+    score_parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Directory for rescored results (default: <output_dir>/rescored)",
+    )
 
     args = parser.parse_args()
     logger = setup_logging()
 
     try:
+        if args.command == "score":
+            await run_score_command(args)
+            return
+
         with Timer("Complete benchmark pipeline"):
             print("=== Cyber Policy Benchmark - Complete Pipeline ===")
 
@@ -345,9 +850,12 @@ async def main() -> None:
             # Set up vector database
             if args.setup_db:
                 vector_db = setup_vector_database()
+                setup_control_catalog()
             elif Path(
                 get_config_value("VectorDatabase", "db_path", "./vector_db")
             ).exists():
+                from src.db import VectorDatabase
+
                 logger.info("Using existing vector database...")
                 vector_db = VectorDatabase()
                 stats = vector_db.get_collection_stats()
@@ -356,27 +864,48 @@ async def main() -> None:
                 logger.error("No vector database found. Use --setup-db to create one.")
                 sys.exit(1)
 
-            # STEP 2: EVALUATE
-            evaluation_results = await run_evaluation(
-                vector_db, args.models, args.questions
-            )
+            # Semantic similarity scoring reuses the already loaded embedding model
+            get_semantic_similarity_scorer(vector_db.embedding_model)
+
+            # Appended models are written to a scratch directory, so the run's
+            # existing result files survive until they are merged
+            work_dir = get_append_dir() if args.append else get_run_dir()
+
+            if args.pipelined:
+                # STEPS 2+3: EVALUATE AND SCORE CONCURRENTLY
+                stream_path = await run_pipelined_benchmark(
+                    vector_db,
+                    args.models,
+                    args.questions,
+                    resume=not args.no_resume,
+                    model_ids=args.append,
+                    output_dir=work_dir,
+                )
+            else:
+                # STEP 2: EVALUATE
+                evaluation_results = await run_evaluation(
+                    vector_db,
+                    args.models,
+                    args.questions,
+                    resume=not args.no_resume,
+                    model_ids=args.append,
+                    output_dir=work_dir,
+                )
 
-            # STEP 3: SCORE
-            scored_results = await score_evaluation_results(evaluation_results)
+                # STEP 3: SCORE
+                stream_path = await score_evaluation_results(
+                    evaluation_results, work_dir
+                )
+                del evaluation_results
 
             # STEP 4: REPORT
-            summary = generate_summary_report(scored_results)
-            output_dir = save_results(scored_results, summary)
-            print_summary_report(summary)
-
-            # Generate comprehensive reports using BenchmarkReporter
-            logger.info("Generating comprehensive reports...")
-            reporter = create_benchmark_reporter(output_dir=str(output_dir))
-            report_paths = reporter.generate_all_reports(scored_results, summary)
-
-            print(f"\nReports generated:")
-            for report_type, path in report_paths.items():
-                print(f"  {report_type}: {path}")
+            if args.append:
+                aggregates = append_to_run(stream_path, get_run_dir())
+                report_results(
+                    get_run_dir() / SCORED_STREAM_FILENAME, aggregates=aggregates
+                )
+            else:
+                report_results(stream_path)
 
             print(f"\n=== BENCHMARK COMPLETE ===")
 
@@ -0,0 +1,411 @@
+"""
+Mergeable per-model aggregates for Cyber-Policy-Bench.
+
+Summaries and reports only need counts, sums and extremes of the scores, so each
+model's results are reduced once to a ``ModelAggregate``. Aggregates of
+different models (or of separate batches of the same model) merge exactly, which
+lets a run directory gain a new model without re-reading or re-scoring the
+others.
+"""
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+try:
+    from .result_writer import iter_result_stream
+    from .results_table import ResultsTable
+    from .utils import load_json, save_json
+except ImportError:
+    from src.result_writer import iter_result_stream
+    from src.results_table import ResultsTable
+    from src.utils import load_json, save_json
+
+# File in a run directory holding the per-model aggregates
+AGGREGATES_FILENAME = "model_aggregates.json"
+AGGREGATES_VERSION = 1
+
+
+@dataclass
+class ScoreStats:
+    """Count, sum, sum of squares and range of a set of scores."""
+
+    count: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    def add(self, score: float) -> None:
+        """Add one score."""
+        self.count += 1
+        self.total += score
+        self.total_sq += score * score
+        self.min = score if self.min is None else min(self.min, score)
+        self.max = score if self.max is None else max(self.max, score)
+
+    def merge(self, other: "ScoreStats") -> None:
+        """Fold another set of scores into this one."""
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Average score (0.0 if there are no scores)."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation (0.0 for fewer than two scores)."""
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_sq - self.total * self.total / self.count) / (
+            self.count - 1
+        )
+        return math.sqrt(max(0.0, variance))
+
+    def describe(self) -> Dict[str, float]:
+        """Average, standard deviation, range and count as a report dict."""
+        return {
+            "average": self.mean,
+            "std_dev": self.stdev,
+            "min": self.min if self.min is not None else 0.0,
+            "max": self.max if self.max is not None else 0.0,
+            "count": self.count,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "total_sq": self.total_sq,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScoreStats":
+        """Create from dictionary."""
+        return cls(
+            count=data.get("count", 0),
+            total=data.get("total", 0.0),
+            total_sq=data.get("total_sq", 0.0),
+            min=data.get("min"),
+            max=data.get("max"),
+        )
+
+
+@dataclass
+class ModelAggregate:
+    """Everything the summary and reports need about one model's results."""
+
+    model_name: str
+    total_evaluations: int = 0
+    # Results without a score count towards the summary average as 0.0
+    summary_total: float = 0.0
+    scores: ScoreStats = field(default_factory=ScoreStats)
+    scores_by_mode: Dict[str, ScoreStats] = field(default_factory=dict)
+    evaluations_by_mode: Dict[str, int] = field(default_factory=dict)
+    summary_total_by_mode: Dict[str, float] = field(default_factory=dict)
+    scoring_failures: int = 0
+    high_quality_responses: int = 0  # Scores > 0.8
+    medium_quality_responses: int = 0  # Scores 0.4-0.8
+    low_quality_responses: int = 0  # Scores < 0.4
+    timeout_count: int = 0
+    error_count: int = 0
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        """Add one scored result."""
+        self.total_evaluations += 1
+        mode = result.get("evaluation_mode", "unknown")
+        self.evaluations_by_mode[mode] = self.evaluations_by_mode.get(mode, 0) + 1
+
+        score = result.get("accuracy_score")
+        if score is not None:
+            self.summary_total += score
+            self.summary_total_by_mode[mode] = (
+                self.summary_total_by_mode.get(mode, 0.0) + score
+            )
+            self.scores.add(score)
+            self.scores_by_mode.setdefault(mode, ScoreStats()).add(score)
+
+            if score > 0.8:
+                self.high_quality_responses += 1
+            elif score >= 0.4:
+                self.medium_quality_responses += 1
+            else:
+                self.low_quality_responses += 1
+
+        if (result.get("scores") or {}).get("error"):
+            self.scoring_failures += 1
+
+        # Deadline overruns are counted separately from other errors
+        error_type = result.get("error_type")
+        if error_type == "timeout":
+            self.timeout_count += 1
+        elif error_type or (result.get("model_response") or "").startswith("Error:"):
+            self.error_count += 1
+
+    def merge(self, other: "ModelAggregate") -> None:
+        """Fold another batch of the same model's results into this aggregate."""
+        self.total_evaluations += other.total_evaluations
+        self.summary_total += other.summary_total
+        self.scores.merge(other.scores)
+        for mode, stats in other.scores_by_mode.items():
+            self.scores_by_mode.setdefault(mode, ScoreStats()).merge(stats)
+        for mode, count in other.evaluations_by_mode.items():
+            self.evaluations_by_mode[mode] = (
+                self.evaluations_by_mode.get(mode, 0) + count
+            )
+        for mode, total in other.summary_total_by_mode.items():
+            self.summary_total_by_mode[mode] = (
+                self.summary_total_by_mode.get(mode, 0.0) + total
+            )
+        self.scoring_failures += other.scoring_failures
+        self.high_quality_responses += other.high_quality_responses
+        self.medium_quality_responses += other.medium_quality_responses
+        self.low_quality_responses += other.low_quality_responses
+        self.timeout_count += other.timeout_count
+        self.error_count += other.error_count
+
+    @property
+    def summary_average(self) -> float:
+        """Average over all results, unscored ones counting as 0.0."""
+        return self.summary_total / max(1, self.total_evaluations)
+
+    def summary_average_for_mode(self, mode: str) -> float:
+        """Average over all results in ``mode``, unscored ones counting as 0.0."""
+        count = self.evaluations_by_mode.get(mode, 0)
+        return self.summary_total_by_mode.get(mode, 0.0) / count if count else 0.0
+
+    @classmethod
+    def from_results(
+        cls, model_name: str, results: Iterable[Dict[str, Any]]
+    ) -> "ModelAggregate":
+        """Aggregate one model's scored results."""
+        aggregate = cls(model_name=model_name)
+        for result in results:
+            aggregate.add_result(result)
+        return aggregate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "model_name": self.model_name,
+            "total_evaluations": self.total_evaluations,
+            "summary_total": self.summary_total,
+            "scores": self.scores.to_dict(),
+            "scores_by_mode": {
+                mode: stats.to_dict() for mode, stats in self.scores_by_mode.items()
+            },
+            "evaluations_by_mode": self.evaluations_by_mode,
+            "summary_total_by_mode": self.summary_total_by_mode,
+            "scoring_failures": self.scoring_failures,
+            "high_quality_responses": self.high_quality_responses,
+            "medium_quality_responses": self.medium_quality_responses,
+            "low_quality_responses": self.low_quality_responses,
+            "timeout_count": self.timeout_count,
+            "error_count": self.error_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelAggregate":
+        """Create from dictionary."""
+        return cls(
+            model_name=data["model_name"],
+            total_evaluations=data.get("total_evaluations", 0),
+            summary_total=data.get("summary_total", 0.0),
+            scores=ScoreStats.from_dict(data.get("scores", {})),
+            scores_by_mode={
+                mode: ScoreStats.from_dict(stats)
+                for mode, stats in data.get("scores_by_mode", {}).items()
+            },
+            evaluations_by_mode=dict(data.get("evaluations_by_mode", {})),
+            summary_total_by_mode=dict(data.get("summary_total_by_mode", {})),
+            scoring_failures=data.get("scoring_failures", 0),
+            high_quality_responses=data.get("high_quality_responses", 0),
+            medium_quality_responses=data.get("medium_quality_responses", 0),
+            low_quality_responses=data.get("low_quality_responses", 0),
+            timeout_count=data.get("timeout_count", 0),
+            error_count=data.get("error_count", 0),
+        )
+
+
+def aggregate_results(
+    scored_results: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, ModelAggregate]:
+    """
+    Reduce scored results to one aggregate per model.
+
+    Args:
+        scored_results: Scored results grouped by model
+
+    Returns:
+        Aggregates keyed by model name, in the order of ``scored_results``
+    """
+    return aggregate_table(ResultsTable.from_results(scored_results))
+
+
+def aggregate_stream(path: Union[str, Path]) -> Dict[str, ModelAggregate]:
+    """
+    Reduce a scored result stream to one aggregate per model.
+
+    The stream is read one record at a time, so only the table's columns are
+    held in memory, never the results themselves.
+
+    Args:
+        path: JSONL result stream (e.g. ``scored_results.jsonl``)
+
+    Returns:
+        Aggregates keyed by model name, in order of first appearance
+    """
+    return aggregate_table(ResultsTable.from_records(iter_result_stream(path)))
+
+
+def _stats_at(stats: Dict[str, Any], code: int) -> ScoreStats:
+    """ScoreStats for one group of a ``ResultsTable.group_stats`` result."""
+    count = int(stats["count"][code])
+    if not count:
+        return ScoreStats()
+    return ScoreStats(
+        count=count,
+        total=float(stats["total"][code]),
+        total_sq=float(stats["total_sq"][code]),
+        min=float(stats["min"][code]),
+        max=float(stats["max"][code]),
+    )
+
+
+def aggregate_table(table: ResultsTable) -> Dict[str, ModelAggregate]:
+    """
+    Reduce a results table to one aggregate per model with vectorized group-bys.
+
+    Args:
+        table: Columnar scored results
+
+    Returns:
+        Aggregates keyed by model name, in table order
+    """
+    n_models, n_modes = len(table.models), len(table.modes)
+    model_mode = table.model.astype(np.int64) * n_modes + table.mode
+
+    scores = table.group_stats(table.model, n_models)
+    mode_scores = table.group_stats(model_mode, n_models * n_modes)
+    evaluations = table.group_count(table.model, n_models)
+    mode_evaluations = table.group_count(model_mode, n_models * n_modes)
+    failures = table.group_count(table.model, n_models, table.scoring_failure)
+    timeouts = table.group_count(table.model, n_models, table.is_timeout)
+    errors = table.group_count(table.model, n_models, table.is_error)
+
+    # NaN (unscored) compares False, so unscored rows fall in no quality band
+    with np.errstate(invalid="ignore"):
+        high = table.group_count(table.model, n_models, table.score > 0.8)
+        medium = table.group_count(
+            table.model, n_models, (table.score >= 0.4) & (table.score <= 0.8)
+        )
+        low = table.group_count(table.model, n_models, table.score < 0.4)
+
+    aggregates = {}
+    for model_code, model_name in enumerate(table.models):
+        aggregate = ModelAggregate(
+            model_name=model_name,
+            total_evaluations=int(evaluations[model_code]),
+            summary_total=float(scores["total"][model_code]),
+            scores=_stats_at(scores, model_code),
+            scoring_failures=int(failures[model_code]),
+            high_quality_responses=int(high[model_code]),
+            medium_quality_responses=int(medium[model_code]),
+            low_quality_responses=int(low[model_code]),
+            timeout_count=int(timeouts[model_code]),
+            error_count=int(errors[model_code]),
+        )
+        for mode_code, mode in enumerate(table.modes):
+            code = model_code * n_modes + mode_code
+            if mode_evaluations[code]:
+                aggregate.evaluations_by_mode[mode] = int(mode_evaluations[code])
+            if mode_scores["count"][code]:
+                aggregate.scores_by_mode[mode] = _stats_at(mode_scores, code)
+                aggregate.summary_total_by_mode[mode] = float(
+                    mode_scores["total"][code]
+                )
+        aggregates[model_name] = aggregate
+    return aggregates
+
+
+def merge_aggregates(
+    aggregates: Dict[str, ModelAggregate], new_aggregates: Dict[str, ModelAggregate]
+) -> Dict[str, ModelAggregate]:
+    """
+    Add new per-model aggregates to existing ones.
+
+    Models already present are replaced, so re-appending a model does not
+    double count it.
+
+    Args:
+        aggregates: Existing aggregates (left unchanged)
+        new_aggregates: Aggregates of the newly scored models
+
+    Returns:
+        Combined aggregates, existing models first
+    """
+    merged = dict(aggregates)
+    merged.update(new_aggregates)
+    return merged
+
+
+def save_aggregates(
+    aggregates: Dict[str, ModelAggregate], run_dir: Union[str, Path]
+) -> Path:
+    """
+    Save per-model aggregates to ``run_dir``.
+
+    Args:
+        aggregates: Aggregates keyed by model name
+        run_dir: Run output directory
+
+    Returns:
+        Path of the written aggregates file
+    """
+    path = Path(run_dir) / AGGREGATES_FILENAME
+    save_json(
+        {
+            "version": AGGREGATES_VERSION,
+            "models": [aggregate.to_dict() for aggregate in aggregates.values()],
+        },
+        path,
+    )
+    return path
+
+
+def load_aggregates(run_dir: Union[str, Path]) -> Optional[Dict[str, ModelAggregate]]:
+    """
+    Load per-model aggregates from ``run_dir``.
+
+    Args:
+        run_dir: Run output directory
+
+    Returns:
+        Aggregates keyed by model name, or None if the run has none saved or
+        they were written by an incompatible version
+    """
+    path = Path(run_dir) / AGGREGATES_FILENAME
+    if not path.exists():
+        return None
+
+    data = load_json(path)
+    if data.get("version") != AGGREGATES_VERSION:
+        return None
+
+    return {
+        entry["model_name"]: ModelAggregate.from_dict(entry)
+        for entry in data.get("models", [])
+    }
@@ -0,0 +1,132 @@
+"""
+Persistent caches for Cyber-Policy-Bench.
+
+This module provides an append-only JSONL store used to journal expensive API
+results as they complete, so interrupted runs can resume without re-issuing
+calls that already succeeded.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable content hash from arbitrary JSON-serializable parts.
+
+    Args:
+        *parts: Values that identify the cached item (model, prompt, params, ...)
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JsonlCache:
+    """Append-only JSONL key/value store with last-write-wins semantics.
+
+    Every ``put`` opens the file, appends one line and closes it again, so a
+    crash or Ctrl-C loses at most the line being written. A truncated trailing
+    line is ignored when the file is reloaded and the next ``put`` starts on a
+    fresh line after it.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (and load) the cache file at ``path``."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        # Set when the file ends in a partial line the next put must not extend
+        self._partial_line = False
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load existing entries, skipping corrupt or partial lines."""
+        if not self.path.exists():
+            return
+
+        skipped = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                self._partial_line = not line.endswith("\n")
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self._entries[entry["key"]] = entry["record"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    skipped += 1
+
+        if skipped:
+            self.logger.warning(
+                f"Skipped {skipped} unreadable lines while loading {self.path}"
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the record stored under ``key`` and update hit statistics."""
+        record = self._entries.get(key)
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        """Append ``record`` under ``key`` and flush it to disk."""
+        self._entries[key] = record
+        line = (
+            json.dumps({"key": key, "record": record}, ensure_ascii=False, default=str)
+            + "\n"
+        )
+        if self._partial_line:
+            line = "\n" + line
+            self._partial_line = False
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+        self.writes += 1
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over the current (deduplicated) entries."""
+        return iter(self._entries.items())
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the current (deduplicated) records."""
+        return iter(self._entries.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Nothing stays open between puts; kept for the context manager protocol."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
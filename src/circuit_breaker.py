@@ -0,0 +1,181 @@
+"""
+Per-model circuit breakers for Cyber-Policy-Bench.
+
+When a provider model is down, every cell for it would otherwise burn through
+its retries with exponential backoff while holding a concurrency slot. A
+breaker opens after a run of consecutive failures so further calls fail fast,
+and after a cooldown lets a single half-open probe through to test recovery.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+try:
+    from .utils import get_config_value, is_retryable_error
+except ImportError:
+    from src.utils import get_config_value, is_retryable_error
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the model's circuit is open."""
+
+    # Checked by retry_with_backoff: retrying an open circuit only burns time
+    retryable = False
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(
+            f"Circuit open for {name} after repeated failures "
+            f"(next probe in {max(retry_in, 0.0):.0f}s)"
+        )
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, cooldown_seconds: float = 60.0
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            name: Model (or judge) identifier, used in error messages
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: Time the circuit stays open before a probe
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.times_opened = 0
+        self.rejected_calls = 0
+
+    def _cooldown_remaining(self) -> float:
+        return self.opened_at + self.cooldown_seconds - time.monotonic()
+
+    def is_open(self) -> bool:
+        """Whether calls would currently be rejected (no side effects)."""
+        if self.state == self.OPEN:
+            return self._cooldown_remaining() > 0
+        return self.state == self.HALF_OPEN and self._probe_in_flight
+
+    def allow_request(self) -> bool:
+        """Decide whether a call may proceed, moving to half-open after cooldown."""
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN and self._cooldown_remaining() <= 0:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed probe."""
+        self.consecutive_failures += 1
+        if (
+            self.state == self.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    async def call(self, make_call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``make_call()`` through the breaker.
+
+        Only retryable errors (see ``classify_error``) count as failures;
+        fatal errors leave the breaker's state unchanged.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and no probe is due
+        """
+        if not self.allow_request():
+            self.rejected_calls += 1
+            raise CircuitOpenError(self.name, self._cooldown_remaining())
+
+        try:
+            result = await make_call()
+        except asyncio.CancelledError:
+            # A cancelled probe says nothing about the model's health
+            self._probe_in_flight = False
+            raise
+        except Exception as e:
+            if is_retryable_error(e):
+                self.record_failure()
+            else:
+                # Fatal errors (bad request, oversized prompt) are about the
+                # request, not the model's health
+                self._probe_in_flight = False
+            raise
+
+        self.record_success()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected_calls,
+        }
+
+
+# Global breaker registry, one breaker per model identifier
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get (or create) the circuit breaker for a model."""
+    breaker = _circuit_breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            name,
+            failure_threshold=get_config_value(
+                "Evaluation", "circuit_breaker_threshold", 5, int
+            ),
+            cooldown_seconds=get_config_value(
+                "Evaluation", "circuit_breaker_cooldown", 60.0, float
+            ),
+        )
+        _circuit_breakers[name] = breaker
+    return breaker
+
+
+def get_circuit_breaker_stats(name: Optional[str] = None) -> Dict[str, Any]:
+    """Get stats for one breaker, or for every breaker that has opened."""
+    if name is not None:
+        return get_circuit_breaker(name).get_stats()
+    return {
+        model: breaker.get_stats()
+        for model, breaker in _circuit_breakers.items()
+        if breaker.times_opened
+    }
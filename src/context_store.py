@@ -0,0 +1,210 @@
+"""
+Content-addressed context store for Cyber-Policy-Bench.
+
+Every evaluation result carries the context it was given, and in raw-files
+mode that is the same large block of framework text for each model. Saved
+results therefore keep only a ``context_hash``; the text itself is written
+once, gzip-compressed, to a ``contexts`` directory next to the results file
+and read back only when a result's context is actually needed.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+# Sidecar directory, next to detailed_results.json, holding the contexts
+CONTEXTS_DIRNAME = "contexts"
+
+# Decompressed contexts kept in memory by each store
+DEFAULT_CACHED_CONTEXTS = 16
+
+
+def context_hash(text: str) -> str:
+    """
+    Content address of a context.
+
+    Args:
+        text: Context text
+
+    Returns:
+        Hex-encoded SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ContextStore:
+    """Directory of gzip-compressed contexts keyed by their SHA-256 hash.
+
+    Contexts are immutable, so each one is written at most once (atomically,
+    via a temporary file). Only the keys of stored contexts are remembered;
+    the most recently read contexts are kept decompressed in a bounded cache.
+    """
+
+    def __init__(
+        self, root: Union[str, Path], max_cached: int = DEFAULT_CACHED_CONTEXTS
+    ):
+        """
+        Use (and lazily create) the store directory ``root``.
+
+        Args:
+            root: Store directory
+            max_cached: Number of decompressed contexts kept for ``get``
+        """
+        self.root = Path(root)
+        self.logger = logging.getLogger(__name__)
+        self.max_cached = max_cached
+        self._texts: OrderedDict[str, str] = OrderedDict()
+        # Keys known to be on disk, so repeated puts skip the existence check
+        self._stored: Set[str] = set()
+        # Referenced contexts found in neither this store nor a source store
+        self.missing: Set[str] = set()
+
+    @classmethod
+    def for_results(cls, results_path: Union[str, Path]) -> "ContextStore":
+        """Store belonging to a saved results file (its sidecar directory)."""
+        return cls(Path(results_path).parent / CONTEXTS_DIRNAME)
+
+    def _path(self, key: str) -> Path:
+        """File holding the context ``key`` (fanned out by hash prefix)."""
+        return self.root / key[:2] / f"{key}.gz"
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._stored:
+            return True
+        if self._path(key).exists():
+            self._stored.add(key)
+            return True
+        return False
+
+    def put(self, text: str) -> str:
+        """
+        Store a context unless it is already present.
+
+        Args:
+            text: Context text
+
+        Returns:
+            Hash under which the context is stored
+        """
+        key = context_hash(text)
+        if key not in self:
+            self._write(key, gzip.compress(text.encode("utf-8"), mtime=0))
+        return key
+
+    def _write(self, key: str, data: bytes) -> None:
+        """Atomically write compressed context bytes for ``key``."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._stored.add(key)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Load a context by hash.
+
+        Args:
+            key: Context hash
+
+        Returns:
+            Context text, or None if the store does not have it
+        """
+        text = self._texts.get(key)
+        if text is not None:
+            self._texts.move_to_end(key)
+            return text
+
+        try:
+            with gzip.open(self._path(key), "rt", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+
+        self._stored.add(key)
+        if self.max_cached > 0:
+            self._texts[key] = text
+            if len(self._texts) > self.max_cached:
+                self._texts.popitem(last=False)
+        return text
+
+    def copy_from(self, other: "ContextStore", key: str) -> bool:
+        """
+        Copy a context from another store without recompressing it.
+
+        Args:
+            other: Store that has the context
+            key: Context hash
+
+        Returns:
+            True if the context is now in this store
+        """
+        if key in self:
+            return True
+        try:
+            data = other._path(key).read_bytes()
+        except FileNotFoundError:
+            return False
+        self._write(key, data)
+        return True
+
+    def resolve(self, result: Dict[str, Any]) -> Optional[str]:
+        """
+        Context of a result, loading it from the store if only its hash is kept.
+
+        Args:
+            result: Result dict with ``context_provided`` or ``context_hash``
+
+        Returns:
+            Context text, or None if the result had no context (or it is missing)
+        """
+        if result.get("context_provided") is not None:
+            return result["context_provided"]
+        key = result.get("context_hash")
+        return self.get(key) if key else None
+
+
+def externalize_context(
+    result: Dict[str, Any],
+    store: ContextStore,
+    source: Optional[ContextStore] = None,
+) -> Dict[str, Any]:
+    """
+    Replace a result's context text with its hash, storing the text once.
+
+    Args:
+        result: Result dict (left unchanged)
+        store: Store the context is written to
+        source: Store a result already holding only a ``context_hash`` was
+            loaded with; its context is copied into ``store``
+
+    Returns:
+        Copy of ``result`` with ``context_hash`` in place of ``context_provided``
+    """
+    if "context_provided" not in result:
+        key = result.get("context_hash")
+        if (
+            key
+            and key not in store.missing
+            and key not in store
+            and not (source and store.copy_from(source, key))
+        ):
+            store.missing.add(key)
+            store.logger.warning(f"Context {key} is not in {store.root}")
+        return dict(result)
+
+    # Rebuilt rather than popped so the hash keeps the context's field position
+    externalized = {}
+    for field, value in result.items():
+        if field == "context_provided":
+            externalized["context_hash"] = (
+                store.put(value) if value is not None else None
+            )
+        else:
+            externalized[field] = value
+    return externalized
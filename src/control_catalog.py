@@ -0,0 +1,339 @@
+"""
+Control catalog for Cyber-Policy-Bench citation verification.
+
+Every control and requirement identifier in the framework corpus
+(``data/cyber-frameworks/*``) is extracted with the same extractor the scorers
+use for model responses and kept as one set per framework. The catalog is
+persisted as a compact JSON index together with a fingerprint of the source
+documents, so it is rebuilt automatically when a framework file changes and
+citation checks are set lookups rather than hand-maintained pattern tables.
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import toml
+
+try:
+    from .utils import get_config_value
+except ImportError:
+    from src.utils import get_config_value
+
+# Bump when extraction or canonicalization changes so stale indexes are rebuilt
+CATALOG_VERSION = 1
+
+# Control reference formats recognised by extract_control_references
+CONTROL_REFERENCE_PATTERNS = [
+    # SOC 2 Trust Services Criteria
+    r"\b[A-Z]{1,2}\d+\.\d+\b",  # CC6.1, A1.3, P8.1
+    r"\b[A-Z]{2,4}\d+\.\d+\b",  # Extended version for longer prefixes
+    # CMMC Controls
+    r"\b[A-Z]{2,4}\.L\d+-[a-z]\.\d+\.[a-z]+\b",  # AC.L1-b.1.i
+    r"\b[A-Z]{2,4}\.L\d+-[a-z]\.\d+\.[ivx]+\b",  # Alternative roman numerals
+    # NIST Standards
+    r"\bNIST\.SP\.\d+-\d+r?\d*\b",  # NIST.SP.800-53r5, NIST.SP.800-171r3
+    r"\bNIST\s+\d+-\d+\b",  # NIST 800-53
+    r"\b[A-Z]{2,4}-\d+\b",  # SI-1, AC-2, AU-12
+    r"\b[A-Z]{2,4}-\d+\(\d+\)\b",  # AC-2(1), SI-4(5)
+    # GDPR References
+    r"\bArticle\s+\d+\b",  # Article 32, Article 25
+    r"\bArt\.\s*\d+\b",  # Art. 32, Art. 25
+    r"\bGDPR\s+Article\s+\d+\b",  # GDPR Article 32
+    r"\bGDPR\s+Art\.\s*\d+\b",  # GDPR Art. 32
+    # HIPAA References
+    r"\b\d+\.\d+\([a-z]\)\(\d+\)\([a-z]+\)\b",  # 164.312(a)(2)(iv)
+    r"\b\d+\.\d+\([a-z]\)\b",  # 164.312(a)
+    # ISO 27001 References
+    r"\bA\.\d+\.\d+\.\d+\b",  # A.8.1.1, A.12.6.1
+    r"\bA-\d+\.\d+\.\d+\b",  # Alternative format
+    r"\bISO\s+27001\s+A\.\d+\.\d+\.\d+\b",  # ISO 27001 A.8.1.1
+    # PCI DSS References
+    r"\b\d+\.\d+\.\d+\b",  # 1.2.1, 3.4.1
+    r"\bPCI\s+DSS\s+\d+\.\d+\.\d+\b",  # PCI DSS 1.2.1
+    # NIST CSF References
+    r"\b[A-Z]{2}\.[A-Z]{2}-\d+\b",  # ID.AM-1, PR.AC-3
+    r"\bNIST\s+CSF\s+[A-Z]{2}\.[A-Z]{2}-\d+\b",  # NIST CSF ID.AM-1
+    # FISMA/FedRAMP References
+    r"\b[A-Z]{2,4}-\d+\s+\([A-Z]+\)\b",  # AC-2 (HIGH), SI-4 (MODERATE)
+    # Generic framework references
+    r"\b[A-Z]{2,6}-\d+\([A-Z]+\)\b",  # Generic with impact level
+]
+
+# Single-pass scanner over all formats. The leading lookahead finds positions
+# where any format matches; one optional lookahead group per format then
+# captures that format's match at the position, so overlapping matches of
+# different formats (e.g. "AC-2" and "AC-2(1)") are all reported.
+_CONTROL_REFERENCE_SCANNER = re.compile(
+    "(?="
+    + "|".join(CONTROL_REFERENCE_PATTERNS)
+    + ")"
+    + "".join(f"(?:(?=({pattern})))?" for pattern in CONTROL_REFERENCE_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Framework qualifiers that do not change which control is cited
+_FRAMEWORK_QUALIFIERS = ("GDPR ", "NIST CSF ", "PCI DSS ", "ISO 27001 ")
+_ARTICLE_ABBREVIATION = re.compile(r"^ART\.\s*")
+_LEADING_ZEROS = re.compile(r"\b0+(?=\d)")
+_TRAILING_QUALIFIER = re.compile(r"\s*\([^()]*\)$")
+
+
+def find_control_references(text: str) -> Tuple[str, ...]:
+    """Extract normalized, de-duplicated control references from text.
+
+    Matches of each format are kept non-overlapping, as ``re.findall`` would.
+    """
+    next_start = [0] * len(CONTROL_REFERENCE_PATTERNS)
+    controls = set()
+
+    for match in _CONTROL_REFERENCE_SCANNER.finditer(text):
+        position = match.start()
+        for index, reference in enumerate(match.groups()):
+            if reference is not None and position >= next_start[index]:
+                # Normalize case for consistency
+                controls.add(reference.upper().strip())
+                next_start[index] = position + len(reference)
+
+    return tuple(controls)
+
+
+@lru_cache(maxsize=4096)
+def scan_control_references(text: str) -> Tuple[str, ...]:
+    """Memoized ``find_control_references`` for texts scored repeatedly."""
+    return find_control_references(text)
+
+
+def canonical_control_id(reference: str) -> str:
+    """
+    Map a control reference to the form stored in the catalog.
+
+    Whitespace is collapsed, framework qualifiers ("GDPR Article 32") and the
+    "Art." abbreviation are normalized, and zero padding is dropped so that
+    "GV.OC-01" and "GV.OC-1" compare equal.
+    """
+    control = " ".join(reference.upper().split())
+    for qualifier in _FRAMEWORK_QUALIFIERS:
+        if control.startswith(qualifier):
+            control = control[len(qualifier) :]
+            break
+    control = _ARTICLE_ABBREVIATION.sub("ARTICLE ", control)
+    return _LEADING_ZEROS.sub("", control)
+
+
+def _parent_control_ids(control: str) -> List[str]:
+    """Strip trailing parenthesized parts: AC-2(1) -> AC-2, 164.312(a)(1) -> ..."""
+    parents = []
+    while True:
+        parent = _TRAILING_QUALIFIER.sub("", control)
+        if parent == control or not parent:
+            return parents
+        parents.append(parent)
+        control = parent
+
+
+def _framework_documents(frameworks_dir: Path) -> Dict[str, List[Path]]:
+    """Map framework names to their documents, as listed in metadata.toml."""
+    documents = {}
+    for framework_dir in sorted(frameworks_dir.iterdir()):
+        metadata_path = framework_dir / "metadata.toml"
+        if not (framework_dir.is_dir() and metadata_path.exists()):
+            continue
+
+        metadata = toml.load(metadata_path)
+        name = metadata["framework"]["name"]
+        documents[name] = [
+            framework_dir / doc_file
+            for doc_file in metadata.get("files", {}).get("documents", [])
+            if (framework_dir / doc_file).exists()
+        ]
+    return documents
+
+
+def source_fingerprint(frameworks_dir: Path) -> Dict[str, List[int]]:
+    """Size and modification time of every framework document and metadata file."""
+    fingerprint = {}
+    for path in sorted(frameworks_dir.glob("*/*")):
+        if path.is_file() and (path.suffix == ".md" or path.name == "metadata.toml"):
+            stat = path.stat()
+            fingerprint[path.relative_to(frameworks_dir).as_posix()] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+            ]
+    return fingerprint
+
+
+class ControlCatalog:
+    """Per-framework sets of control identifiers found in the corpus."""
+
+    def __init__(
+        self,
+        frameworks: Dict[str, Iterable[str]],
+        fingerprint: Optional[Dict[str, List[int]]] = None,
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            frameworks: Canonical control identifiers per framework name
+            fingerprint: Source fingerprint the catalog was built from
+        """
+        self.frameworks: Dict[str, FrozenSet[str]] = {
+            name: frozenset(controls) for name, controls in frameworks.items()
+        }
+        self.fingerprint = fingerprint or {}
+
+        self._control_frameworks: Dict[str, Tuple[str, ...]] = {}
+        for name in sorted(self.frameworks):
+            for control in self.frameworks[name]:
+                self._control_frameworks[control] = self._control_frameworks.get(
+                    control, ()
+                ) + (name,)
+
+    @classmethod
+    def build(cls, frameworks_dir: Path) -> "ControlCatalog":
+        """Extract every control identifier from the framework corpus."""
+        frameworks_dir = Path(frameworks_dir)
+        frameworks = {}
+        for name, documents in _framework_documents(frameworks_dir).items():
+            controls = set()
+            for document in documents:
+                text = document.read_text(encoding="utf-8")
+                controls.update(
+                    canonical_control_id(reference)
+                    for reference in find_control_references(text)
+                )
+            frameworks[name] = controls
+        return cls(frameworks, source_fingerprint(frameworks_dir))
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ControlCatalog"]:
+        """Load a persisted catalog, or None if it is missing or outdated."""
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if data.get("version") != CATALOG_VERSION:
+            return None
+        return cls(data.get("frameworks", {}), data.get("fingerprint", {}))
+
+    def save(self, path: Path) -> None:
+        """Persist the catalog as a compact JSON index."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CATALOG_VERSION,
+            "fingerprint": self.fingerprint,
+            "frameworks": {
+                name: sorted(controls) for name, controls in self.frameworks.items()
+            },
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    def is_current(self, frameworks_dir: Path) -> bool:
+        """Whether the catalog was built from the current framework files."""
+        return self.fingerprint == source_fingerprint(Path(frameworks_dir))
+
+    def frameworks_for(self, reference: str) -> Tuple[str, ...]:
+        """
+        Get the frameworks that define a control reference.
+
+        A sub-item such as "AC-2(1)" resolves through its parent control when
+        the corpus does not spell the sub-item out.
+        """
+        control = canonical_control_id(reference)
+        for candidate in [control] + _parent_control_ids(control):
+            frameworks = self._control_frameworks.get(candidate)
+            if frameworks:
+                return frameworks
+        return ()
+
+    def contains(self, reference: str) -> bool:
+        """Whether any framework in the corpus defines a control reference."""
+        return bool(self.frameworks_for(reference))
+
+    def __len__(self) -> int:
+        return len(self._control_frameworks)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get control counts per framework."""
+        return {
+            "total_controls": len(self),
+            "frameworks": {
+                name: len(controls) for name, controls in self.frameworks.items()
+            },
+        }
+
+
+# Global control catalog, loaded (or rebuilt if stale) on first use
+_control_catalog: Optional[ControlCatalog] = None
+_control_catalog_loaded = False
+
+
+def build_control_catalog(
+    frameworks_dir: Optional[str] = None, path: Optional[str] = None
+) -> ControlCatalog:
+    """Build the catalog from the framework corpus and persist it."""
+    global _control_catalog, _control_catalog_loaded
+    if frameworks_dir is None:
+        frameworks_dir = get_config_value(
+            "Paths", "frameworks_dir", "./data/cyber-frameworks"
+        )
+    if path is None:
+        path = get_config_value(
+            "Paths", "control_catalog", "./output/control_catalog.json"
+        )
+
+    _control_catalog = ControlCatalog.build(Path(frameworks_dir))
+    _control_catalog.save(Path(path))
+    _control_catalog_loaded = True
+    return _control_catalog
+
+
+def set_control_catalog(catalog: Optional[ControlCatalog]) -> None:
+    """
+    Use ``catalog`` as the global control catalog without loading or building one.
+
+    Scoring worker processes receive the parent's catalog this way, so they
+    never rebuild or rewrite the persisted index themselves.
+    """
+    global _control_catalog, _control_catalog_loaded
+    _control_catalog = catalog
+    _control_catalog_loaded = True
+
+
+def get_control_catalog() -> Optional[ControlCatalog]:
+    """
+    Get the global control catalog.
+
+    Returns the persisted catalog, rebuilding it when the framework files have
+    changed, or None when neither an index nor the framework corpus exists.
+    """
+    global _control_catalog, _control_catalog_loaded
+    if _control_catalog_loaded:
+        return _control_catalog
+    _control_catalog_loaded = True
+
+    frameworks_dir = Path(
+        get_config_value("Paths", "frameworks_dir", "./data/cyber-frameworks")
+    )
+    path = Path(
+        get_config_value("Paths", "control_catalog", "./output/control_catalog.json")
+    )
+
+    catalog = ControlCatalog.load(path)
+    if frameworks_dir.is_dir() and (
+        catalog is None or not catalog.is_current(frameworks_dir)
+    ):
+        catalog = build_control_catalog(str(frameworks_dir), str(path))
+    _control_catalog = catalog
+    return _control_catalog
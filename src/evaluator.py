@@ -1,20 +1,61 @@
 import asyncio
 import json
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Dict,
+    Optional,
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    Tuple,
+)
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 import openai
 
 try:
-    from .db import VectorDatabase
-    from .utils import get_config_value, get_openai_client
+    from .utils import (
+        get_config_value,
+        get_openai_client,
+        is_retryable_error,
+        retry_with_backoff,
+    )
     from .benchmark import list_default_eval_models
+    from .cache import JsonlCache, make_cache_key
+    from .llm_client import RequestTimeoutError, chat_completion
+    from .hedging import get_hedging_policy
+    from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+    from .results_table import ResultsTable
+    from .context_store import ContextStore, CONTEXTS_DIRNAME
+    from .result_writer import ResultStreamWriter, compact_result_stream
 except ImportError:
-    from src.db import VectorDatabase
-    from src.utils import get_config_value, get_openai_client
+    from src.utils import (
+        get_config_value,
+        get_openai_client,
+        is_retryable_error,
+        retry_with_backoff,
+    )
     from src.benchmark import list_default_eval_models
+    from src.cache import JsonlCache, make_cache_key
+    from src.llm_client import RequestTimeoutError, chat_completion
+    from src.hedging import get_hedging_policy
+    from src.circuit_breaker import CircuitOpenError, get_circuit_breaker
+    from src.results_table import ResultsTable
+    from src.context_store import ContextStore, CONTEXTS_DIRNAME
+    from src.result_writer import ResultStreamWriter, compact_result_stream
+
+# The vector database (chromadb, sentence-transformers) is only imported when a
+# vector DB mode actually needs it, so rescoring stays lightweight
+if TYPE_CHECKING:
+    from .db import VectorDatabase
+
+# Line-per-result stream of raw evaluation results in the output directory
+EVALUATION_STREAM_FILENAME = "evaluation_results.jsonl"
 
 
 class EvaluationMode(Enum):
@@ -33,6 +74,25 @@ class EvaluationResult:
     context_provided: Optional[str] = None
     accuracy_score: Optional[float] = None
     timestamp: Optional[str] = None
+    error_type: Optional[str] = None  # None, "timeout" or "error"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict format used by scorers and reporters."""
+        return {
+            "question": self.question,
+            "ideal_answer": self.ideal_answer,
+            "model_response": self.model_response,
+            "model_name": self.model_name,
+            "evaluation_mode": self.evaluation_mode.value,
+            "context_provided": self.context_provided,
+            "accuracy_score": self.accuracy_score,
+            "timestamp": self.timestamp,
+            "error_type": self.error_type,
+        }
+
+
+# Async callback receiving (task_index, result_dict) as each evaluation completes
+ResultSink = Callable[[int, Dict[str, Any]], Awaitable[None]]
 
 
 class CyberPolicyEvaluator:
@@ -40,9 +100,11 @@ class CyberPolicyEvaluator:
 
     def __init__(
         self,
-        vector_db: Optional[VectorDatabase] = None,
+        vector_db: Optional["VectorDatabase"] = None,
         client: Optional[openai.OpenAI] = None,
         config_overrides: Optional[Dict[str, Any]] = None,
+        journal: Optional[JsonlCache] = None,
+        resume: bool = True,
     ):
         """Initialize evaluator with injected dependencies.
 
@@ -50,10 +112,30 @@ class CyberPolicyEvaluator:
             vector_db: Vector database for context retrieval
             client: OpenAI client for API calls
             config_overrides: Override configuration values
+            journal: Append-only response journal written as each cell completes
+            resume: Reuse successful journal entries instead of re-querying
         """
         self.vector_db = vector_db
         self.client = client or get_openai_client()
         self.config_overrides = config_overrides or {}
+        self.journal = journal
+        self.resume = resume
+
+        # Sampling parameters sent with every model query (part of the cache key)
+        self.sampling_params = {
+            "temperature": get_config_value("Evaluation", "temperature", 0.1, float),
+            "top_p": get_config_value("Evaluation", "top_p", 1.0, float),
+            "max_tokens": get_config_value(
+                "Evaluation", "max_response_tokens", 1000, int
+            ),
+        }
+        # Hard deadline per model call; bounds how long a slot can be held
+        self.request_timeout = get_config_value(
+            "Evaluation", "timeout_seconds", 30, float
+        )
+        # Opt-in backup requests for calls slower than the model's observed p95
+        self.hedging = get_hedging_policy()
+        self.resumed_evaluations = 0
 
         # Initialize semaphore for rate limiting parallel requests
         parallel_requests = get_config_value("Evaluation", "parallel_requests", 5, int)
@@ -144,38 +226,77 @@ class CyberPolicyEvaluator:
         Query a model with the given prompt.
 
         Returns:
-            dict: {"response": str, "error": bool, "error_message": str}
+            dict: {"response": str, "error": bool, "error_message": str,
+                   "error_type": None | "timeout" | "circuit_open" | "error"}
         """
+        breaker = get_circuit_breaker(model_name)
+
+        # Fail fast without waiting for a semaphore slot while the model is down
+        if breaker.is_open():
+            breaker.rejected_calls += 1
+            return self._circuit_open_response(model_name)
+
         async with self.semaphore:  # Rate limiting with semaphore
-            for attempt in range(max_retries):
-                try:
-                    response = await asyncio.to_thread(
-                        self.client.chat.completions.create,
-                        model=model_name,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0.1,
+            try:
+                response = await retry_with_backoff(
+                    lambda: breaker.call(
+                        lambda: self.hedging.run(
+                            model_name,
+                            lambda: chat_completion(
+                                self.client,
+                                model_name,
+                                [{"role": "user", "content": prompt}],
+                                timeout=self.request_timeout,
+                                **self.sampling_params,
+                            ),
+                        )
+                    ),
+                    max_retries=max_retries - 1,
+                )
+            except CircuitOpenError:
+                return self._circuit_open_response(model_name)
+            except Exception as e:
+                if is_retryable_error(e):
+                    error_message = (
+                        f"Model query failed after {max_retries} attempts: {str(e)}"
                     )
-                    content = response.choices[0].message.content.strip()
+                else:
+                    error_message = f"Model query failed (not retryable): {str(e)}"
+                return {
+                    "response": "",
+                    "error": True,
+                    "error_message": error_message,
+                    "error_type": (
+                        "timeout" if isinstance(e, RequestTimeoutError) else "error"
+                    ),
+                }
 
-                    # Basic validation of response
-                    if not content:
-                        return {
-                            "response": "",
-                            "error": True,
-                            "error_message": "Model returned empty response",
-                        }
+        content = (response.choices[0].message.content or "").strip()
 
-                    return {"response": content, "error": False, "error_message": ""}
+        # Basic validation of response
+        if not content:
+            return {
+                "response": "",
+                "error": True,
+                "error_message": "Model returned empty response",
+                "error_type": "error",
+            }
 
-                except Exception as e:
-                    error_msg = str(e)
-                    if attempt == max_retries - 1:
-                        return {
-                            "response": "",
-                            "error": True,
-                            "error_message": f"Model query failed after {max_retries} attempts: {error_msg}",
-                        }
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
+        return {
+            "response": content,
+            "error": False,
+            "error_message": "",
+            "error_type": None,
+        }
+
+    def _circuit_open_response(self, model_name: str) -> dict:
+        """Build the query result returned while a model's circuit is open."""
+        return {
+            "response": "",
+            "error": True,
+            "error_message": f"Circuit open for {model_name} after repeated failures; skipping call",
+            "error_type": "circuit_open",
+        }
 
     def create_prompt(self, question: str, context: Optional[str] = None) -> str:
         """Create evaluation prompt with optional context."""
@@ -318,6 +439,26 @@ Please provide a precise answer based on the context provided. Be specific about
 
         # Create prompt and query model
         prompt = self.create_prompt(question, context)
+
+        # Reuse a successful journaled response for this exact cell if available
+        cache_key = None
+        if self.journal is not None:
+            cache_key = make_cache_key(
+                model_name, evaluation_mode.value, prompt, self.sampling_params
+            )
+            cached = self.journal.get(cache_key) if self.resume else None
+            if cached is not None and not cached.get("error"):
+                self.resumed_evaluations += 1
+                return EvaluationResult(
+                    question=question,
+                    ideal_answer=ideal_answer,
+                    model_response=cached["model_response"],
+                    model_name=model_name,
+                    evaluation_mode=evaluation_mode,
+                    context_provided=context,
+                    timestamp=cached.get("timestamp"),
+                )
+
         query_result = await self.query_model(model_name, prompt)
 
         # Handle query errors properly
@@ -326,7 +467,7 @@ Please provide a precise answer based on the context provided. Be specific about
         else:
             model_response = query_result["response"]
 
-        return EvaluationResult(
+        result = EvaluationResult(
             question=question,
             ideal_answer=ideal_answer,
             model_response=model_response,
@@ -334,6 +475,42 @@ Please provide a precise answer based on the context provided. Be specific about
             evaluation_mode=evaluation_mode,
             context_provided=context,
             timestamp=datetime.now().isoformat(),
+            error_type=query_result["error_type"],
+        )
+
+        # Journal the cell as soon as it completes; failures are re-queued on resume
+        if self.journal is not None:
+            self.journal.put(
+                cache_key,
+                {
+                    "model_name": model_name,
+                    "evaluation_mode": evaluation_mode.value,
+                    "question": question,
+                    "model_response": model_response,
+                    "error": query_result["error"],
+                    "timestamp": result.timestamp,
+                },
+            )
+
+        return result
+
+    def _task_failure_result(
+        self,
+        question: str,
+        model_name: str,
+        evaluation_mode: EvaluationMode,
+        error: Exception,
+    ) -> EvaluationResult:
+        """Create a placeholder result for an evaluation task that raised."""
+        return EvaluationResult(
+            question=question,
+            ideal_answer="N/A",
+            model_response=f"TASK_FAILURE: {str(error)}",
+            model_name=model_name,
+            evaluation_mode=evaluation_mode,
+            context_provided=None,
+            timestamp=datetime.now().isoformat(),
+            error_type="error",
         )
 
     async def _evaluate_single_question_with_progress(
@@ -343,6 +520,8 @@ Please provide a precise answer based on the context provided. Be specific about
         evaluation_mode: EvaluationMode,
         framework_files: Optional[Dict[str, str]] = None,
         total_evaluations: int = 0,
+        task_index: int = 0,
+        result_sink: Optional[ResultSink] = None,
     ) -> EvaluationResult:
         """Evaluate a single question with async-safe progress tracking."""
         # Initialize completed counter as class attribute if not exists
@@ -371,8 +550,6 @@ Please provide a precise answer based on the context provided. Be specific about
                         f"Progress: {completed}/{total_evaluations} ({progress_percent:.1f}%) - Latest: {model_name}/{evaluation_mode.value}"
                     )
 
-            return result
-
         except Exception as e:
             # Update progress even for failed evaluations
             async with self.progress_lock:
@@ -382,16 +559,43 @@ Please provide a precise answer based on the context provided. Be specific about
                     f"Failed evaluation {completed}/{total_evaluations}: {model_name}/{evaluation_mode.value} - {str(e)}"
                 )
 
+            if result_sink is not None:
+                failure = self._task_failure_result(
+                    question_data["input"], model_name, evaluation_mode, e
+                )
+                await result_sink(task_index, failure.to_dict())
             raise
 
+        # Hand the result downstream (e.g. to scoring workers) as soon as it is ready
+        if result_sink is not None:
+            await result_sink(task_index, result.to_dict())
+
+        return result
+
     async def run_evaluation(
         self,
         models: List[str],
         questions: List[Dict],
         modes: List[EvaluationMode],
         output_dir: str = "experiment_results",
+        result_sink: Optional[ResultSink] = None,
+        collect_results: bool = True,
     ) -> Dict[str, List[Dict]]:
-        """Run complete evaluation across models, questions, and modes with parallel execution."""
+        """Run complete evaluation across models, questions, and modes with parallel execution.
+
+        Cells are generated lazily and pulled by a fixed pool of
+        ``parallel_requests`` workers, so no per-cell task exists up front.
+
+        If ``result_sink`` is given it is awaited with ``(task_index, result_dict)``
+        as each evaluation completes; task indices follow model → mode → question
+        order, matching the order of the returned results.
+
+        With ``collect_results=False`` nothing is kept in memory: each result is
+        handed to the sink and dropped, and an empty dict is returned. Either
+        way each result is appended to ``evaluation_results.jsonl`` in
+        ``output_dir`` as it completes (contexts replaced by their
+        ``context_hash`` in the ``contexts`` store).
+        """
         framework_files = None
 
         # Load framework files if needed
@@ -401,132 +605,147 @@ Please provide a precise answer based on the context provided. Be specific about
         # Initialize vector DB if needed
         if EvaluationMode.VECTOR_DB in modes and not self.vector_db:
             print("Initializing vector database with multi-collection support...")
+            try:
+                from .db import VectorDatabase
+            except ImportError:
+                from src.db import VectorDatabase
+
             self.vector_db = VectorDatabase.initialize_from_chunks()
 
         total_evaluations = len(models) * len(questions) * len(modes)
 
         # Initialize progress tracking
         self._completed_evaluations = 0
+        self.resumed_evaluations = 0
 
         print(
             f"Starting parallel evaluation: {len(models)} models × {len(questions)} questions × {len(modes)} modes = {total_evaluations} total evaluations"
         )
         print(f"Parallel requests limit: {self.semaphore._value}")
 
-        # Create all evaluation tasks
-        tasks = []
-        task_metadata = []  # Track model/question/mode for each task
+        num_workers = get_config_value("Evaluation", "parallel_requests", 5, int)
+        cells = self._iter_evaluation_cells(models, questions, modes)
 
-        for model_name in models:
-            for mode in modes:
-                for question_data in questions:
-                    task = self._evaluate_single_question_with_progress(
+        # Every result is appended to a JSONL stream as it completes (by a
+        # background writer thread), so a crashed run keeps what it finished.
+        # Results are also kept in memory only when the caller wants them back,
+        # so otherwise memory depends on the number of workers rather than the
+        # size of the evaluation matrix
+        collected: Dict[int, EvaluationResult] = {}
+        outcome_counts: Dict[str, List[int]] = {m: [0, 0] for m in models}
+        output_path = Path(output_dir)
+        stream_writer = ResultStreamWriter(
+            output_path / EVALUATION_STREAM_FILENAME,
+            ContextStore(output_path / CONTEXTS_DIRNAME),
+        )
+
+        async def evaluation_worker() -> None:
+            # Workers share one generator; next() never runs concurrently because
+            # coroutines only switch at await points
+            for task_index, model_name, mode, question_data in cells:
+                try:
+                    result = await self._evaluate_single_question_with_progress(
                         question_data,
                         model_name,
                         mode,
                         framework_files,
                         total_evaluations,
+                        task_index=task_index,
+                        result_sink=result_sink,
                     )
-                    tasks.append(task)
-                    task_metadata.append((model_name, mode, question_data["input"]))
+                except Exception as e:
+                    print(f"Task failed for {model_name}/{mode.value}: {e}")
+                    result = self._task_failure_result(
+                        question_data["input"], model_name, mode, e
+                    )
+
+                counts = outcome_counts[model_name]
+                counts[1] += 1
+                if not result.model_response.startswith("TASK_FAILURE"):
+                    counts[0] += 1
 
-        print(f"Created {len(tasks)} parallel evaluation tasks")
+                stream_writer.write({"task_index": task_index, **result.to_dict()})
+                if collect_results:
+                    collected[task_index] = result
+
+        print(f"Starting {num_workers} evaluation workers")
 
-        # Execute all tasks in parallel with semaphore rate limiting
         try:
-            all_results = await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(
+                *(evaluation_worker() for _ in range(max(1, num_workers)))
+            )
         except Exception as e:
             print(f"Error in parallel execution: {e}")
             raise
+        finally:
+            stream_writer.close()
 
-        # Group results by model
+        # Group results by model, in model → mode → question order
         results = {}
-        for i, result in enumerate(all_results):
-            model_name, mode, question = task_metadata[i]
-
-            if model_name not in results:
-                results[model_name] = []
-
-            # Handle exceptions from individual tasks
-            if isinstance(result, Exception):
-                print(f"Task failed for {model_name}/{mode.value}: {result}")
-                # Create a failure result
-                failure_result = EvaluationResult(
-                    question=question,
-                    ideal_answer="N/A",
-                    model_response=f"TASK_FAILURE: {str(result)}",
-                    model_name=model_name,
-                    evaluation_mode=mode,
-                    context_provided=None,
-                    timestamp=datetime.now().isoformat(),
-                )
-                results[model_name].append(failure_result)
-            else:
-                results[model_name].append(result)
+        for task_index in sorted(collected):
+            result = collected[task_index]
+            results.setdefault(result.model_name, []).append(result)
 
         # Print completion summary
         print("\nParallel evaluation completed!")
-        for model_name, model_results in results.items():
-            successful = len(
-                [
-                    r
-                    for r in model_results
-                    if not r.model_response.startswith("TASK_FAILURE")
-                ]
-            )
-            total = len(model_results)
+        for model_name, (successful, total) in outcome_counts.items():
             print(f"  {model_name}: {successful}/{total} successful evaluations")
+        if self.resumed_evaluations:
+            print(
+                f"  Resumed {self.resumed_evaluations}/{total_evaluations} evaluations from journal {self.journal.path}"
+            )
+
+        if not collect_results:
+            print(f"Results streamed to {stream_writer.path}")
+            return {}
 
         # Convert results to dict format for downstream compatibility
         dict_results = {}
         for model_name, model_results in results.items():
-            dict_results[model_name] = [
-                {
-                    "question": r.question,
-                    "ideal_answer": r.ideal_answer,
-                    "model_response": r.model_response,
-                    "model_name": r.model_name,
-                    "evaluation_mode": r.evaluation_mode.value,
-                    "context_provided": r.context_provided,
-                    "accuracy_score": r.accuracy_score,
-                    "timestamp": r.timestamp,
-                }
-                for r in model_results
-            ]
+            dict_results[model_name] = [r.to_dict() for r in model_results]
 
-        # Save results
-        self.save_results(results, output_dir)
+        # Save results (the nested JSON is compacted from the stream)
+        self._compact_results(output_path)
         print(f"Results saved to {output_dir}")
 
         return dict_results
 
+    def _iter_evaluation_cells(
+        self, models: List[str], questions: List[Dict], modes: List[EvaluationMode]
+    ) -> Iterator[Tuple[int, str, EvaluationMode, Dict]]:
+        """Lazily yield (task_index, model, mode, question) in model → mode → question order."""
+        task_index = 0
+        for model_name in models:
+            for mode in modes:
+                for question_data in questions:
+                    yield task_index, model_name, mode, question_data
+                    task_index += 1
+
     def save_results(
         self, results: Dict[str, List[EvaluationResult]], output_dir: str
     ) -> None:
-        """Save evaluation results to files."""
+        """Save evaluation results to files (streamed, then compacted)."""
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        # Save detailed results
-        detailed_results = {}
-        for model_name, model_results in results.items():
-            detailed_results[model_name] = [
-                {
-                    "question": r.question,
-                    "ideal_answer": r.ideal_answer,
-                    "model_response": r.model_response,
-                    "evaluation_mode": r.evaluation_mode.value,
-                    "context_provided": r.context_provided,
-                    "accuracy_score": r.accuracy_score,
-                    "timestamp": r.timestamp,
-                }
-                for r in model_results
-            ]
 
-        with open(output_path / "detailed_results.json", "w", encoding="utf-8") as f:
-            json.dump(detailed_results, f, indent=2, ensure_ascii=False)
-
-        print(f"Detailed results saved to {output_path / 'detailed_results.json'}")
+        # Contexts are stored once, next to the results
+        with ResultStreamWriter(
+            output_path / EVALUATION_STREAM_FILENAME,
+            ContextStore(output_path / CONTEXTS_DIRNAME),
+        ) as writer:
+            for model_results in results.values():
+                for r in model_results:
+                    writer.write(r.to_dict())
+
+        self._compact_results(output_path)
+
+    def _compact_results(self, output_path: Path) -> None:
+        """Write detailed_results.json from the evaluation result stream."""
+        detailed_path = compact_result_stream(
+            output_path / EVALUATION_STREAM_FILENAME,
+            output_path / "detailed_results.json",
+            exclude=("task_index", "model_name"),
+        )
+        print(f"Detailed results saved to {detailed_path}")
 
     def generate_metadata_report(
         self, results: Dict[str, List[EvaluationResult]], questions: List[Dict]
@@ -541,123 +760,64 @@ Please provide a precise answer based on the context provided. Be specific about
             "recommendations": [],
         }
 
-        # Create question metadata lookup
-        question_metadata = {}
-        for q in questions:
-            question_metadata[q["input"]] = q.get("metadata", {})
-
-        all_scores = []
-        difficulty_scores = {}
-        framework_scores = {}
-        category_scores = {}
-        type_scores = {}
-
-        for model_name, model_results in results.items():
-            for result in model_results:
-                if result.accuracy_score is not None:
-                    score = result.accuracy_score
-                    all_scores.append(score)
-
-                    # Get metadata for this question
-                    metadata = question_metadata.get(result.question, {})
-
-                    # Aggregate by difficulty
-                    difficulty = metadata.get("difficulty", "unknown")
-                    if difficulty not in difficulty_scores:
-                        difficulty_scores[difficulty] = []
-                    difficulty_scores[difficulty].append(score)
-
-                    # Aggregate by framework (handle multi-framework)
-                    frameworks = metadata.get("framework", "unknown").split(",")
-                    for framework in frameworks:
-                        framework = framework.strip()
-                        if framework not in framework_scores:
-                            framework_scores[framework] = []
-                        framework_scores[framework].append(score)
-
-                    # Aggregate by category
-                    category = metadata.get("category", "unknown")
-                    if category not in category_scores:
-                        category_scores[category] = []
-                    category_scores[category].append(score)
-
-                    # Aggregate by question type
-                    q_type = metadata.get("question_type", "unknown")
-                    if q_type not in type_scores:
-                        type_scores[q_type] = []
-                    type_scores[q_type].append(score)
+        # Flatten once into columns; every breakdown is a group-by over codes
+        table = ResultsTable.from_results(
+            {
+                model_name: [result.to_dict() for result in model_results]
+                for model_name, model_results in results.items()
+            },
+            questions,
+        )
+        all_scores = table.score[table.scored]
 
         # Calculate summary statistics
-        if all_scores:
+        if len(all_scores):
+            total = len(all_scores)
             report["summary"] = {
-                "total_evaluations": len(all_scores),
-                "overall_average": sum(all_scores) / len(all_scores),
-                "median_score": sorted(all_scores)[len(all_scores) // 2],
-                "min_score": min(all_scores),
-                "max_score": max(all_scores),
+                "total_evaluations": total,
+                "overall_average": float(all_scores.sum() / total),
+                "median_score": float(np.sort(all_scores)[total // 2]),
+                "min_score": float(all_scores.min()),
+                "max_score": float(all_scores.max()),
                 "score_distribution": {
-                    "excellent_90_100": len([s for s in all_scores if s >= 0.9])
-                    / len(all_scores),
-                    "good_80_89": len([s for s in all_scores if 0.8 <= s < 0.9])
-                    / len(all_scores),
-                    "fair_70_79": len([s for s in all_scores if 0.7 <= s < 0.8])
-                    / len(all_scores),
-                    "poor_below_70": len([s for s in all_scores if s < 0.7])
-                    / len(all_scores),
+                    "excellent_90_100": int(np.count_nonzero(all_scores >= 0.9))
+                    / total,
+                    "good_80_89": int(
+                        np.count_nonzero((all_scores >= 0.8) & (all_scores < 0.9))
+                    )
+                    / total,
+                    "fair_70_79": int(
+                        np.count_nonzero((all_scores >= 0.7) & (all_scores < 0.8))
+                    )
+                    / total,
+                    "poor_below_70": int(np.count_nonzero(all_scores < 0.7)) / total,
                 },
             }
 
-        # Calculate performance by difficulty
-        for difficulty, scores in difficulty_scores.items():
-            if scores:
-                report["by_difficulty"][difficulty] = {
-                    "count": len(scores),
-                    "average": sum(scores) / len(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                }
-
-        # Calculate performance by framework
-        for framework, scores in framework_scores.items():
-            if scores:
-                report["by_framework"][framework] = {
-                    "count": len(scores),
-                    "average": sum(scores) / len(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                }
-
-        # Calculate performance by category
-        for category, scores in category_scores.items():
-            if scores:
-                report["by_category"][category] = {
-                    "count": len(scores),
-                    "average": sum(scores) / len(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                }
+        # Calculate performance by difficulty, category and question type
+        for dimension, key in (
+            ("difficulty", "by_difficulty"),
+            ("category", "by_category"),
+            ("question_type", "by_question_type"),
+        ):
+            report[key] = table.describe_groups(
+                table.metadata[dimension], table.metadata_labels[dimension]
+            )
 
-        # Calculate performance by question type
-        for q_type, scores in type_scores.items():
-            if scores:
-                report["by_question_type"][q_type] = {
-                    "count": len(scores),
-                    "average": sum(scores) / len(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                }
+        # Calculate performance by framework (multi-framework questions count
+        # towards each of their frameworks)
+        report["by_framework"] = table.describe_groups(
+            table.framework, table.frameworks, table.framework_scores()
+        )
 
         # Generate recommendations
         recommendations = []
 
         # Difficulty-based recommendations
-        if "expert" in difficulty_scores and "intermediate" in difficulty_scores:
-            expert_avg = sum(difficulty_scores["expert"]) / len(
-                difficulty_scores["expert"]
-            )
-            intermediate_avg = sum(difficulty_scores["intermediate"]) / len(
-                difficulty_scores["intermediate"]
-            )
+        by_difficulty = report["by_difficulty"]
+        if "expert" in by_difficulty and "intermediate" in by_difficulty:
+            expert_avg = by_difficulty["expert"]["average"]
+            intermediate_avg = by_difficulty["intermediate"]["average"]
             if expert_avg < intermediate_avg - 0.1:
                 recommendations.append(
                     f"Expert questions showing {intermediate_avg - expert_avg:.2f} point gap vs intermediate - consider expert-specific training"
@@ -665,7 +825,7 @@ Please provide a precise answer based on the context provided. Be specific about
 
         # Framework-specific recommendations
         framework_averages = {
-            k: sum(v) / len(v) for k, v in framework_scores.items() if v
+            k: v["average"] for k, v in report["by_framework"].items()
         }
         if framework_averages:
             lowest_framework = min(framework_averages, key=framework_averages.get)
@@ -680,9 +840,7 @@ Please provide a precise answer based on the context provided. Be specific about
                 )
 
         # Category-based recommendations
-        category_averages = {
-            k: sum(v) / len(v) for k, v in category_scores.items() if v
-        }
+        category_averages = {k: v["average"] for k, v in report["by_category"].items()}
         if category_averages:
             lowest_category = min(category_averages, key=category_averages.get)
             if category_averages[lowest_category] < 0.7:
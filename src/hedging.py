@@ -0,0 +1,175 @@
+"""
+Hedged requests for Cyber-Policy-Bench.
+
+A small fraction of provider calls account for most of the wall clock. When
+hedging is enabled, a call that has not returned by the model's observed
+latency percentile (p95 by default) is duplicated; whichever response arrives
+first wins. Requests go through the synchronous client in a worker thread, so
+abandoning the losing request only stops waiting for it: the HTTP call still
+runs to completion and is billed. Extra calls are therefore capped at a fixed
+ratio of all calls so hedging cannot multiply provider spend.
+"""
+
+import asyncio
+import math
+import time
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+try:
+    from .utils import get_config_value
+except ImportError:
+    from src.utils import get_config_value
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """Per-model latency tracker that decides when to send a backup request."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 95.0,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        window_size: int = 200,
+    ):
+        """
+        Initialize the hedging policy.
+
+        Args:
+            enabled: Whether backup requests are sent at all
+            percentile: Latency percentile after which a call is hedged
+            budget_ratio: Maximum hedged calls as a fraction of all calls
+            min_samples: Latency samples required per model before hedging
+            window_size: Number of recent latencies kept per model
+        """
+        self.enabled = enabled
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+
+        self._latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window_size)
+        )
+        self.total_calls = 0
+        self.hedged_calls = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+
+    @classmethod
+    def from_config(cls) -> "HedgingPolicy":
+        """Create a policy from the [Evaluation] section of the config."""
+        return cls(
+            enabled=get_config_value("Evaluation", "enable_hedging", False, bool),
+            percentile=get_config_value("Evaluation", "hedge_percentile", 95.0, float),
+            budget_ratio=get_config_value(
+                "Evaluation", "hedge_budget_ratio", 0.05, float
+            ),
+            min_samples=get_config_value("Evaluation", "hedge_min_samples", 20, int),
+        )
+
+    def record_latency(self, model: str, seconds: float) -> None:
+        """Record how long a call took to succeed, fail or time out."""
+        self._latencies[model].append(seconds)
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Return the delay after which to hedge, or None if too few samples."""
+        samples = self._latencies.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        rank = math.ceil(self.percentile / 100.0 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+    def _within_budget(self) -> bool:
+        return self.hedged_calls + 1 <= self.budget_ratio * self.total_calls
+
+    async def run(self, model: str, make_call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``make_call()``, sending one backup request if it is slow.
+
+        The losing request's task is cancelled, but a request already running
+        in a worker thread (``asyncio.to_thread``) cannot be interrupted and is
+        still paid for. Failed and timed-out calls are recorded at their
+        elapsed time, so slow failures raise the hedge delay too.
+
+        Args:
+            model: Model identifier used for latency tracking
+            make_call: Zero-argument factory returning a fresh request coroutine
+
+        Returns:
+            The first successful response
+        """
+        self.total_calls += 1
+        start = time.monotonic()
+
+        delay = self.hedge_delay(model) if self.enabled else None
+        if delay is None:
+            try:
+                result = await make_call()
+            except Exception:
+                self.record_latency(model, time.monotonic() - start)
+                raise
+            self.record_latency(model, time.monotonic() - start)
+            return result
+
+        primary = asyncio.create_task(make_call())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                if self._within_budget():
+                    self.hedged_calls += 1
+                    pending.add(asyncio.create_task(make_call()))
+                else:
+                    self.budget_exhausted += 1
+
+            first_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        self.record_latency(model, time.monotonic() - start)
+                        return task.result()
+                    if first_error is None or task is primary:
+                        first_error = task.exception()
+
+            self.record_latency(model, time.monotonic() - start)
+            raise first_error
+        finally:
+            # Stop waiting for the losing (or abandoned) request
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedging statistics for run metrics."""
+        return {
+            "enabled": self.enabled,
+            "total_calls": self.total_calls,
+            "hedged_calls": self.hedged_calls,
+            "hedge_wins": self.hedge_wins,
+            "budget_exhausted": self.budget_exhausted,
+            "hedge_rate": self.hedged_calls / max(1, self.total_calls),
+            "hedge_delays": {
+                model: self.hedge_delay(model) for model in self._latencies
+            },
+        }
+
+
+# Global hedging policy shared by the evaluator and scorers
+_hedging_policy: Optional[HedgingPolicy] = None
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """Get global hedging policy instance."""
+    global _hedging_policy
+    if _hedging_policy is None:
+        _hedging_policy = HedgingPolicy.from_config()
+    return _hedging_policy
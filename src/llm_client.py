@@ -0,0 +1,64 @@
+"""
+Chat-completion helpers shared by the evaluator and scorers.
+
+The OpenAI client used throughout the benchmark is synchronous, so calls run in
+a worker thread. This module wraps that pattern with a hard per-call deadline:
+the deadline is passed to the HTTP client as its request timeout and is also
+enforced on the awaiting side, so a hung call can never hold a concurrency
+slot for longer than the configured budget.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import openai
+
+
+class RequestTimeoutError(Exception):
+    """Raised when a chat-completion call exceeds its deadline."""
+
+    # Checked by retry_with_backoff: the next attempt may well finish in time
+    retryable = True
+
+    def __init__(self, model: str, timeout: float):
+        super().__init__(f"Request to {model} timed out after {timeout:g}s")
+        self.model = model
+        self.timeout = timeout
+
+
+async def chat_completion(
+    client: openai.OpenAI,
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: Optional[float] = None,
+    **params: Any,
+) -> Any:
+    """
+    Run a chat-completion request in a worker thread with a deadline.
+
+    Args:
+        client: OpenAI-compatible client
+        model: Model identifier
+        messages: Chat messages
+        timeout: Deadline in seconds for the whole call (no deadline if None)
+        **params: Extra request parameters (temperature, max_tokens, ...)
+
+    Returns:
+        The chat completion response
+
+    Raises:
+        RequestTimeoutError: If the call does not finish within ``timeout``
+    """
+    if timeout is not None:
+        params["timeout"] = timeout
+
+    call = asyncio.to_thread(
+        client.chat.completions.create, model=model, messages=messages, **params
+    )
+    if timeout is None:
+        return await call
+
+    try:
+        return await asyncio.wait_for(call, timeout=timeout)
+    except (TimeoutError, openai.APITimeoutError) as e:
+        raise RequestTimeoutError(model, timeout) from e
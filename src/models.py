@@ -149,6 +149,21 @@ class ModelInfo:
         )
 
 
+def infer_context_length(model_id: str) -> int:
+    """Guess a model's context window from its id (configured default if unknown)."""
+    from .utils import get_config_value
+
+    model_lower = model_id.lower()
+    if any(term in model_lower for term in ["gpt-4", "gpt-5"]):
+        return 128000
+    elif "claude" in model_lower:
+        return 200000
+    elif any(term in model_lower for term in ["gemini", "deepseek", "qwen", "mistral"]):
+        return 32000
+
+    return get_config_value("Models", "default_context_length", 8192, int)
+
+
 class ModelManager(BaseComponent):
     """Manager for model discovery and management."""
 
@@ -356,6 +371,13 @@ class ModelManager(BaseComponent):
                 elif context_length > 32000:
                     capabilities.add(ModelCapability.LARGE_CONTEXT)
 
+                supported_parameters = model.get("supported_parameters") or []
+                if (
+                    "response_format" in supported_parameters
+                    or "structured_outputs" in supported_parameters
+                ):
+                    capabilities.add(ModelCapability.JSON_MODE)
+
                 model_info = ModelInfo(
                     id=model["id"],
                     name=model.get("name", model["id"]),
@@ -389,31 +411,23 @@ class ModelManager(BaseComponent):
             # Infer basic information from model ID
             provider = ModelProvider.UNKNOWN
 
-            # Get default context length from config or use conservative default
             from .utils import get_config_value
 
-            default_context = get_config_value(
-                "Models", "default_context_length", 8192, int
-            )
-            context_length = default_context
+            context_length = infer_context_length(model_id)
             capabilities = {ModelCapability.TEXT_GENERATION}
 
             # Infer capabilities from model name
             model_lower = model_id.lower()
             if any(term in model_lower for term in ["gpt-4", "gpt-5"]):
-                context_length = 128000
                 capabilities.add(ModelCapability.LARGE_CONTEXT)
                 provider = ModelProvider.OPENAI
             elif "claude" in model_lower:
-                context_length = 200000
                 capabilities.add(ModelCapability.VERY_LARGE_CONTEXT)
                 provider = ModelProvider.ANTHROPIC
             elif "gemini" in model_lower:
-                context_length = 32000
                 capabilities.add(ModelCapability.LARGE_CONTEXT)
                 provider = ModelProvider.GOOGLE
             elif any(term in model_lower for term in ["deepseek", "qwen", "mistral"]):
-                context_length = 32000
                 capabilities.add(ModelCapability.LARGE_CONTEXT)
 
             # Get default performance score from config
@@ -611,6 +625,20 @@ def get_model_manager() -> ModelManager:
     return _model_manager
 
 
+def get_model_context_length(model_id: str) -> int:
+    """Get a model's context window from discovered model info, else infer it from its id."""
+    from .utils import ConfigError
+
+    try:
+        model_info = get_model_manager().models.get(model_id)
+    except ConfigError:
+        model_info = None
+
+    if model_info is not None and model_info.context_length > 0:
+        return model_info.context_length
+    return infer_context_length(model_id)
+
+
 def list_eval_models(limit: int = 20, use_cache: bool = True) -> List[str]:
     """Get evaluation model IDs (backwards compatibility)."""
     manager = get_model_manager()
@@ -0,0 +1,139 @@
+"""
+Pipelined evaluation and scoring for Cyber-Policy-Bench.
+
+Instead of running the evaluation and scoring stages back to back, results are
+pushed onto a bounded async queue as they are produced and consumed by a pool
+of scoring workers. The bounded queue provides backpressure, and every result
+carries its task index so the output can be reassembled in the original
+model → mode → question order. Given a result writer, scored results are
+streamed to disk instead of collected, so memory stays bounded by the queue.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    from .result_writer import ResultStreamWriter
+    from .utils import get_config_value
+except ImportError:
+    from src.result_writer import ResultStreamWriter
+    from src.utils import get_config_value
+
+
+# Callback used by producers to hand a (task_index, result) pair to the pipeline
+Sink = Callable[[int, Dict[str, Any]], Awaitable[None]]
+
+
+async def _await_watching(
+    awaitable: Awaitable[Any], workers: List[asyncio.Task]
+) -> Any:
+    """
+    Await ``awaitable``, failing fast if a worker dies in the meantime.
+
+    A dead worker stops draining the queue, so a producer blocked on it would
+    otherwise wait forever. The awaitable is cancelled and the worker's
+    exception raised instead.
+
+    Args:
+        awaitable: Coroutine that feeds the workers' queue
+        workers: Worker tasks consuming the queue
+
+    Returns:
+        Result of ``awaitable``
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while not task.done():
+            await asyncio.wait(
+                [task, *(worker for worker in workers if not worker.done())],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for worker in workers:
+                if worker.done() and not worker.cancelled() and worker.exception():
+                    raise worker.exception()
+        return task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+async def stream_into_scoring(
+    produce: Callable[[Sink], Awaitable[Any]],
+    scorer: Any,
+    scoring_methods: Optional[List] = None,
+    queue_size: int = None,
+    num_workers: int = None,
+    result_writer: Optional[ResultStreamWriter] = None,
+) -> Dict[str, List[Dict]]:
+    """
+    Score results concurrently while they are still being produced.
+
+    Args:
+        produce: Coroutine function that receives a sink and awaits it once per
+            result, e.g. ``lambda sink: evaluator.run_evaluation(..., result_sink=sink)``
+        scorer: Scorer exposing ``score_result(result, scoring_methods)``
+        scoring_methods: Scoring methods passed through to the scorer
+        queue_size: Maximum number of unscored results buffered (from config if None)
+        num_workers: Number of concurrent scoring workers (from config if None)
+        result_writer: Stream each scored result is handed to (with its
+            ``task_index``) as soon as it is scored. Results are then dropped
+            instead of collected, so memory depends on the queue size and
+            number of workers rather than the number of results, and a crash
+            keeps finished work
+
+    Returns:
+        Scored results grouped by model, in task index order (empty if a
+        ``result_writer`` was given)
+    """
+    if queue_size is None:
+        queue_size = get_config_value("Evaluation", "pipeline_queue_size", 50, int)
+    if num_workers is None:
+        num_workers = get_config_value("Scoring", "scoring_concurrency", 5, int)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+    scored: Dict[int, Dict[str, Any]] = {}
+
+    async def sink(task_index: int, result: Dict[str, Any]) -> None:
+        # Blocks the producer while the queue is full (backpressure)
+        await queue.put((task_index, result))
+
+    async def score_worker() -> None:
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                task_index, result = item
+                scored_result = await scorer.score_result(result, scoring_methods)
+                if result_writer is not None:
+                    result_writer.write({"task_index": task_index, **scored_result})
+                else:
+                    scored[task_index] = scored_result
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(score_worker()) for _ in range(max(1, num_workers))]
+
+    async def send_sentinels() -> None:
+        # One sentinel per worker once the producer is exhausted
+        for _ in workers:
+            await queue.put(None)
+
+    try:
+        await _await_watching(produce(sink), workers)
+        await _await_watching(send_sentinels(), workers)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            if not worker.done():
+                worker.cancel()
+
+    # Reassemble in production order, grouped by model
+    scored_results: Dict[str, List[Dict]] = {}
+    for task_index in sorted(scored):
+        result = scored[task_index]
+        scored_results.setdefault(result.get("model_name", "unknown"), []).append(
+            result
+        )
+
+    return scored_results
@@ -19,6 +19,14 @@ from .utils import (
     format_duration,
 )
 from .base import BaseComponent, ComponentStatus, MonitoringMixin
+from .aggregates import (
+    ModelAggregate,
+    ScoreStats,
+    aggregate_results,
+    aggregate_table,
+)
+from .result_writer import iter_result_stream
+from .results_table import ResultsTable
 
 
 @dataclass
@@ -91,6 +99,8 @@ class ModelPerformanceReport:
     average_score: float = 0.0
     score_std_dev: float = 0.0
     scores_by_mode: Dict[str, List[float]] = field(default_factory=dict)
+    # Mergeable per-mode statistics, used instead of scores_by_mode when set
+    mode_stats: Dict[str, ScoreStats] = field(default_factory=dict)
 
     # Reliability metrics
     api_success_rate: float = 0.0
@@ -125,8 +135,32 @@ class ModelPerformanceReport:
             "low": (self.low_quality_responses / total) * 100.0,
         }
 
+    @classmethod
+    def from_aggregate(cls, aggregate: ModelAggregate) -> "ModelPerformanceReport":
+        """Create a report from a model's aggregate."""
+        return cls(
+            model_name=aggregate.model_name,
+            total_evaluations=aggregate.total_evaluations,
+            successful_evaluations=aggregate.scores.count,
+            average_score=aggregate.scores.mean,
+            score_std_dev=aggregate.scores.stdev,
+            mode_stats=aggregate.scores_by_mode,
+            api_success_rate=(
+                aggregate.scores.count / max(1, aggregate.total_evaluations)
+            )
+            * 100.0,
+            timeout_count=aggregate.timeout_count,
+            error_count=aggregate.error_count,
+            high_quality_responses=aggregate.high_quality_responses,
+            medium_quality_responses=aggregate.medium_quality_responses,
+            low_quality_responses=aggregate.low_quality_responses,
+        )
+
     def get_mode_performance(self) -> Dict[str, Dict[str, float]]:
         """Get performance statistics by evaluation mode."""
+        if self.mode_stats:
+            return {mode: stats.describe() for mode, stats in self.mode_stats.items()}
+
         mode_stats = {}
         for mode, scores in self.scores_by_mode.items():
             if scores:
@@ -166,58 +200,49 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
         self.set_status(ComponentStatus.READY)
 
     def analyze_benchmark_results(
-        self, results: Dict[str, List[Dict]], summary: Optional[Dict] = None
+        self,
+        results: Dict[str, List[Dict]],
+        summary: Optional[Dict] = None,
+        aggregates: Optional[Dict[str, ModelAggregate]] = None,
     ) -> BenchmarkMetrics:
-        """Analyze benchmark results and generate comprehensive metrics."""
-        self.logger.info("Analyzing benchmark results...")
-
-        metrics = BenchmarkMetrics()
-        all_scores = []
-        model_scores = {}
-        mode_scores = {}
+        """Analyze benchmark results and generate comprehensive metrics.
 
-        # Analyze results by model
-        for model_name, model_results in results.items():
-            model_scores[model_name] = []
-
-            for result in model_results:
-                metrics.total_evaluations += 1
-
-                # Count successful evaluations
-                if result.get("accuracy_score") is not None:
-                    metrics.successful_evaluations += 1
-                    score = result["accuracy_score"]
-                    all_scores.append(score)
-                    model_scores[model_name].append(score)
+        Metrics are merged from per-model aggregates; pass ``aggregates`` to
+        skip re-reading ``results`` (e.g. when a model was appended to a run).
+        """
+        self.logger.info("Analyzing benchmark results...")
 
-                    # Track by evaluation mode
-                    mode = result.get("evaluation_mode", "unknown")
-                    if mode not in mode_scores:
-                        mode_scores[mode] = []
-                    mode_scores[mode].append(score)
+        if aggregates is None:
+            aggregates = aggregate_results(results)
 
-                else:
-                    metrics.failed_evaluations += 1
+        metrics = BenchmarkMetrics()
+        all_scores = ScoreStats()
+        mode_scores: Dict[str, ScoreStats] = {}
+
+        for aggregate in aggregates.values():
+            metrics.total_evaluations += aggregate.total_evaluations
+            metrics.successful_evaluations += aggregate.scores.count
+            metrics.failed_evaluations += (
+                aggregate.total_evaluations - aggregate.scores.count
+            )
+            metrics.scoring_failures += aggregate.scoring_failures
 
-                # Check for scoring failures
-                if result.get("scores", {}).get("error"):
-                    metrics.scoring_failures += 1
+            all_scores.merge(aggregate.scores)
+            for mode, stats in aggregate.scores_by_mode.items():
+                mode_scores.setdefault(mode, ScoreStats()).merge(stats)
 
         # Calculate overall statistics
-        metrics.total_models = len(results)
-        if all_scores:
-            metrics.overall_average_score = statistics.mean(all_scores)
-            metrics.score_std_dev = (
-                statistics.stdev(all_scores) if len(all_scores) > 1 else 0.0
-            )
-            metrics.min_score = min(all_scores)
-            metrics.max_score = max(all_scores)
+        metrics.total_models = len(aggregates)
+        if all_scores.count:
+            metrics.overall_average_score = all_scores.mean
+            metrics.score_std_dev = all_scores.stdev
+            metrics.min_score = all_scores.min
+            metrics.max_score = all_scores.max
 
         # Find best and worst performing models
-        if model_scores:
+        if aggregates:
             model_averages = {
-                model: statistics.mean(scores) if scores else 0.0
-                for model, scores in model_scores.items()
+                model: aggregate.scores.mean for model, aggregate in aggregates.items()
             }
             metrics.best_performing_model = max(model_averages, key=model_averages.get)
             metrics.worst_performing_model = min(model_averages, key=model_averages.get)
@@ -225,8 +250,7 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
         # Calculate mode performance
         metrics.evaluation_modes = list(mode_scores.keys())
         metrics.mode_performance = {
-            mode: statistics.mean(scores) if scores else 0.0
-            for mode, scores in mode_scores.items()
+            mode: stats.mean for mode, stats in mode_scores.items()
         }
 
         # Estimate timing if available in summary
@@ -239,61 +263,20 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
         return metrics
 
     def generate_model_performance_reports(
-        self, results: Dict[str, List[Dict]]
+        self,
+        results: Dict[str, List[Dict]],
+        aggregates: Optional[Dict[str, ModelAggregate]] = None,
     ) -> Dict[str, ModelPerformanceReport]:
         """Generate detailed performance reports for each model."""
         self.logger.info("Generating model performance reports...")
 
-        model_reports = {}
-
-        for model_name, model_results in results.items():
-            report = ModelPerformanceReport(model_name=model_name)
-            report.total_evaluations = len(model_results)
+        if aggregates is None:
+            aggregates = aggregate_results(results)
 
-            scores = []
-            successful_count = 0
-
-            for result in model_results:
-                score = result.get("accuracy_score")
-                if score is not None:
-                    successful_count += 1
-                    scores.append(score)
-
-                    # Track evaluation mode performance
-                    mode = result.get("evaluation_mode", "unknown")
-                    if mode not in report.scores_by_mode:
-                        report.scores_by_mode[mode] = []
-                    report.scores_by_mode[mode].append(score)
-
-                    # Categorize response quality
-                    if score > 0.8:
-                        report.high_quality_responses += 1
-                    elif score >= 0.4:
-                        report.medium_quality_responses += 1
-                    else:
-                        report.low_quality_responses += 1
-
-                # Track errors
-                if result.get("model_response", "").startswith("Error:"):
-                    report.error_count += 1
-
-            report.successful_evaluations = successful_count
-
-            # Calculate statistics
-            if scores:
-                report.average_score = statistics.mean(scores)
-                report.score_std_dev = (
-                    statistics.stdev(scores) if len(scores) > 1 else 0.0
-                )
-
-            # Simulate API reliability metrics (would be tracked in real implementation)
-            report.api_success_rate = (
-                successful_count / max(1, report.total_evaluations)
-            ) * 100.0
-
-            model_reports[model_name] = report
-
-        return model_reports
+        return {
+            model_name: ModelPerformanceReport.from_aggregate(aggregate)
+            for model_name, aggregate in aggregates.items()
+        }
 
     def generate_html_report(
         self,
@@ -620,6 +603,7 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
                         <div style="font-size: 0.9em;">
                             <div>Success Rate: <strong>{report.calculate_success_rate():.1f}%</strong></div>
                             <div>Errors: <strong>{report.error_count}</strong></div>
+                            <div>Timeouts: <strong>{report.timeout_count}</strong></div>
                         </div>
                     </div>
                 </div>
@@ -666,19 +650,41 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
     def generate_comparison_report(
         self, current_results: Dict, previous_results_path: Optional[Path] = None
     ) -> Dict[str, Any]:
-        """Generate comparison report with previous benchmark results."""
+        """Generate comparison report with previous benchmark results.
+
+        ``previous_results_path`` may be a detailed_results.json file or a
+        scored_results.jsonl stream, which is read incrementally.
+        """
         self.logger.info("Generating comparison report...")
 
         if not previous_results_path or not previous_results_path.exists():
             return {"error": "No previous results available for comparison"}
 
         try:
-            previous_results = load_json(previous_results_path)
+            # A result stream is read record by record instead of as one tree
+            if previous_results_path.suffix == ".jsonl":
+                previous_table = ResultsTable.from_records(
+                    iter_result_stream(previous_results_path)
+                )
+            else:
+                previous_table = ResultsTable.from_results(
+                    load_json(previous_results_path)
+                )
+
+            # One columnar pass per result set feeds both metrics and model means
+            current_aggregates = aggregate_table(
+                ResultsTable.from_results(current_results)
+            )
+            previous_aggregates = aggregate_table(previous_table)
 
             comparison = {
                 "timestamp": get_timestamp(),
-                "current_metrics": self.analyze_benchmark_results(current_results),
-                "previous_metrics": self.analyze_benchmark_results(previous_results),
+                "current_metrics": self.analyze_benchmark_results(
+                    current_results, aggregates=current_aggregates
+                ),
+                "previous_metrics": self.analyze_benchmark_results(
+                    {}, aggregates=previous_aggregates
+                ),
                 "improvements": {},
                 "regressions": {},
                 "new_models": [],
@@ -687,7 +693,7 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
 
             # Compare models
             current_models = set(current_results.keys())
-            previous_models = set(previous_results.keys())
+            previous_models = set(previous_aggregates)
 
             comparison["new_models"] = list(current_models - previous_models)
             comparison["removed_models"] = list(previous_models - current_models)
@@ -696,20 +702,12 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
             common_models = current_models & previous_models
 
             for model in common_models:
-                current_scores = [
-                    r.get("accuracy_score", 0)
-                    for r in current_results[model]
-                    if r.get("accuracy_score") is not None
-                ]
-                previous_scores = [
-                    r.get("accuracy_score", 0)
-                    for r in previous_results[model]
-                    if r.get("accuracy_score") is not None
-                ]
-
-                if current_scores and previous_scores:
-                    current_avg = statistics.mean(current_scores)
-                    previous_avg = statistics.mean(previous_scores)
+                current_stats = current_aggregates[model].scores
+                previous_stats = previous_aggregates[model].scores
+
+                if current_stats.count and previous_stats.count:
+                    current_avg = current_stats.mean
+                    previous_avg = previous_stats.mean
                     difference = current_avg - previous_avg
 
                     if difference > 0.05:  # Significant improvement
@@ -753,6 +751,7 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
                     "mode_performance": report.get_mode_performance(),
                     "api_success_rate": report.api_success_rate,
                     "error_count": report.error_count,
+                    "timeout_count": report.timeout_count,
                 }
                 for model_name, report in model_reports.items()
             },
@@ -769,6 +768,7 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
         results: Dict[str, List[Dict]],
         summary: Optional[Dict] = None,
         previous_results_path: Optional[Path] = None,
+        aggregates: Optional[Dict[str, ModelAggregate]] = None,
     ) -> Dict[str, Path]:
         """Generate all available reports."""
         self.logger.info("Generating comprehensive report suite...")
@@ -777,8 +777,10 @@ class BenchmarkReporter(BaseComponent, MonitoringMixin):
 
         try:
             # Analyze results
-            metrics = self.analyze_benchmark_results(results, summary)
-            model_reports = self.generate_model_performance_reports(results)
+            if aggregates is None:
+                aggregates = aggregate_results(results)
+            metrics = self.analyze_benchmark_results(results, summary, aggregates)
+            model_reports = self.generate_model_performance_reports(results, aggregates)
 
             # Generate reports
             generated_reports = {}
@@ -11,10 +11,20 @@ import numpy as np
 
 try:
     from .hybrid_search import SearchResult
-    from .utils import get_config, get_config_value
+    from .utils import (
+        estimate_tokens,
+        get_config,
+        get_config_value,
+        truncate_to_tokens,
+    )
 except ImportError:
     from src.hybrid_search import SearchResult
-    from src.utils import get_config, get_config_value
+    from src.utils import (
+        estimate_tokens,
+        get_config,
+        get_config_value,
+        truncate_to_tokens,
+    )
 
 
 @dataclass
@@ -75,24 +85,11 @@ class CrossEncoderReranker:
         self.top_k_rerank = get_config_value("Reranking", "top_k", 50, int)
 
     def truncate_text(self, text: str, max_length: int = None) -> str:
-        """Truncate text to fit model's input length constraints."""
+        """Truncate text to a token budget (``max_length`` tokens by default)."""
         if max_length is None:
             max_length = self.max_length
 
-        # Simple character-based truncation (could be improved with tokenizer)
-        if len(text) <= max_length:
-            return text
-
-        # Try to cut at sentence boundary
-        truncated = text[:max_length]
-        last_sentence = truncated.rfind(".")
-        if (
-            last_sentence > max_length * 0.7
-        ):  # If we can find a sentence end in the last 30%
-            return truncated[: last_sentence + 1]
-
-        # Otherwise just cut and add ellipsis
-        return truncated[: max_length - 3] + "..."
+        return truncate_to_tokens(text, max_length, self.model_name, suffix="...")
 
     def create_query_passage_pairs(
         self, query: str, search_results: List[SearchResult]
@@ -100,6 +97,13 @@ class CrossEncoderReranker:
         """Create query-passage pairs for cross-encoder input."""
         pairs = []
 
+        # Query and passage share the model's max_length tokens; the query gets
+        # at most a quarter, plus a few tokens for separators
+        query_truncated = self.truncate_text(query, self.max_length // 4)
+        passage_tokens = (
+            self.max_length - estimate_tokens(query_truncated, self.model_name) - 3
+        )
+
         for result in search_results:
             # Enhance passage with metadata for better context
             passage = result.text
@@ -122,8 +126,7 @@ class CrossEncoderReranker:
                     passage = f"{context}\n{passage}"
 
             # Truncate to model limits
-            passage = self.truncate_text(passage)
-            query_truncated = self.truncate_text(query, 200)  # Shorter limit for query
+            passage = self.truncate_text(passage, passage_tokens)
 
             pairs.append((query_truncated, passage))
 
@@ -0,0 +1,200 @@
+"""
+Rescoring of saved results for Cyber-Policy-Bench.
+
+Results saved by an earlier run (``detailed_results.json`` or the
+``scored_results.jsonl`` stream) or the model response journal are streamed back through the scorers without touching the
+vector database or the evaluated models, so scoring changes can be iterated on
+without re-running the benchmark. Judge calls go through the usual verdict
+cache, so unchanged inputs cost nothing.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+try:
+    from .cache import JsonlCache
+    from .pipeline import stream_into_scoring
+    from .result_writer import ResultStreamWriter, iter_result_stream
+    from .utils import get_config_value
+except ImportError:
+    from src.cache import JsonlCache
+    from src.pipeline import stream_into_scoring
+    from src.result_writer import ResultStreamWriter, iter_result_stream
+    from src.utils import get_config_value
+
+# Fields written by scoring (or streaming), dropped so every result is scored
+# from scratch
+SCORE_FIELDS = ("scores", "accuracy_score", "task_index")
+
+
+def load_ideal_answers(questions_file: Optional[str] = None) -> Dict[str, str]:
+    """
+    Map each evaluation question to its ideal answer.
+
+    Args:
+        questions_file: Prompts JSONL file (``[Paths] prompts_file`` if None)
+
+    Returns:
+        Ideal answers keyed by question text
+    """
+    if questions_file is None:
+        questions_file = get_config_value(
+            "Paths", "prompts_file", "./data/prompts/cyber_evals.jsonl"
+        )
+
+    ideal_answers = {}
+    with open(questions_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                question = json.loads(line)
+                ideal_answers[question["input"]] = question["ideal"]
+    return ideal_answers
+
+
+def iter_detailed_results(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield unscored copies of the results in a ``detailed_results.json`` file.
+
+    Args:
+        path: Results file mapping model name to a list of result dicts
+
+    Yields:
+        Result dicts with ``model_name`` set and previous scores removed;
+        contexts stay ``context_hash`` references into the results' context store
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        saved_results = json.load(f)
+
+    for model_name, results in saved_results.items():
+        for result in results:
+            result = {k: v for k, v in result.items() if k not in SCORE_FIELDS}
+            result.setdefault("model_name", model_name)
+            yield result
+
+
+def iter_stream_results(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield unscored copies of the results in a result stream, one line at a time.
+
+    Args:
+        path: ``scored_results.jsonl`` or ``evaluation_results.jsonl``
+
+    Yields:
+        Result dicts with previous scores removed
+    """
+    for result in iter_result_stream(path):
+        yield {k: v for k, v in result.items() if k not in SCORE_FIELDS}
+
+
+def _is_response_journal(path: Union[str, Path]) -> bool:
+    """Whether a JSONL file is a response journal rather than a result stream."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    return "record" in json.loads(line)
+                except json.JSONDecodeError:
+                    return False
+    return False
+
+
+def iter_journal_results(
+    path: Union[str, Path], questions_file: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield results rebuilt from a model response journal.
+
+    The journal does not store ideal answers, so they are looked up in the
+    prompts file by question text; entries for unknown questions are skipped.
+
+    Args:
+        path: Response journal (``response_journal.jsonl``)
+        questions_file: Prompts JSONL file (``[Paths] prompts_file`` if None)
+
+    Yields:
+        Result dicts in the format produced by the evaluator
+    """
+    ideal_answers = load_ideal_answers(questions_file)
+    skipped = 0
+
+    with JsonlCache(path) as journal:
+        for record in journal.values():
+            ideal_answer = ideal_answers.get(record.get("question"))
+            if ideal_answer is None:
+                skipped += 1
+                continue
+
+            yield {
+                "question": record["question"],
+                "ideal_answer": ideal_answer,
+                "model_response": record["model_response"],
+                "model_name": record["model_name"],
+                "evaluation_mode": record["evaluation_mode"],
+                "context_provided": None,
+                "accuracy_score": None,
+                "timestamp": record.get("timestamp"),
+                "error_type": "error" if record.get("error") else None,
+            }
+
+    if skipped:
+        logging.getLogger(__name__).warning(
+            f"Skipped {skipped} journal entries whose question is not in the prompts file"
+        )
+
+
+def iter_saved_results(
+    path: Union[str, Path], questions_file: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield unscored results from a results file, result stream or response journal.
+
+    Args:
+        path: ``detailed_results.json``, a ``.jsonl`` result stream or a
+            ``.jsonl`` response journal
+        questions_file: Prompts file used to recover ideal answers for journals
+
+    Yields:
+        Result dicts ready for ``score_result``
+    """
+    if Path(path).suffix == ".jsonl":
+        if _is_response_journal(path):
+            return iter_journal_results(path, questions_file)
+        return iter_stream_results(path)
+    return iter_detailed_results(path)
+
+
+async def rescore_saved_results(
+    path: Union[str, Path],
+    scorer: Any,
+    scoring_methods: Optional[List] = None,
+    questions_file: Optional[str] = None,
+    result_writer: Optional[ResultStreamWriter] = None,
+) -> Dict[str, List[Dict]]:
+    """
+    Stream saved results through a scorer.
+
+    Args:
+        path: ``detailed_results.json``, a result stream or a response journal
+        scorer: Scorer exposing ``score_result(result, scoring_methods)``
+        scoring_methods: Scoring methods passed through to the scorer
+        questions_file: Prompts file used to recover ideal answers for journals
+        result_writer: Stream scored results are written to instead of being
+            collected
+
+    Returns:
+        Scored results grouped by model, in file order (empty if a
+        ``result_writer`` was given)
+    """
+    results = iter_saved_results(path, questions_file)
+
+    async def produce(sink) -> None:
+        for task_index, result in enumerate(results):
+            await sink(task_index, result)
+
+    return await stream_into_scoring(
+        produce, scorer, scoring_methods, result_writer=result_writer
+    )
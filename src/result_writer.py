@@ -0,0 +1,315 @@
+"""
+Streaming result files for Cyber-Policy-Bench.
+
+Results are written as JSONL, one record per line, as soon as they are
+produced, so a crashed run keeps everything written so far and no writer has
+to hold the whole result tree. Serialization, context compression and disk I/O
+happen on a background thread, off the event loop. ``compact_result_stream``
+turns a stream into the nested ``{model: [result, ...]}`` JSON that older
+tooling expects, and ``iter_result_stream`` reads a stream back one record at a
+time.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Self, Tuple, Union
+
+try:
+    from .context_store import ContextStore, externalize_context
+except ImportError:
+    from src.context_store import ContextStore, externalize_context
+
+# Line-per-result counterpart of detailed_results.json in a run directory
+SCORED_STREAM_FILENAME = "scored_results.jsonl"
+
+# Queue marker telling the writer thread to finish
+_CLOSE = object()
+
+# Records a bulk writer may queue ahead of the writer thread
+BULK_QUEUE_SIZE = 1000
+
+
+class ResultStreamWriter:
+    """Append result records to a JSONL file from a background thread.
+
+    ``write`` only enqueues the record, so callers on the event loop never wait
+    for serialization or disk I/O (unless ``max_queued`` records are already
+    waiting). Each line is flushed once written, so a crash loses at most the
+    records still queued. Records must not be modified after they are handed
+    to ``write``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        context_store: Optional[ContextStore] = None,
+        context_source: Optional[ContextStore] = None,
+        append: bool = False,
+        max_queued: int = 0,
+    ):
+        """
+        Open the stream and start the writer thread.
+
+        Args:
+            path: JSONL file to write
+            context_store: Store contexts are moved into (records then keep
+                only their ``context_hash``); contexts are kept inline if None
+            context_source: Store that records holding only a ``context_hash``
+                were loaded with
+            append: Append to an existing stream instead of replacing it
+            max_queued: Records that may wait for the writer thread before
+                ``write`` blocks (unbounded if 0); bulk writers set this so a
+                large source is never buffered whole
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.context_store = context_store
+        self.context_source = context_source
+        self.logger = logging.getLogger(__name__)
+
+        self.records_written = 0
+        self._error: Optional[Exception] = None
+        self._queue: queue.Queue = queue.Queue(max_queued)
+        self._closing = False
+        # Create (or truncate) the file here so open errors reach the caller;
+        # the writer thread then appends to it
+        with open(self.path, "a" if append else "w", encoding="utf-8"):
+            pass
+        self._thread = threading.Thread(
+            target=self._run, name=f"result-writer-{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Queue one record for writing."""
+        self._queue.put(record)
+
+    def _run(self) -> None:
+        """Writer thread: serialize and append queued records until closed."""
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                self._write_queued(f)
+        except Exception as e:  # noqa: BLE001 - raised by close()
+            self._fail(e)
+            # Keep draining so writers and close() never hang
+            while not self._closing:
+                self._closing = self._queue.get() is _CLOSE
+
+    def _write_queued(self, f) -> None:
+        """Write queued records to ``f`` until the close marker arrives."""
+        while True:
+            record = self._queue.get()
+            if record is _CLOSE:
+                self._closing = True
+                return
+            try:
+                if self.context_store is not None:
+                    record = externalize_context(
+                        record, self.context_store, self.context_source
+                    )
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                self.records_written += 1
+            except Exception as e:  # noqa: BLE001
+                # Keep draining so close() never hangs; the error is raised there
+                self._fail(e)
+
+    def _fail(self, error: Exception) -> None:
+        """Remember the first write error for close() to raise."""
+        if self._error is None:
+            self._error = error
+        self.logger.error(f"Failed to write result to {self.path}: {error}")
+
+    def close(self) -> None:
+        """Write every queued record, close the file and re-raise write errors."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def write_result_stream(
+    results: Dict[str, List[Dict[str, Any]]],
+    path: Union[str, Path],
+    context_store: Optional[ContextStore] = None,
+    context_source: Optional[ContextStore] = None,
+) -> Path:
+    """
+    Write grouped results as a stream, one record per line.
+
+    Args:
+        results: Results grouped by model
+        path: JSONL file to write
+        context_store: Store contexts are moved into (kept inline if None)
+        context_source: Store that hash-only records were loaded with
+
+    Returns:
+        Path of the written stream
+    """
+    return write_result_records(
+        (
+            (
+                result
+                if result.get("model_name") == model_name
+                else {**result, "model_name": model_name}
+            )
+            for model_name, model_results in results.items()
+            for result in model_results
+        ),
+        path,
+        context_store,
+        context_source,
+    )
+
+
+def write_result_records(
+    records: Iterable[Dict[str, Any]],
+    path: Union[str, Path],
+    context_store: Optional[ContextStore] = None,
+    context_source: Optional[ContextStore] = None,
+) -> Path:
+    """
+    Write result records as a stream, consuming them one at a time.
+
+    The file is written to a temporary path and moved into place once complete,
+    so ``records`` may be read from the stream being replaced.
+
+    Args:
+        records: Result dicts carrying ``model_name``, e.g. read with
+            ``iter_result_stream``
+        path: JSONL file to write
+        context_store: Store contexts are moved into (kept inline if None)
+        context_source: Store that hash-only records were loaded with
+
+    Returns:
+        Path of the written stream
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+    with ResultStreamWriter(
+        tmp_path, context_store, context_source, max_queued=BULK_QUEUE_SIZE
+    ) as writer:
+        for record in records:
+            writer.write(record)
+    os.replace(tmp_path, path)
+    return path
+
+
+def iter_result_stream(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Read a result stream one record at a time.
+
+    Blank and unparseable lines (such as a line cut off by a crash) are
+    skipped, so a stream can be read while it is still being written.
+
+    Args:
+        path: JSONL result stream
+
+    Yields:
+        Result records in file order
+    """
+    skipped = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                skipped += 1
+
+    if skipped:
+        logging.getLogger(__name__).warning(
+            f"Skipped {skipped} unreadable lines while reading {path}"
+        )
+
+
+def _index_stream(path: Path) -> Dict[str, List[Tuple[int, int]]]:
+    """Byte offsets of each model's records, in task index (else file) order."""
+    groups: Dict[str, List[Tuple[int, int, int]]] = {}
+    with open(path, "rb") as f:
+        position = 0
+        for line_number, line in enumerate(iter(f.readline, b"")):
+            offset, position = position, position + len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            task_index = record.get("task_index")
+            groups.setdefault(record.get("model_name", "unknown"), []).append(
+                (line_number if task_index is None else task_index, line_number, offset)
+            )
+
+    return {
+        model_name: [(line_number, offset) for _, line_number, offset in sorted(rows)]
+        for model_name, rows in groups.items()
+    }
+
+
+def compact_result_stream(
+    stream_path: Union[str, Path],
+    output_path: Union[str, Path],
+    exclude: Iterable[str] = ("task_index",),
+    indent: int = 2,
+) -> Path:
+    """
+    Rewrite a result stream as nested ``{model: [result, ...]}`` JSON.
+
+    The output matches what ``json.dump`` of the grouped results produces, but
+    only byte offsets are held in memory: records are read back one at a time
+    and written in task index order within each model.
+
+    Args:
+        stream_path: JSONL result stream
+        output_path: JSON file to write (replaced atomically)
+        exclude: Record fields left out of the compacted file
+        indent: JSON indentation
+
+    Returns:
+        Path of the written JSON file
+    """
+    stream_path, output_path = Path(stream_path), Path(output_path)
+    exclude = set(exclude)
+    groups = _index_stream(stream_path)
+
+    model_pad = " " * indent
+    record_pad = "\n" + " " * (2 * indent)
+    tmp_path = output_path.with_suffix(f".tmp{os.getpid()}")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(stream_path, "rb") as stream, open(
+        tmp_path, "w", encoding="utf-8"
+    ) as out:
+        out.write("{")
+        for group_number, (model_name, rows) in enumerate(groups.items()):
+            out.write("," if group_number else "")
+            out.write(f"\n{model_pad}{json.dumps(model_name, ensure_ascii=False)}: [")
+            for row_number, (_, offset) in enumerate(rows):
+                stream.seek(offset)
+                record = json.loads(stream.readline())
+                for field in exclude:
+                    record.pop(field, None)
+                text = json.dumps(
+                    record, indent=indent, ensure_ascii=False, default=str
+                )
+                out.write("," if row_number else "")
+                out.write(record_pad + text.replace("\n", record_pad))
+            out.write(f"\n{model_pad}]")
+        out.write("\n}" if groups else "}")
+
+    os.replace(tmp_path, output_path)
+    return output_path
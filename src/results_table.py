@@ -0,0 +1,330 @@
+"""
+Columnar results table for Cyber-Policy-Bench.
+
+Scored results arrive as nested ``{model: [result dict, ...]}`` mappings. The
+summary, reports and metadata analysis all need group-by statistics over them,
+so the results are flattened once into parallel NumPy columns (score, model,
+mode and question codes, question metadata codes and error flags). Every
+statistic is then a vectorized group-by over integer codes instead of another
+walk over the nested dicts.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Question metadata fields with one value per question
+METADATA_DIMENSIONS = ("difficulty", "category", "question_type")
+
+
+def _encode(value: str, index: Dict[str, int]) -> int:
+    """Code for ``value``, assigning the next free code to unseen values."""
+    code = index.get(value)
+    if code is None:
+        code = index[value] = len(index)
+    return code
+
+
+class ResultsTable:
+    """Scored results as parallel NumPy columns, one row per result.
+
+    Categorical columns hold integer codes; the matching labels are in
+    ``models``, ``modes``, ``questions`` and ``metadata_labels``, in order of
+    first appearance. Unscored results have a NaN score.
+    """
+
+    def __init__(
+        self,
+        score: np.ndarray,
+        model: np.ndarray,
+        mode: np.ndarray,
+        question: np.ndarray,
+        is_timeout: np.ndarray,
+        is_error: np.ndarray,
+        scoring_failure: np.ndarray,
+        models: List[str],
+        modes: List[str],
+        questions: List[str],
+    ):
+        """Wrap already encoded columns (use ``from_results`` to build a table)."""
+        self.score = score
+        self.model = model
+        self.mode = mode
+        self.question = question
+        self.is_timeout = is_timeout
+        self.is_error = is_error
+        self.scoring_failure = scoring_failure
+        self.models = models
+        self.modes = modes
+        self.questions = questions
+
+        # Per-row question metadata codes, filled in by attach_question_metadata
+        self.metadata: Dict[str, np.ndarray] = {}
+        self.metadata_labels: Dict[str, List[str]] = {}
+        self.framework_rows = np.empty(0, dtype=np.int64)
+        self.framework = np.empty(0, dtype=np.int32)
+        self.frameworks: List[str] = []
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Dict[str, Iterable[Dict[str, Any]]],
+        questions: Optional[List[Dict[str, Any]]] = None,
+    ) -> "ResultsTable":
+        """
+        Flatten scored results in a single pass.
+
+        Args:
+            results: Scored result dicts grouped by model
+            questions: Evaluation questions whose ``metadata`` should be
+                attached (looked up once per distinct question)
+
+        Returns:
+            Results table with one row per result, in model → result order
+        """
+        return cls._from_rows(
+            (
+                (model_name, result)
+                for model_name, model_results in results.items()
+                for result in model_results
+            ),
+            questions,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        questions: Optional[List[Dict[str, Any]]] = None,
+    ) -> "ResultsTable":
+        """
+        Build a table from ungrouped result records, consuming them one at a time.
+
+        Args:
+            records: Result dicts carrying ``model_name``, e.g. a result stream
+                read with ``iter_result_stream``
+            questions: Evaluation questions whose ``metadata`` should be attached
+
+        Returns:
+            Results table with one row per record, in record order
+        """
+        return cls._from_rows(
+            ((record.get("model_name", "unknown"), record) for record in records),
+            questions,
+        )
+
+    @classmethod
+    def _from_rows(
+        cls,
+        rows: Iterable[Tuple[str, Dict[str, Any]]],
+        questions: Optional[List[Dict[str, Any]]],
+    ) -> "ResultsTable":
+        """Encode (model name, result) pairs into columns."""
+        scores: List[float] = []
+        model_codes: List[int] = []
+        mode_codes: List[int] = []
+        question_codes: List[int] = []
+        timeouts: List[bool] = []
+        errors: List[bool] = []
+        failures: List[bool] = []
+
+        model_index: Dict[str, int] = {}
+        mode_index: Dict[str, int] = {}
+        question_index: Dict[str, int] = {}
+
+        for model_name, result in rows:
+            score = result.get("accuracy_score")
+            scores.append(np.nan if score is None else score)
+            model_codes.append(_encode(model_name, model_index))
+            mode_codes.append(
+                _encode(result.get("evaluation_mode", "unknown"), mode_index)
+            )
+            question_codes.append(_encode(result.get("question", ""), question_index))
+
+            # Deadline overruns are counted separately from other errors
+            error_type = result.get("error_type")
+            timeouts.append(error_type == "timeout")
+            errors.append(
+                error_type != "timeout"
+                and bool(
+                    error_type
+                    or (result.get("model_response") or "").startswith("Error:")
+                )
+            )
+            failures.append(bool((result.get("scores") or {}).get("error")))
+
+        table = cls(
+            score=np.asarray(scores, dtype=np.float64),
+            model=np.asarray(model_codes, dtype=np.int32),
+            mode=np.asarray(mode_codes, dtype=np.int32),
+            question=np.asarray(question_codes, dtype=np.int32),
+            is_timeout=np.asarray(timeouts, dtype=bool),
+            is_error=np.asarray(errors, dtype=bool),
+            scoring_failure=np.asarray(failures, dtype=bool),
+            models=list(model_index),
+            modes=list(mode_index),
+            questions=list(question_index),
+        )
+        if questions is not None:
+            table.attach_question_metadata(questions)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    @property
+    def scored(self) -> np.ndarray:
+        """Mask of rows that have a score."""
+        return ~np.isnan(self.score)
+
+    def attach_question_metadata(self, questions: List[Dict[str, Any]]) -> None:
+        """
+        Add difficulty, category, question type and framework codes.
+
+        Metadata is resolved once per distinct question; rows whose question
+        is unknown get ``"unknown"``. Questions can list several frameworks
+        (comma separated), so frameworks are stored exploded: one entry per
+        (row, framework) pair in ``framework_rows`` / ``framework``.
+
+        Args:
+            questions: Evaluation questions with ``input`` and ``metadata``
+        """
+        metadata_by_question = {q["input"]: q.get("metadata", {}) for q in questions}
+        question_metadata = [
+            metadata_by_question.get(question, {}) for question in self.questions
+        ]
+
+        for dimension in METADATA_DIMENSIONS:
+            index: Dict[str, int] = {}
+            per_question = np.asarray(
+                [
+                    _encode(metadata.get(dimension, "unknown"), index)
+                    for metadata in question_metadata
+                ],
+                dtype=np.int32,
+            )
+            self.metadata[dimension] = per_question[self.question]
+            self.metadata_labels[dimension] = list(index)
+
+        # Exploded (row, framework) pairs, built from per-question code lists
+        framework_index: Dict[str, int] = {}
+        per_question_frameworks = [
+            [
+                _encode(framework.strip(), framework_index)
+                for framework in metadata.get("framework", "unknown").split(",")
+            ]
+            for metadata in question_metadata
+        ]
+        counts = np.asarray([len(codes) for codes in per_question_frameworks])
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        flat = np.asarray(
+            [code for codes in per_question_frameworks for code in codes],
+            dtype=np.int32,
+        )
+
+        row_counts = counts[self.question] if len(self) else np.empty(0, np.int64)
+        self.framework_rows = np.repeat(np.arange(len(self)), row_counts)
+        row_starts = np.cumsum(row_counts) - row_counts
+        positions = np.arange(len(self.framework_rows)) - np.repeat(
+            row_starts, row_counts
+        )
+        self.framework = flat[offsets[self.question[self.framework_rows]] + positions]
+        self.frameworks = list(framework_index)
+
+    def group_count(
+        self, codes: np.ndarray, n_groups: int, mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Count rows per group code.
+
+        Args:
+            codes: Group code per row
+            n_groups: Number of groups
+            mask: Only count rows where the mask is True
+
+        Returns:
+            Row count per group
+        """
+        if mask is not None:
+            codes = codes[mask]
+        return np.bincount(codes, minlength=n_groups)
+
+    def group_stats(
+        self,
+        codes: np.ndarray,
+        n_groups: int,
+        scores: Optional[np.ndarray] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score statistics of scored rows per group code.
+
+        Args:
+            codes: Group code per row (aligned with ``scores``)
+            n_groups: Number of groups
+            scores: Score per row (the table's score column if None)
+
+        Returns:
+            Arrays ``count``, ``total``, ``total_sq``, ``mean``, ``min`` and
+            ``max`` indexed by group code; mean, min and max are NaN for groups
+            without scores
+        """
+        if scores is None:
+            scores = self.score
+        scored = ~np.isnan(scores)
+        codes = codes[scored]
+        scores = scores[scored]
+
+        count = np.bincount(codes, minlength=n_groups)
+        total = np.bincount(codes, weights=scores, minlength=n_groups)
+        total_sq = np.bincount(codes, weights=scores * scores, minlength=n_groups)
+
+        minimum = np.full(n_groups, np.inf)
+        maximum = np.full(n_groups, -np.inf)
+        np.minimum.at(minimum, codes, scores)
+        np.maximum.at(maximum, codes, scores)
+
+        empty = count == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+        mean[empty] = np.nan
+        minimum[empty] = np.nan
+        maximum[empty] = np.nan
+
+        return {
+            "count": count,
+            "total": total,
+            "total_sq": total_sq,
+            "mean": mean,
+            "min": minimum,
+            "max": maximum,
+        }
+
+    def describe_groups(
+        self, codes: np.ndarray, labels: List[str], scores: Optional[np.ndarray] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Count, average, min and max per group label, for groups with scores.
+
+        Args:
+            codes: Group code per row (aligned with ``scores``)
+            labels: Label of each group code
+            scores: Score per row (the table's score column if None)
+
+        Returns:
+            Statistics keyed by label, in code order
+        """
+        stats = self.group_stats(codes, len(labels), scores)
+        return {
+            label: {
+                "count": int(stats["count"][code]),
+                "average": float(stats["mean"][code]),
+                "min": float(stats["min"][code]),
+                "max": float(stats["max"][code]),
+            }
+            for code, label in enumerate(labels)
+            if stats["count"][code]
+        }
+
+    def framework_scores(self) -> np.ndarray:
+        """Score of each exploded (row, framework) pair."""
+        return self.score[self.framework_rows]
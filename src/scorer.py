@@ -1,16 +1,77 @@
 import asyncio
 import json
-from typing import List, Dict, Any, Optional
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import re
+import time
+import numpy as np
 import openai
 
-from .utils import get_config_value, get_openai_client, get_config, ConfigError
+from .utils import (
+    get_config_value,
+    estimate_tokens,
+    get_error_status_code,
+    get_openai_client,
+    get_config,
+    is_context_length_error,
+    is_retryable_error,
+    retry_with_backoff,
+    truncate_to_tokens,
+    ConfigError,
+)
+from .llm_client import RequestTimeoutError, chat_completion
+from .hedging import get_hedging_policy
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .cache import JsonlCache, make_cache_key
+from .control_catalog import (
+    ControlCatalog,
+    get_control_catalog,
+    scan_control_references,
+    set_control_catalog,
+)
+from .models import get_model_context_length
 
 # Load configuration
 config = get_config()
 
+# Bump whenever the judge prompt or parsing changes so cached verdicts are not reused
+JUDGE_PROMPT_VERSION = "2"
+
+# Response schema for single judge verdicts, sent as response_format when the
+# judge supports structured output
+JUDGE_VERDICT_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "judge_verdict",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "score": {"type": "number"},
+                "explanation": {"type": "string"},
+            },
+            "required": ["score", "explanation"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Tokens kept free in every judge call for the prompt template and the verdict
+JUDGE_RESERVED_TOKENS = 800
+
+# Tokens of verdict output allowed per response in a batched judge call
+BATCH_VERDICT_TOKENS = 120
+
+# Judge models whose provider rejected response_format in this process
+_structured_output_rejected: set = set()
+
 
 class ScoringMethod(Enum):
     EXACT_MATCH = "exact_match"
@@ -32,102 +93,1029 @@ class ScoringResult:
     details: Optional[Dict[str, Any]] = None
 
 
-class AccuracyScorer:
-    """Scorer for evaluating model responses against ground truth answers."""
-
-    def __init__(
-        self,
-        judge_model: str = None,
-        client: Optional[openai.OpenAI] = None,
-        config_overrides: Optional[Dict[str, Any]] = None,
+# Term lists and patterns used by the heuristic scorers, built once at import
+NON_SUBSTANTIVE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in [
+        r"^(i don't know|don't know|not sure|no idea|can't help|cannot help)[\.\!]?\s*$",
+        r"^(n/a|na|none|null|undefined)[\.\!]?\s*$",
+        r"^(sorry|apologize).*(cannot|can't|unable).*$",
+        r"^(please|try).*contact.*$",
+    ]
+]
+
+GENERIC_INDICATORS = (
+    "thank you for your question",
+    "this is an interesting question",
+    "let me help you with that",
+    "here are some general guidelines",
+)
+
+CYBERSECURITY_TERMS = (
+    "security",
+    "compliance",
+    "control",
+    "framework",
+    "risk",
+    "vulnerability",
+    "threat",
+    "policy",
+    "governance",
+    "audit",
+    "incident",
+    "breach",
+    "encryption",
+    "access",
+    "authentication",
+    "authorization",
+    "monitoring",
+    "gdpr",
+    "hipaa",
+    "sox",
+    "pci",
+    "nist",
+    "iso",
+    "soc",
+    "cmmc",
+    "fedramp",
+)
+
+TECHNICAL_INDICATORS = (
+    "configuration",
+    "implementation",
+    "architecture",
+    "deployment",
+    "monitoring",
+    "logging",
+    "alerting",
+    "incident response",
+    "backup",
+    "recovery",
+    "encryption",
+    "key management",
+)
+
+# Keywords accepted as an explanation by the structural check
+EXPLANATORY_KEYWORDS = (
+    "because",
+    "since",
+    "as",
+    "due to",
+    "requires",
+    "mandates",
+    "specifies",
+)
+
+# Stricter explanatory language counted by the completeness check
+EXPLANATORY_INDICATORS = (
+    "because",
+    "since",
+    "due to",
+    "as a result",
+    "therefore",
+    "consequently",
+    "reason",
+    "purpose",
+)
+
+IMPLEMENTATION_TERMS = (
+    "configure",
+    "setup",
+    "deploy",
+    "install",
+    "enable",
+    "create",
+    "establish",
+    "develop",
+)
+
+VERBOSE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"it is important to note that",
+        r"it should be noted that",
+        r"please be advised that",
+        r"it is worth mentioning",
+        r"as previously mentioned",
+        r"furthermore, it is essential",
+    ]
+]
+
+STRUCTURE_INDICATORS = [
+    re.compile(pattern)
+    for pattern in [
+        r"##\s+\w+",  # Section headers
+        r"\d+\.\s+",  # Numbered lists
+        r"\*\*\w+\*\*",  # Bold headers
+        r"\|\s*\w+\s*\|",  # Table structure
+    ]
+]
+
+# Sections required by the short_prompt.md policy format
+POLICY_SECTION_PATTERNS = [
+    r"##\s*Purpose\s*&\s*Scope",
+    r"##\s*Policy\s*Statements?",
+    r"##\s*Roles?\s*&\s*Responsibilities",
+    r"##\s*Compliance\s*&\s*Enforcement",
+    r"##\s*Review\s*Cycle",
+    r"##\s*Framework\s*Mappings?",
+]
+_POLICY_SECTION_REGEXES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in POLICY_SECTION_PATTERNS
+]
+
+_MAPPING_TABLE_REGEX = re.compile(
+    r"\|\s*Policy\s*\|\s*\w+\s*Control\s*\||\|\s*\w+\s*Control\s*\|\s*\w+",
+    re.IGNORECASE,
+)
+_BULLET_LINE_REGEX = re.compile(r"^[\s]*[-*•]\s", re.MULTILINE)
+_NUMBERED_LINE_REGEX = re.compile(r"^[\s]*\d+[\.\)]\s", re.MULTILINE)
+_LIST_ITEM_REGEX = re.compile(r"^\s*\d+[\.\)]\s|\s*[-*•]\s", re.MULTILINE)
+_SECTION_BREAK_REGEX = re.compile(r"\n\n|---|\*\*|##|\d+\.|[A-Z]\)")
+
+QUESTION_TYPE_INDICATORS = {
+    "framework": ("framework", "standard", "regulation", "compliance"),
+    "control": ("control", "requirement", "safeguard", "measure"),
+    "implementation": ("implement", "deploy", "configure", "setup"),
+    "risk": ("risk", "threat", "vulnerability", "assessment"),
+    "policy": ("policy", "procedure", "guideline", "document"),
+    "technical": ("technical", "system", "technology", "architecture"),
+}
+
+FRAMEWORK_PATTERNS = {
+    "nist": ("nist", "800-53", "800-171", "csf", "cybersecurity framework"),
+    "gdpr": ("gdpr", "general data protection", "article"),
+    "hipaa": ("hipaa", "health insurance", "164."),
+    "sox": ("sox", "sarbanes", "sarbanes-oxley"),
+    "pci": ("pci", "payment card", "pci-dss", "pci dss"),
+    "iso": ("iso", "27001", "27002"),
+    "soc": ("soc", "soc 2", "soc2", "trust services"),
+    "cmmc": ("cmmc", "cybersecurity maturity"),
+    "fedramp": ("fedramp", "federal risk"),
+}
+
+STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "will",
+        "would",
+        "should",
+        "must",
+        "can",
+        "could",
+        "may",
+        "might",
+    }
+)
+
+# Word fragments that mark an ideal-answer term as a key concept
+KEY_CONCEPT_FRAGMENTS = (
+    "security",
+    "compliance",
+    "control",
+    "policy",
+    "risk",
+    "framework",
+    "audit",
+    "governance",
+)
+
+
+# Known valid control patterns for major frameworks, used when no control
+# catalog could be built from the framework corpus
+BUILTIN_VALID_CONTROLS = {
+    "SOC2": {
+        "CC1": {1, 2, 3, 4, 5},
+        "CC2": {1, 2, 3},
+        "CC3": {1, 2, 3, 4},
+        "CC4": {1, 2},
+        "CC5": {1, 2, 3},
+        "CC6": {1, 2, 3, 4, 5, 6, 7, 8},
+        "CC7": {1, 2, 3, 4, 5},
+        "CC8": {1},
+        "CC9": {1, 2},
+        "A1": {1, 2, 3},
+        "PI1": {1, 2, 3},
+        "P1": {1, 2},
+        "P2": {1, 2},
+        "P3": {1, 2},
+        "P4": {1, 2, 3},
+        "P5": {1, 2},
+        "P6": {1, 2, 3},
+        "P7": {1},
+        "P8": {1},
+        "C1": {1, 2},
+    },
+    "NIST_CSF": {
+        "ID": {"AM", "BE", "GV", "RA", "RM", "SC"},
+        "PR": {"AC", "AT", "DS", "IP", "MA", "PT"},
+        "DE": {"AE", "CM", "DP"},
+        "RS": {"RP", "CO", "AN", "MI", "IM"},
+        "RC": {"RP", "IM", "CO"},
+    },
+    "GDPR_ARTICLES": set(range(1, 100)),  # Articles 1-99
+    "NIST_800_53": {
+        "AC": set(range(1, 26)),
+        "AT": set(range(1, 6)),
+        "AU": set(range(1, 17)),
+        "CA": set(range(1, 10)),
+        "CM": set(range(1, 15)),
+        "CP": set(range(1, 14)),
+        "IA": set(range(1, 13)),
+        "IR": set(range(1, 11)),
+        "MA": set(range(1, 8)),
+        "MP": set(range(1, 9)),
+        "PE": set(range(1, 21)),
+        "PL": set(range(1, 12)),
+        "PS": set(range(1, 9)),
+        "PT": set(range(1, 9)),
+        "RA": set(range(1, 11)),
+        "SA": set(range(1, 23)),
+        "SC": set(range(1, 54)),
+        "SI": set(range(1, 24)),
+        "SR": set(range(1, 13)),
+    },
+}
+
+_SOC2_CONTROL_REGEX = re.compile(r"([A-Z]{1,3})(\d+)\.(\d+)")
+_CSF_CONTROL_REGEX = re.compile(r"([A-Z]{2})\.([A-Z]{2})-(\d+)")
+_GDPR_ARTICLE_REGEX = re.compile(r"ARTICLE\s+(\d+)")
+_NIST_800_53_CONTROL_REGEX = re.compile(r"([A-Z]{2,4})-(\d+)")
+
+
+def _is_builtin_valid_control(control: str) -> bool:
+    """Check a control reference against BUILTIN_VALID_CONTROLS."""
+    # Check SOC 2 controls
+    soc2_match = _SOC2_CONTROL_REGEX.match(control)
+    if soc2_match:
+        prefix, _, minor = soc2_match.groups()  # major not used in current logic
+        if int(minor) in BUILTIN_VALID_CONTROLS["SOC2"].get(prefix, ()):
+            return True
+
+    # Check NIST CSF controls
+    csf_match = _CSF_CONTROL_REGEX.match(control)
+    if csf_match:
+        function, category, _ = csf_match.groups()
+        if category in BUILTIN_VALID_CONTROLS["NIST_CSF"].get(function, ()):
+            return True
+
+    # Check GDPR Articles
+    gdpr_match = _GDPR_ARTICLE_REGEX.search(control.upper())
+    if (
+        gdpr_match
+        and int(gdpr_match.group(1)) in BUILTIN_VALID_CONTROLS["GDPR_ARTICLES"]
     ):
-        """Initialize scorer with injected dependencies.
+        return True
+
+    # Check NIST 800-53 controls
+    nist_match = _NIST_800_53_CONTROL_REGEX.match(control)
+    if nist_match:
+        family, num = nist_match.groups()
+        if int(num) in BUILTIN_VALID_CONTROLS["NIST_800_53"].get(family, ()):
+            return True
+
+    return False
+
+
+@dataclass(frozen=True)
+class ResponseAnalysis:
+    """Response features shared by the heuristic scorers, computed once per text."""
+
+    text: str
+    lower: str
+    is_valid: bool
+    failure_reason: str
+    char_count: int
+    word_count: int
+    controls: Tuple[str, ...]
+    has_bullets: bool
+    has_numbers: bool
+    has_list_items: bool
+    has_section_breaks: bool
+    policy_sections: Tuple[bool, ...]
+    has_mapping_table: bool
+    verbose_phrase_count: int
+    structure_indicator_counts: Tuple[int, ...]
+    cybersecurity_term_count: int
+    technical_term_count: int
+    has_explanatory_keyword: bool
+    explanatory_indicator_count: int
+    implementation_term_count: int
+
+
+def _validate_text(stripped: str, stripped_lower: str, word_count: int) -> str:
+    """Return the reason a response fails basic validation, or "" if it passes."""
+    if not stripped:
+        return "Empty or whitespace-only response"
+
+    # Check for error messages
+    if stripped_lower.startswith("error:") or stripped.startswith("MODEL_FAILURE:"):
+        return "Model returned error message"
+
+    # Check for extremely short responses (likely incomplete)
+    if len(stripped) < 10:
+        return f"Response too short ({len(stripped)} chars)"
+
+    # Check for non-substantive responses
+    if any(pattern.match(stripped_lower) for pattern in NON_SUBSTANTIVE_PATTERNS):
+        return "Non-substantive response"
+
+    # Only flag generic/template content as invalid if the response is short
+    if word_count < 50 and any(
+        indicator in stripped_lower for indicator in GENERIC_INDICATORS
+    ):
+        return "Generic template response"
+
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _analyze_response(text: str) -> ResponseAnalysis:
+    """Scan a response once for every feature the heuristic scorers use.
+
+    Memoized because composite scoring runs several scorers over the same
+    response.
+    """
+    lower = text.lower()
+    word_count = len(lower.split())
+
+    if not text:
+        failure_reason = "Empty or null response"
+    else:
+        failure_reason = _validate_text(text.strip(), lower.strip(), word_count)
+
+    return ResponseAnalysis(
+        text=text,
+        lower=lower,
+        is_valid=not failure_reason,
+        failure_reason=failure_reason,
+        char_count=len(text),
+        word_count=word_count,
+        controls=scan_control_references(text),
+        has_bullets=bool(_BULLET_LINE_REGEX.search(text)),
+        has_numbers=bool(_NUMBERED_LINE_REGEX.search(text)),
+        has_list_items=bool(_LIST_ITEM_REGEX.search(text)),
+        has_section_breaks=bool(_SECTION_BREAK_REGEX.search(text)),
+        policy_sections=tuple(
+            bool(regex.search(text)) for regex in _POLICY_SECTION_REGEXES
+        ),
+        has_mapping_table=bool(_MAPPING_TABLE_REGEX.search(text)),
+        verbose_phrase_count=sum(
+            len(pattern.findall(text)) for pattern in VERBOSE_PATTERNS
+        ),
+        structure_indicator_counts=tuple(
+            len(pattern.findall(text)) for pattern in STRUCTURE_INDICATORS
+        ),
+        cybersecurity_term_count=sum(
+            1 for term in CYBERSECURITY_TERMS if term in lower
+        ),
+        technical_term_count=sum(1 for term in TECHNICAL_INDICATORS if term in lower),
+        has_explanatory_keyword=any(
+            keyword in lower for keyword in EXPLANATORY_KEYWORDS
+        ),
+        explanatory_indicator_count=sum(
+            1 for indicator in EXPLANATORY_INDICATORS if indicator in lower
+        ),
+        implementation_term_count=sum(
+            1 for term in IMPLEMENTATION_TERMS if term in lower
+        ),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _key_concept_terms(ideal_answer: str) -> Tuple[str, ...]:
+    """Extract the key cybersecurity terms of an ideal answer, in order."""
+    ideal_words = [
+        word.strip(".,!?()[]{}")
+        for word in ideal_answer.lower().split()
+        if len(word) > 3 and word not in STOP_WORDS
+    ]
+    return tuple(
+        word
+        for word in ideal_words
+        if any(fragment in word for fragment in KEY_CONCEPT_FRAGMENTS)
+    )
+
+
+def attach_scores(
+    result: Dict[str, Any], scores: Dict[ScoringMethod, ScoringResult]
+) -> Dict[str, Any]:
+    """Return a copy of an evaluation result with its scores and primary accuracy score."""
+    result_with_scores = dict(result)
+    result_with_scores["scores"] = {
+        method.value: {
+            "score": scoring_result.accuracy_score,
+            "explanation": scoring_result.explanation,
+            "details": scoring_result.details,
+        }
+        for method, scoring_result in scores.items()
+    }
+
+    # Set primary accuracy score (use LLM judge if available, otherwise control reference)
+    if ScoringMethod.LLM_JUDGE in scores:
+        result_with_scores["accuracy_score"] = scores[
+            ScoringMethod.LLM_JUDGE
+        ].accuracy_score
+    elif ScoringMethod.CONTROL_REFERENCE in scores:
+        result_with_scores["accuracy_score"] = scores[
+            ScoringMethod.CONTROL_REFERENCE
+        ].accuracy_score
+    else:
+        result_with_scores["accuracy_score"] = 0.0
+
+    return result_with_scores
+
+
+def scoring_error_result(result: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    """Return a copy of an evaluation result marked as a scoring failure."""
+    result_with_scores = dict(result)
+    result_with_scores["accuracy_score"] = 0.0
+    result_with_scores["scores"] = {"error": str(error)}
+    return result_with_scores
+
+
+async def score_evaluation_result(
+    score_response: Callable[..., Awaitable[Dict[ScoringMethod, ScoringResult]]],
+    result: Dict[str, Any],
+    scoring_methods: Optional[List[ScoringMethod]] = None,
+) -> Dict[str, Any]:
+    """
+    Score one evaluation result with a scorer's ``score_response``.
+
+    Args:
+        score_response: Scorer coroutine taking (question, response, ideal,
+            methods, model_name=...)
+        result: Evaluation result dict
+        scoring_methods: Methods to apply (control reference and LLM judge if None)
+
+    Returns:
+        Scored copy of the result, or a copy marked as a scoring failure
+    """
+    if scoring_methods is None:
+        scoring_methods = [ScoringMethod.CONTROL_REFERENCE, ScoringMethod.LLM_JUDGE]
+
+    try:
+        scores = await score_response(
+            result["question"],
+            result["model_response"],
+            result["ideal_answer"],
+            scoring_methods,
+            model_name=result.get("model_name"),
+        )
+        return attach_scores(result, scores)
+
+    except Exception as e:  # noqa: BLE001 - recorded as a scoring failure
+        print(f"  Error scoring result for {result.get('model_name')}: {e}")
+        return scoring_error_result(result, e)
+
+
+def judge_failed(judge_result: Any) -> bool:
+    """Whether a judge call produced no verdict (a verdict of 0.0 is not a failure).
+
+    Args:
+        judge_result: ScoringResult of a judge call, or the exception it raised
+
+    Returns:
+        True if the call raised or its details carry an ``error``
+    """
+    if not isinstance(judge_result, ScoringResult):
+        return True
+    return bool((judge_result.details or {}).get("error"))
+
+
+@lru_cache(maxsize=64)
+def get_judge_input_budget(judge_model: Optional[str] = None) -> int:
+    """Token budget for the question, response and ideal answer of one judge prompt.
+
+    The judge's context window (from ``ModelInfo.context_length``) minus
+    ``JUDGE_RESERVED_TOKENS``, capped at ``[Scoring] max_judge_input_tokens``
+    so prompt size does not grow with the judge's context window.
+    """
+    context_length = get_model_context_length(judge_model or "")
+    max_input_tokens = get_config_value("Scoring", "max_judge_input_tokens", 6000, int)
+    return max(256, min(max_input_tokens, context_length - JUDGE_RESERVED_TOKENS))
+
+
+def truncate_judge_inputs(
+    question: str,
+    model_response: str,
+    ideal_answer: str,
+    judge_model: Optional[str] = None,
+) -> tuple:
+    """Truncate judge inputs by estimated tokens to fit the judge's input budget.
+
+    The ideal answer keeps up to half the budget and the question up to a
+    quarter; the model response gets whatever is left.
+    """
+    budget = get_judge_input_budget(judge_model)
+    total = (
+        estimate_tokens(question, judge_model)
+        + estimate_tokens(model_response, judge_model)
+        + estimate_tokens(ideal_answer, judge_model)
+    )
+    if total <= budget:
+        return question, model_response, ideal_answer
+
+    ideal_answer = truncate_to_tokens(ideal_answer, budget // 2, judge_model)
+    question = truncate_to_tokens(question, budget // 4, judge_model)
+    remaining = (
+        budget
+        - estimate_tokens(ideal_answer, judge_model)
+        - estimate_tokens(question, judge_model)
+    )
+    model_response = truncate_to_tokens(model_response, remaining, judge_model)
+
+    return question, model_response, ideal_answer
+
+
+def _batch_label(index: int) -> str:
+    """Anonymous label for the index-th response in a batched judge prompt (A..Z, AA..)."""
+    label = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(ord("A") + remainder) + label
+    return label
+
+
+class JudgeParseError(ValueError):
+    """Raised when no numeric score can be recovered from a judge reply."""
+
+
+_SCORE_FIELD_REGEX = re.compile(
+    r'["\']?score["\']?\s*[:=]\s*"?(-?[0-9]*\.?[0-9]+)', re.IGNORECASE
+)
+_EXPLANATION_FIELD_REGEX = re.compile(
+    r'"explanation"\s*:\s*"((?:[^"\\]|\\.)*)', re.IGNORECASE
+)
+
+
+def clamp_score(score: Any) -> float:
+    """Coerce a judge score to a float in [0, 1]; NaN and non-numbers become 0."""
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return 0.0
+    if math.isnan(score):
+        return 0.0
+    return min(1.0, max(0.0, score))
+
+
+def _iter_json_values(text: str):
+    """Yield every JSON object or array embedded in ``text``, in order."""
+    decoder = json.JSONDecoder()
+    index = 0
+    while True:
+        starts = [i for i in (text.find("{", index), text.find("[", index)) if i >= 0]
+        if not starts:
+            return
+        start = min(starts)
+        try:
+            value, end = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            index = start + 1
+            continue
+        yield value
+        index = end
+
+
+def parse_judge_verdict(judge_response: str) -> Tuple[float, str]:
+    """Parse a single judge reply into a clamped (score, explanation).
+
+    Accepts plain JSON, JSON wrapped in prose or code fences, and replies cut
+    off mid-explanation (the score is recovered from the partial object).
+
+    Raises:
+        JudgeParseError: If the reply contains no score, or a non-numeric one
+            such as ``null`` or ``"N/A"``
+    """
+    for value in _iter_json_values(judge_response):
+        if isinstance(value, dict) and "score" in value:
+            try:
+                score = float(value["score"])
+            except (TypeError, ValueError):
+                raise JudgeParseError(f"Non-numeric score: {value['score']!r}")
+            explanation = value.get("explanation") or "No explanation provided"
+            return clamp_score(score), str(explanation)
+
+    score_match = _SCORE_FIELD_REGEX.search(judge_response)
+    if not score_match:
+        raise JudgeParseError("Could not parse score from response")
+
+    explanation_match = _EXPLANATION_FIELD_REGEX.search(judge_response)
+    if explanation_match:
+        explanation = explanation_match.group(1).replace('\\"', '"')
+    else:
+        explanation = "Extracted from non-JSON response"
+    return clamp_score(score_match.group(1)), explanation
+
+
+def _parse_batch_verdicts(judge_response: str) -> Dict[str, Dict[str, Any]]:
+    """Parse a batched judge reply into {label: {"score", "explanation"}}.
+
+    Items with a missing label or a non-numeric score are left out, so the
+    caller can fall back to single judging for them.
+    """
+    items = next(
+        (
+            value
+            for value in _iter_json_values(judge_response)
+            if isinstance(value, list)
+        ),
+        [],
+    )
+
+    verdicts = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            label = str(item["label"]).strip().upper()
+            score = float(item["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        verdicts[label] = {
+            "score": clamp_score(score),
+            "explanation": item.get("explanation", "No explanation provided"),
+        }
+    return verdicts
+
+
+async def score_results_concurrently(
+    score_result: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    evaluation_results: Dict[str, List],
+    concurrency: int = None,
+) -> Dict[str, List]:
+    """Score all results concurrently under a shared limit, preserving per-model order."""
+    if concurrency is None:
+        concurrency = get_config_value("Scoring", "scoring_concurrency", 5, int)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    total = sum(len(results) for results in evaluation_results.values())
+    completed = 0
+
+    async def score_one(result: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal completed
+        async with semaphore:
+            scored = await score_result(result)
+        completed += 1
+        if completed % 10 == 0 or completed == total:
+            print(f"  Scored {completed}/{total} results")
+        return scored
+
+    print(
+        f"Scoring {total} results for {len(evaluation_results)} models "
+        f"({concurrency} concurrent)..."
+    )
+    per_model = await asyncio.gather(
+        *(
+            asyncio.gather(*(score_one(result) for result in results))
+            for results in evaluation_results.values()
+        )
+    )
 
-        Args:
-            judge_model: Model to use for scoring
-            client: OpenAI client for API calls
-            config_overrides: Override configuration values
-        """
-        self.config_overrides = config_overrides or {}
+    scored_results = {}
+    for model_name, scored in zip(evaluation_results, per_model):
+        scored_results[model_name] = list(scored)
+        print(f"  Completed scoring for {model_name}")
 
-        if judge_model is None:
-            judge_model = self.config_overrides.get(
-                "primary_judge", get_config_value("Scoring", "primary_judge", "")
+    return scored_results
+
+
+# Scoring methods computed by rules alone, which can run outside the event loop
+HEURISTIC_METHODS = frozenset(
+    {
+        ScoringMethod.EXACT_MATCH,
+        ScoringMethod.CONTROL_REFERENCE,
+        ScoringMethod.STRUCTURAL_VALIDATION,
+        ScoringMethod.CITATION_VERIFICATION,
+        ScoringMethod.CONTEXTUAL_RELEVANCE,
+        ScoringMethod.COMPLETENESS,
+    }
+)
+
+# Per-process scorer used by heuristic pool workers
+_worker_scorer: Optional["HeuristicScorer"] = None
+
+
+def _init_heuristic_worker(catalog: Optional[ControlCatalog]) -> None:
+    """Pool worker initializer: use the parent's control catalog read-only."""
+    set_control_catalog(catalog)
+
+
+def _score_heuristic_chunk(
+    items: List[Tuple[str, str, str]], methods: List[ScoringMethod]
+) -> List[Any]:
+    """Score a chunk of (question, response, ideal) items in a pool worker.
+
+    Each entry is either the scores dict or the exception raised for that item,
+    so one bad result does not fail its whole chunk.
+    """
+    global _worker_scorer
+    if _worker_scorer is None:
+        _worker_scorer = HeuristicScorer()
+
+    scored = []
+    for question, model_response, ideal_answer in items:
+        try:
+            scored.append(
+                _worker_scorer.score_heuristics(
+                    question, model_response, ideal_answer, methods
+                )
+            )
+        except Exception as e:  # noqa: BLE001 - re-raised per result in the parent
+            scored.append(e)
+    return scored
+
+
+def get_heuristic_workers() -> int:
+    """Get the configured heuristic process count (0 scores on the event loop)."""
+    workers = get_config_value("Scoring", "heuristic_workers", 0, int)
+    if workers < 0:
+        # Negative means one worker per CPU core
+        workers = os.cpu_count() or 1
+    return workers
+
+
+async def score_results_offloaded(
+    score_response: Callable[..., Awaitable[Dict[ScoringMethod, ScoringResult]]],
+    evaluation_results: Dict[str, List],
+    scoring_methods: List[ScoringMethod],
+    heuristic_methods: List[ScoringMethod],
+    max_workers: int = None,
+    chunk_size: int = None,
+) -> Dict[str, List]:
+    """
+    Score results with heuristic methods in a process pool and judges on the loop.
+
+    Heuristic scoring is submitted up front in chunks, so it runs on every core
+    while judge calls proceed concurrently; each result's scores are merged
+    back in ``scoring_methods`` order.
+
+    Args:
+        score_response: Scorer coroutine taking (question, response, ideal, methods)
+        evaluation_results: Results keyed by model name
+        scoring_methods: All requested scoring methods
+        heuristic_methods: Methods to compute in the process pool
+        max_workers: Pool size (defaults to [Scoring] heuristic_workers)
+        chunk_size: Results per pool task (defaults to [Scoring] heuristic_chunk_size)
+
+    Returns:
+        Scored results keyed by model name, in input order
+    """
+    if max_workers is None:
+        max_workers = get_heuristic_workers()
+    if chunk_size is None:
+        chunk_size = get_config_value("Scoring", "heuristic_chunk_size", 32, int)
+    chunk_size = max(1, chunk_size)
+
+    offloaded = [method for method in scoring_methods if method in heuristic_methods]
+    judged = [method for method in scoring_methods if method not in heuristic_methods]
+
+    all_results = [r for results in evaluation_results.values() for r in results]
+    items = [
+        (r.get("question"), r.get("model_response"), r.get("ideal_answer"))
+        for r in all_results
+    ]
+
+    # Load (or rebuild) the control catalog once here; workers get a copy and
+    # never build or write the persisted index themselves
+    catalog = (
+        get_control_catalog()
+        if ScoringMethod.CITATION_VERIFICATION in offloaded
+        else None
+    )
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=max(1, max_workers),
+        initializer=_init_heuristic_worker,
+        initargs=(catalog,),
+    ) as pool:
+        chunks = [
+            loop.run_in_executor(
+                pool,
+                _score_heuristic_chunk,
+                items[start : start + chunk_size],
+                offloaded,
             )
+            for start in range(0, len(items), chunk_size)
+        ]
+        print(
+            f"Scoring {', '.join(m.value for m in offloaded)} for {len(items)} results "
+            f"in {len(chunks)} chunks ({max(1, max_workers)} processes)..."
+        )
+        positions = {id(r): index for index, r in enumerate(all_results)}
 
-            if not judge_model:
-                # Get from judge models list
-                judge_models_str = get_config_value("Models", "judge_models", "")
-                if not judge_models_str:
-                    raise ConfigError(
-                        "No judge models configured in [Models] or [Scoring] sections"
+        async def score_result(result: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                question = result["question"]
+                model_response = result["model_response"]
+                ideal_answer = result["ideal_answer"]
+
+                scores = {}
+                if judged:
+                    scores = await score_response(
+                        question,
+                        model_response,
+                        ideal_answer,
+                        judged,
+                        model_name=result.get("model_name"),
                     )
 
-                judge_models = [
-                    m.strip() for m in judge_models_str.split(",") if m.strip()
+                index = positions[id(result)]
+                heuristic_scores = (await chunks[index // chunk_size])[
+                    index % chunk_size
                 ]
-                if not judge_models:
-                    raise ConfigError("Invalid judge models configuration")
+                if isinstance(heuristic_scores, Exception):
+                    raise heuristic_scores
+                scores.update(heuristic_scores)
+
+                return attach_scores(
+                    result,
+                    {
+                        method: scores[method]
+                        for method in scoring_methods
+                        if method in scores
+                    },
+                )
 
-                judge_model = judge_models[0]
+            except Exception as e:  # noqa: BLE001 - recorded as a scoring failure
+                print(f"  Error scoring result for {result.get('model_name')}: {e}")
+                return scoring_error_result(result, e)
 
-        self.judge_model = judge_model
-        self.client = client or get_openai_client()
+        return await score_results_concurrently(score_result, evaluation_results)
 
-    def validate_response(self, model_response: str) -> tuple[bool, str]:
+
+class SemanticSimilarityScorer:
+    """Cosine similarity between response and ideal-answer sentence embeddings."""
+
+    def __init__(self, embedding_model: Any = None, batch_size: int = None):
         """
-        Validate model response for basic quality and completeness.
+        Initialize the scorer.
 
-        Returns:
-            tuple: (is_valid, failure_reason)
+        Args:
+            embedding_model: Loaded SentenceTransformer (e.g. VectorDatabase's);
+                the configured embedding model is loaded on first use if None
+            batch_size: Texts per encode batch (defaults to [Scoring] embedding_batch_size)
         """
-        if not model_response or not isinstance(model_response, str):
-            return False, "Empty or null response"
-
-        response_stripped = model_response.strip()
-
-        # Check for empty or whitespace-only responses
-        if not response_stripped:
-            return False, "Empty or whitespace-only response"
-
-        # Check for error messages
-        if response_stripped.lower().startswith(
-            "error:"
-        ) or response_stripped.startswith("MODEL_FAILURE:"):
-            return False, "Model returned error message"
-
-        # Check for extremely short responses (likely incomplete)
-        if len(response_stripped) < 10:
-            return False, f"Response too short ({len(response_stripped)} chars)"
-
-        # Check for non-substantive responses
-        non_substantive_patterns = [
-            r"^(i don't know|don't know|not sure|no idea|can't help|cannot help)[\.\!]?\s*$",
-            r"^(n/a|na|none|null|undefined)[\.\!]?\s*$",
-            r"^(sorry|apologize).*(cannot|can't|unable).*$",
-            r"^(please|try).*contact.*$",
-        ]
+        self.embedding_model = embedding_model
+        if batch_size is None:
+            batch_size = get_config_value("Scoring", "embedding_batch_size", 64, int)
+        self.batch_size = max(1, batch_size)
+
+        self._ideal_embeddings: Dict[str, np.ndarray] = {}
+        self._similarities: Dict[Tuple[str, str], float] = {}
+
+    def _get_model(self) -> Any:
+        if self.embedding_model is None:
+            from sentence_transformers import SentenceTransformer
+
+            self.embedding_model = SentenceTransformer(
+                get_config_value(
+                    "VectorDatabase", "embedding_model", "all-mpnet-base-v2"
+                )
+            )
+        return self.embedding_model
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Encode texts in batches into unit-length embedding rows."""
+        embeddings = self._get_model().encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def similarities(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Cosine similarity for each (response, ideal answer) pair.
+
+        Each distinct response is embedded once and ideal-answer embeddings are
+        cached across calls, since every model answers the same questions.
+        """
+        if not pairs:
+            return np.zeros(0, dtype=np.float32)
+
+        new_ideals = list(
+            dict.fromkeys(
+                ideal for _, ideal in pairs if ideal not in self._ideal_embeddings
+            )
+        )
+        if new_ideals:
+            self._ideal_embeddings.update(zip(new_ideals, self.embed(new_ideals)))
 
-        for pattern in non_substantive_patterns:
-            if re.match(pattern, response_stripped.lower()):
-                return False, "Non-substantive response"
+        responses = list(dict.fromkeys(response for response, _ in pairs))
+        response_rows = dict(zip(responses, range(len(responses))))
+        response_matrix = self.embed(responses)
 
-        # Check for generic/template responses that don't address cybersecurity
-        generic_indicators = [
-            "thank you for your question",
-            "this is an interesting question",
-            "let me help you with that",
-            "here are some general guidelines",
+        response_embeddings = response_matrix[
+            [response_rows[response] for response, _ in pairs]
         ]
+        ideal_embeddings = np.stack(
+            [self._ideal_embeddings[ideal] for _, ideal in pairs]
+        )
+        return np.einsum("ij,ij->i", response_embeddings, ideal_embeddings)
+
+    def prime(self, pairs: List[Tuple[str, str]]) -> int:
+        """Compute and remember similarities for many pairs at once."""
+        pending = list(dict.fromkeys(p for p in pairs if p not in self._similarities))
+        for pair, similarity in zip(pending, self.similarities(pending)):
+            self._similarities[pair] = float(similarity)
+        return len(pending)
+
+    def similarity(self, model_response: str, ideal_answer: str) -> float:
+        """Cosine similarity for one pair, using primed values when available."""
+        pair = (model_response, ideal_answer)
+        if pair not in self._similarities:
+            self.prime([pair])
+        return self._similarities[pair]
+
+
+# Global semantic similarity scorer shared by all judge scorers
+_semantic_similarity_scorer: Optional[SemanticSimilarityScorer] = None
+
+
+def get_semantic_similarity_scorer(
+    embedding_model: Any = None,
+) -> SemanticSimilarityScorer:
+    """Get the global semantic similarity scorer, adopting an already loaded model."""
+    global _semantic_similarity_scorer
+    if _semantic_similarity_scorer is None:
+        _semantic_similarity_scorer = SemanticSimilarityScorer(embedding_model)
+    elif (
+        embedding_model is not None
+        and _semantic_similarity_scorer.embedding_model is None
+    ):
+        _semantic_similarity_scorer.embedding_model = embedding_model
+    return _semantic_similarity_scorer
+
+
+async def prime_semantic_similarities(evaluation_results: Dict[str, List]) -> None:
+    """Embed every valid response and ideal answer in large batches up front."""
+    pairs = [
+        (r["model_response"], r["ideal_answer"])
+        for results in evaluation_results.values()
+        for r in results
+        if isinstance(r.get("model_response"), str)
+        and isinstance(r.get("ideal_answer"), str)
+        and _analyze_response(r["model_response"]).is_valid
+    ]
+    if not pairs:
+        return
+
+    start = time.monotonic()
+    try:
+        primed = await asyncio.to_thread(get_semantic_similarity_scorer().prime, pairs)
+    except Exception as e:  # noqa: BLE001 - priming is only a speed-up
+        print(f"  Warning: Semantic similarity priming failed: {e}")
+        return
+    print(
+        f"  Embedded {primed} response/ideal pairs for semantic similarity "
+        f"in {time.monotonic() - start:.1f}s"
+    )
+
+
+class HeuristicScorer:
+    """Rule-based scoring methods that need no judge model."""
+
+    # Methods score_heuristics can compute without a judge
+    heuristic_methods = HEURISTIC_METHODS
+
+    def analyze_response(self, model_response: str) -> ResponseAnalysis:
+        """Get the shared heuristic analysis of a response (memoized per text)."""
+        if not isinstance(model_response, str):
+            model_response = ""
+        return _analyze_response(model_response)
 
-        response_lower = response_stripped.lower()
-        if any(indicator in response_lower for indicator in generic_indicators):
-            # Only flag as invalid if it's ONLY generic content
-            words = response_lower.split()
-            if len(words) < 50:  # Short and generic
-                return False, "Generic template response"
+    def validate_response(self, model_response: str) -> tuple[bool, str]:
+        """
+        Validate model response for basic quality and completeness.
 
-        return True, ""
+        Returns:
+            tuple: (is_valid, failure_reason)
+        """
+        analysis = self.analyze_response(model_response)
+        return analysis.is_valid, analysis.failure_reason
 
     def exact_match_score(
         self, model_response: str, ideal_answer: str
@@ -146,74 +1134,30 @@ class AccuracyScorer:
 
     def extract_control_references(self, text: str) -> List[str]:
         """Extract control references like CC6.1, AC.L1-b.1.i, GDPR Article 32, etc."""
-        # Pattern for various control reference formats
-        patterns = [
-            # SOC 2 Trust Services Criteria
-            r"\b[A-Z]{1,2}\d+\.\d+\b",  # CC6.1, A1.3, P8.1
-            r"\b[A-Z]{2,4}\d+\.\d+\b",  # Extended version for longer prefixes
-            # CMMC Controls
-            r"\b[A-Z]{2,4}\.L\d+-[a-z]\.\d+\.[a-z]+\b",  # AC.L1-b.1.i
-            r"\b[A-Z]{2,4}\.L\d+-[a-z]\.\d+\.[ivx]+\b",  # Alternative roman numerals
-            # NIST Standards
-            r"\bNIST\.SP\.\d+-\d+r?\d*\b",  # NIST.SP.800-53r5, NIST.SP.800-171r3
-            r"\bNIST\s+\d+-\d+\b",  # NIST 800-53
-            r"\b[A-Z]{2,4}-\d+\b",  # SI-1, AC-2, AU-12
-            r"\b[A-Z]{2,4}-\d+\(\d+\)\b",  # AC-2(1), SI-4(5)
-            # GDPR References
-            r"\bArticle\s+\d+\b",  # Article 32, Article 25
-            r"\bArt\.\s*\d+\b",  # Art. 32, Art. 25
-            r"\bGDPR\s+Article\s+\d+\b",  # GDPR Article 32
-            r"\bGDPR\s+Art\.\s*\d+\b",  # GDPR Art. 32
-            # HIPAA References
-            r"\b\d+\.\d+\([a-z]\)\(\d+\)\([a-z]+\)\b",  # 164.312(a)(2)(iv)
-            r"\b\d+\.\d+\([a-z]\)\b",  # 164.312(a)
-            # ISO 27001 References
-            r"\bA\.\d+\.\d+\.\d+\b",  # A.8.1.1, A.12.6.1
-            r"\bA-\d+\.\d+\.\d+\b",  # Alternative format
-            r"\bISO\s+27001\s+A\.\d+\.\d+\.\d+\b",  # ISO 27001 A.8.1.1
-            # PCI DSS References
-            r"\b\d+\.\d+\.\d+\b",  # 1.2.1, 3.4.1
-            r"\bPCI\s+DSS\s+\d+\.\d+\.\d+\b",  # PCI DSS 1.2.1
-            # NIST CSF References
-            r"\b[A-Z]{2}\.[A-Z]{2}-\d+\b",  # ID.AM-1, PR.AC-3
-            r"\bNIST\s+CSF\s+[A-Z]{2}\.[A-Z]{2}-\d+\b",  # NIST CSF ID.AM-1
-            # FISMA/FedRAMP References
-            r"\b[A-Z]{2,4}-\d+\s+\([A-Z]+\)\b",  # AC-2 (HIGH), SI-4 (MODERATE)
-            # Generic framework references
-            r"\b[A-Z]{2,6}-\d+\([A-Z]+\)\b",  # Generic with impact level
-        ]
-
-        controls = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            # Normalize case for consistency
-            normalized_matches = [match.upper().strip() for match in matches]
-            controls.extend(normalized_matches)
-
-        return list(set(controls))  # Remove duplicates
+        return list(scan_control_references(text))
 
     def control_reference_score(
         self, model_response: str, ideal_answer: str
     ) -> ScoringResult:
         """Score based on overlap of control references."""
         # First validate the response
-        is_valid, failure_reason = self.validate_response(model_response)
-        if not is_valid:
+        analysis = self.analyze_response(model_response)
+        if not analysis.is_valid:
             return ScoringResult(
                 accuracy_score=0.0,
                 method=ScoringMethod.CONTROL_REFERENCE,
-                explanation=f"Invalid response: {failure_reason}",
+                explanation=f"Invalid response: {analysis.failure_reason}",
                 details={
                     "model_controls": [],
                     "ideal_controls": list(
                         self.extract_control_references(ideal_answer)
                     ),
                     "intersection": [],
-                    "validation_failure": failure_reason,
+                    "validation_failure": analysis.failure_reason,
                 },
             )
 
-        model_controls = set(self.extract_control_references(model_response))
+        model_controls = set(analysis.controls)
         ideal_controls = set(self.extract_control_references(ideal_answer))
 
         if not ideal_controls:
@@ -266,50 +1210,28 @@ class AccuracyScorer:
         score = 1.0
         issues = []
 
+        analysis = self.analyze_response(model_response)
         question_lower = question.lower()
-        response_lower = model_response.lower()
 
         # Check for requested list format
-        if "list" in question_lower or "enumerate" in question_lower:
-            # Look for list indicators
-            has_bullets = bool(
-                re.search(r"^[\s]*[-*•]\s", model_response, re.MULTILINE)
-            )
-            has_numbers = bool(
-                re.search(r"^[\s]*\d+[\.\)]\s", model_response, re.MULTILINE)
-            )
-
-            if not (has_bullets or has_numbers):
-                score -= 0.3
-                issues.append("Missing list format when requested")
+        if ("list" in question_lower or "enumerate" in question_lower) and not (
+            analysis.has_bullets or analysis.has_numbers
+        ):
+            score -= 0.3
+            issues.append("Missing list format when requested")
 
         # Check for requested explanation/justification
         if (
             "why" in question_lower
             or "explain" in question_lower
             or "because" in question_lower
-        ):
-            # Look for explanatory keywords
-            explanatory_keywords = [
-                "because",
-                "since",
-                "as",
-                "due to",
-                "requires",
-                "mandates",
-                "specifies",
-            ]
-            has_explanation = any(
-                keyword in response_lower for keyword in explanatory_keywords
-            )
-
-            if not has_explanation:
-                score -= 0.2
-                issues.append("Missing explanation when requested")
+        ) and not analysis.has_explanatory_keyword:
+            score -= 0.2
+            issues.append("Missing explanation when requested")
 
         # Check for excessive verbosity (more than 3x expected length)
         expected_length = min(500, len(question) * 3)  # Reasonable response length
-        if len(model_response) > expected_length * 3:
+        if analysis.char_count > expected_length * 3:
             score -= 0.1
             issues.append("Response may be too verbose")
 
@@ -319,19 +1241,12 @@ class AccuracyScorer:
             or "short_prompt" in question_lower
             or "format" in question_lower
         ):
-            required_sections = [
-                r"##\s*Purpose\s*&\s*Scope",
-                r"##\s*Policy\s*Statements?",
-                r"##\s*Roles?\s*&\s*Responsibilities",
-                r"##\s*Compliance\s*&\s*Enforcement",
-                r"##\s*Review\s*Cycle",
-                r"##\s*Framework\s*Mappings?",
-            ]
-
             section_score = 0
             missing_sections = []
-            for section_pattern in required_sections:
-                if re.search(section_pattern, model_response, re.IGNORECASE):
+            for section_pattern, present in zip(
+                POLICY_SECTION_PATTERNS, analysis.policy_sections
+            ):
+                if present:
                     section_score += 1
                 else:
                     section_name = (
@@ -351,11 +1266,7 @@ class AccuracyScorer:
                 )
 
             # Check for framework mapping table
-            if re.search(
-                r"\|\s*Policy\s*\|\s*\w+\s*Control\s*\||\|\s*\w+\s*Control\s*\|\s*\w+",
-                model_response,
-                re.IGNORECASE,
-            ):
+            if analysis.has_mapping_table:
                 score += 0.1
                 issues.append("Framework mapping table present")
             else:
@@ -365,10 +1276,7 @@ class AccuracyScorer:
         # Check for structured sections when multiple requirements requested
         elif "requirement" in question_lower and "requirements" in question_lower:
             # Look for section breaks or clear separation
-            has_structure = bool(
-                re.search(r"\n\n|---|\*\*|##|\d+\.|[A-Z]\)", model_response)
-            )
-            if not has_structure and len(model_response) > 200:
+            if not analysis.has_section_breaks and analysis.char_count > 200:
                 score -= 0.2
                 issues.append("Missing clear structure for multiple requirements")
 
@@ -386,7 +1294,7 @@ class AccuracyScorer:
             explanation=explanation,
             details={
                 "issues": issues,
-                "response_length": len(model_response),
+                "response_length": analysis.char_count,
                 "question_indicators": {
                     "list_requested": "list" in question_lower
                     or "enumerate" in question_lower,
@@ -403,7 +1311,7 @@ class AccuracyScorer:
     ) -> ScoringResult:
         """Verify that cited controls/articles actually exist in referenced frameworks."""
         # framework_context parameter reserved for future use with dynamic validation
-        controls = self.extract_control_references(model_response)
+        controls = list(self.analyze_response(model_response).controls)
 
         if not controls:
             return ScoringResult(
@@ -413,107 +1321,17 @@ class AccuracyScorer:
                 details={"verified_controls": [], "invalid_controls": []},
             )
 
-        # Known valid control patterns for major frameworks
-        valid_patterns = {
-            "SOC2": {
-                "CC1": [1, 2, 3, 4, 5],
-                "CC2": [1, 2, 3],
-                "CC3": [1, 2, 3, 4],
-                "CC4": [1, 2],
-                "CC5": [1, 2, 3],
-                "CC6": [1, 2, 3, 4, 5, 6, 7, 8],
-                "CC7": [1, 2, 3, 4, 5],
-                "CC8": [1],
-                "CC9": [1, 2],
-                "A1": [1, 2, 3],
-                "PI1": [1, 2, 3],
-                "P1": [1, 2],
-                "P2": [1, 2],
-                "P3": [1, 2],
-                "P4": [1, 2, 3],
-                "P5": [1, 2],
-                "P6": [1, 2, 3],
-                "P7": [1],
-                "P8": [1],
-                "C1": [1, 2],
-            },
-            "NIST_CSF": {
-                "ID": ["AM", "BE", "GV", "RA", "RM", "SC"],
-                "PR": ["AC", "AT", "DS", "IP", "MA", "PT"],
-                "DE": ["AE", "CM", "DP"],
-                "RS": ["RP", "CO", "AN", "MI", "IM"],
-                "RC": ["RP", "IM", "CO"],
-            },
-            "GDPR_ARTICLES": list(range(1, 100)),  # Articles 1-99
-            "NIST_800_53": {
-                "AC": list(range(1, 26)),
-                "AT": list(range(1, 6)),
-                "AU": list(range(1, 17)),
-                "CA": list(range(1, 10)),
-                "CM": list(range(1, 15)),
-                "CP": list(range(1, 14)),
-                "IA": list(range(1, 13)),
-                "IR": list(range(1, 11)),
-                "MA": list(range(1, 8)),
-                "MP": list(range(1, 9)),
-                "PE": list(range(1, 21)),
-                "PL": list(range(1, 12)),
-                "PS": list(range(1, 9)),
-                "PT": list(range(1, 9)),
-                "RA": list(range(1, 11)),
-                "SA": list(range(1, 23)),
-                "SC": list(range(1, 54)),
-                "SI": list(range(1, 24)),
-                "SR": list(range(1, 13)),
-            },
-        }
+        # Prefer the corpus-derived catalog; fall back to built-in patterns without it
+        catalog = get_control_catalog()
 
         verified_controls = []
         invalid_controls = []
 
         for control in controls:
-            is_valid = False
-
-            # Check SOC 2 controls
-            soc2_match = re.match(r"([A-Z]{1,3})(\d+)\.(\d+)", control)
-            if soc2_match:
-                (
-                    prefix,
-                    _,
-                    minor,
-                ) = soc2_match.groups()  # major not used in current logic
-                if (
-                    prefix in valid_patterns["SOC2"]
-                    and int(minor) in valid_patterns["SOC2"][prefix]
-                ):
-                    is_valid = True
-
-            # Check NIST CSF controls
-            csf_match = re.match(r"([A-Z]{2})\.([A-Z]{2})-(\d+)", control)
-            if csf_match:
-                function, category, num = csf_match.groups()
-                if (
-                    function in valid_patterns["NIST_CSF"]
-                    and category in valid_patterns["NIST_CSF"][function]
-                ):
-                    is_valid = True
-
-            # Check GDPR Articles
-            gdpr_match = re.search(r"ARTICLE\s+(\d+)", control.upper())
-            if gdpr_match:
-                article_num = int(gdpr_match.group(1))
-                if article_num in valid_patterns["GDPR_ARTICLES"]:
-                    is_valid = True
-
-            # Check NIST 800-53 controls
-            nist_match = re.match(r"([A-Z]{2,4})-(\d+)", control)
-            if nist_match:
-                family, num = nist_match.groups()
-                if (
-                    family in valid_patterns["NIST_800_53"]
-                    and int(num) in valid_patterns["NIST_800_53"][family]
-                ):
-                    is_valid = True
+            if catalog is not None:
+                is_valid = catalog.contains(control)
+            else:
+                is_valid = _is_builtin_valid_control(control)
 
             if is_valid:
                 verified_controls.append(control)
@@ -541,113 +1359,13 @@ class AccuracyScorer:
             },
         )
 
-    async def llm_judge_score(
-        self,
-        question: str,
-        model_response: str,
-        ideal_answer: str,
-        max_retries: int = 3,
-    ) -> ScoringResult:
-        """Use LLM as a judge to score the response."""
-
-        # First validate the response
-        is_valid, failure_reason = self.validate_response(model_response)
-        if not is_valid:
-            return ScoringResult(
-                accuracy_score=0.0,
-                method=ScoringMethod.LLM_JUDGE,
-                explanation=f"Invalid response: {failure_reason}",
-                details={"validation_failure": failure_reason, "judge_response": None},
-            )
-
-        judge_prompt = f"""You are evaluating the accuracy of a model's response to a cybersecurity compliance question.
-
-Question: {question}
-
-Model Response: {model_response}
-
-Ground Truth Answer: {ideal_answer}
-
-CRITICAL INSTRUCTIONS FOR SCORING:
-- If the model response is empty, just error text, or completely irrelevant to cybersecurity, assign score 0.0
-- If the model response is too short to be meaningful (<20 characters), assign maximum score 0.3
-- If the model response doesn't attempt to address the question asked, assign maximum score 0.2
-
-Please evaluate the model's response on the following criteria:
-1. Correctness: Does the model identify the correct compliance requirement(s)?
-2. Completeness: Does the model address all relevant aspects mentioned in the ground truth?
-3. Specificity: Does the model provide specific control/requirement references when appropriate?
-4. Relevance: Does the response actually address the cybersecurity question asked?
-
-Rate the overall accuracy on a scale from 0.0 to 1.0, where:
-- 1.0 = Perfect match with ground truth
-- 0.8-0.9 = Minor differences but substantially correct
-- 0.6-0.7 = Partially correct but missing key elements
-- 0.4-0.5 = Some relevant information but significant errors
-- 0.2-0.3 = Minimal relevance to the correct answer
-- 0.0 = Completely incorrect, irrelevant, empty, or error response
-
-Respond with JSON in this format:
-{{"score": 0.8, "explanation": "Brief explanation of the scoring rationale"}}"""
-
-        for attempt in range(max_retries):
-            try:
-                response = await asyncio.to_thread(
-                    self.client.chat.completions.create,
-                    model=self.judge_model,
-                    messages=[{"role": "user", "content": judge_prompt}],
-                    max_tokens=300,
-                    temperature=0.1,
-                )
-
-                judge_response = response.choices[0].message.content.strip()
-
-                # Parse JSON response
-                try:
-                    parsed = json.loads(judge_response)
-                    score = float(parsed.get("score", 0.0))
-                    explanation = parsed.get("explanation", "No explanation provided")
-
-                    return ScoringResult(
-                        accuracy_score=score,
-                        method=ScoringMethod.LLM_JUDGE,
-                        explanation=explanation,
-                        details={"judge_response": judge_response},
-                    )
-                except json.JSONDecodeError:
-                    # Try to extract score from text
-                    import re
-
-                    score_match = re.search(
-                        r'score["\']?\s*:\s*([0-9.]+)', judge_response, re.IGNORECASE
-                    )
-                    if score_match:
-                        score = float(score_match.group(1))
-                        return ScoringResult(
-                            accuracy_score=score,
-                            method=ScoringMethod.LLM_JUDGE,
-                            explanation="Extracted from non-JSON response",
-                            details={"judge_response": judge_response},
-                        )
-                    else:
-                        raise ValueError("Could not parse score from response")
-
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    return ScoringResult(
-                        accuracy_score=0.0,
-                        method=ScoringMethod.LLM_JUDGE,
-                        explanation=f"Error in LLM judge: {str(e)}",
-                        details={"error": str(e)},
-                    )
-                await asyncio.sleep(2**attempt)  # Exponential backoff
-
     def conciseness_score(
         self, model_response: str, question: str = None
     ) -> ScoringResult:
         """Score response conciseness based on length optimization and clarity."""
-        response_length = len(model_response)
-        word_count = len(model_response.split())
+        analysis = self.analyze_response(model_response)
+        response_length = analysis.char_count
+        word_count = analysis.word_count
 
         # Base score starts at 1.0
         score = 1.0
@@ -666,35 +1384,15 @@ Respond with JSON in this format:
             issues.append(f"Word count high ({word_count} words, target <250)")
 
         # Check for unnecessary verbosity patterns
-        verbose_patterns = [
-            r"it is important to note that",
-            r"it should be noted that",
-            r"please be advised that",
-            r"it is worth mentioning",
-            r"as previously mentioned",
-            r"furthermore, it is essential",
-        ]
-
-        verbose_count = sum(
-            len(re.findall(pattern, model_response, re.IGNORECASE))
-            for pattern in verbose_patterns
-        )
+        verbose_count = analysis.verbose_phrase_count
         if verbose_count > 0:
             score -= verbose_count * 0.1
             issues.append(f"Contains verbose phrases ({verbose_count} instances)")
 
         # Reward clear structure for policies (sections, bullet points)
         if question and ("policy" in question.lower() or "format" in question.lower()):
-            structure_indicators = [
-                r"##\s+\w+",  # Section headers
-                r"\d+\.\s+",  # Numbered lists
-                r"\*\*\w+\*\*",  # Bold headers
-                r"\|\s*\w+\s*\|",  # Table structure
-            ]
-
             structure_score = sum(
-                min(3, len(re.findall(pattern, model_response)))
-                for pattern in structure_indicators
+                min(3, count) for count in analysis.structure_indicator_counts
             )
             if structure_score >= 8:  # Well-structured
                 score += 0.1
@@ -728,54 +1426,23 @@ Respond with JSON in this format:
     ) -> ScoringResult:
         """Score response based on contextual relevance to cybersecurity domain and question."""
         # First validate the response
-        is_valid, failure_reason = self.validate_response(model_response)
-        if not is_valid:
+        analysis = self.analyze_response(model_response)
+        if not analysis.is_valid:
             return ScoringResult(
                 accuracy_score=0.0,
                 method=ScoringMethod.CONTEXTUAL_RELEVANCE,
-                explanation=f"Invalid response: {failure_reason}",
-                details={"validation_failure": failure_reason},
+                explanation=f"Invalid response: {analysis.failure_reason}",
+                details={"validation_failure": analysis.failure_reason},
             )
 
         score = 1.0
         issues = []
 
-        response_lower = model_response.lower()
+        response_lower = analysis.lower
         question_lower = question.lower()
 
         # Check for cybersecurity domain relevance
-        cybersecurity_terms = [
-            "security",
-            "compliance",
-            "control",
-            "framework",
-            "risk",
-            "vulnerability",
-            "threat",
-            "policy",
-            "governance",
-            "audit",
-            "incident",
-            "breach",
-            "encryption",
-            "access",
-            "authentication",
-            "authorization",
-            "monitoring",
-            "gdpr",
-            "hipaa",
-            "sox",
-            "pci",
-            "nist",
-            "iso",
-            "soc",
-            "cmmc",
-            "fedramp",
-        ]
-
-        cyber_term_count = sum(
-            1 for term in cybersecurity_terms if term in response_lower
-        )
+        cyber_term_count = analysis.cybersecurity_term_count
         if cyber_term_count == 0:
             score -= 0.8  # Major penalty for no cybersecurity relevance
             issues.append("No cybersecurity terminology detected")
@@ -788,23 +1455,14 @@ Respond with JSON in this format:
             )
 
         # Check if response addresses the question type
-        question_type_indicators = {
-            "framework": ["framework", "standard", "regulation", "compliance"],
-            "control": ["control", "requirement", "safeguard", "measure"],
-            "implementation": ["implement", "deploy", "configure", "setup"],
-            "risk": ["risk", "threat", "vulnerability", "assessment"],
-            "policy": ["policy", "procedure", "guideline", "document"],
-            "technical": ["technical", "system", "technology", "architecture"],
-        }
-
         question_types_found = []
-        for q_type, indicators in question_type_indicators.items():
+        for q_type, indicators in QUESTION_TYPE_INDICATORS.items():
             if any(indicator in question_lower for indicator in indicators):
                 question_types_found.append(q_type)
 
         response_addresses_type = False
         for q_type in question_types_found:
-            type_indicators = question_type_indicators[q_type]
+            type_indicators = QUESTION_TYPE_INDICATORS[q_type]
             if any(indicator in response_lower for indicator in type_indicators):
                 response_addresses_type = True
                 break
@@ -817,19 +1475,7 @@ Respond with JSON in this format:
 
         # Check for framework alignment if question mentions specific frameworks
         mentioned_frameworks = []
-        framework_patterns = {
-            "nist": ["nist", "800-53", "800-171", "csf", "cybersecurity framework"],
-            "gdpr": ["gdpr", "general data protection", "article"],
-            "hipaa": ["hipaa", "health insurance", "164."],
-            "sox": ["sox", "sarbanes", "sarbanes-oxley"],
-            "pci": ["pci", "payment card", "pci-dss", "pci dss"],
-            "iso": ["iso", "27001", "27002"],
-            "soc": ["soc", "soc 2", "soc2", "trust services"],
-            "cmmc": ["cmmc", "cybersecurity maturity"],
-            "fedramp": ["fedramp", "federal risk"],
-        }
-
-        for framework, patterns in framework_patterns.items():
+        for framework, patterns in FRAMEWORK_PATTERNS.items():
             if any(pattern in question_lower for pattern in patterns):
                 mentioned_frameworks.append(framework)
                 if not any(pattern in response_lower for pattern in patterns):
@@ -839,7 +1485,7 @@ Respond with JSON in this format:
                     )
 
         # Check response depth and specificity
-        word_count = len(model_response.split())
+        word_count = analysis.word_count
         if word_count < 20:
             score -= 0.3
             issues.append("Response too brief for complex cybersecurity topic")
@@ -848,24 +1494,7 @@ Respond with JSON in this format:
             issues.append("Response may be too verbose")
 
         # Bonus for specific technical details
-        technical_indicators = [
-            "configuration",
-            "implementation",
-            "architecture",
-            "deployment",
-            "monitoring",
-            "logging",
-            "alerting",
-            "incident response",
-            "backup",
-            "recovery",
-            "encryption",
-            "key management",
-        ]
-
-        technical_count = sum(
-            1 for term in technical_indicators if term in response_lower
-        )
+        technical_count = analysis.technical_term_count
         if technical_count >= 3:
             score += 0.1
             issues.append("Good technical specificity")
@@ -895,26 +1524,25 @@ Respond with JSON in this format:
     ) -> ScoringResult:
         """Score response based on completeness and coverage of required elements."""
         # First validate the response
-        is_valid, failure_reason = self.validate_response(model_response)
-        if not is_valid:
+        analysis = self.analyze_response(model_response)
+        if not analysis.is_valid:
             return ScoringResult(
                 accuracy_score=0.0,
                 method=ScoringMethod.COMPLETENESS,
-                explanation=f"Invalid response: {failure_reason}",
-                details={"validation_failure": failure_reason},
+                explanation=f"Invalid response: {analysis.failure_reason}",
+                details={"validation_failure": analysis.failure_reason},
             )
 
         score = 1.0
         issues = []
         coverage_details = {}
 
-        response_lower = model_response.lower()
+        response_lower = analysis.lower
         question_lower = question.lower()
-        ideal_lower = ideal_answer.lower()
 
         # Extract key concepts from ideal answer
         ideal_controls = self.extract_control_references(ideal_answer)
-        model_controls = self.extract_control_references(model_response)
+        model_controls = analysis.controls
 
         # Check control coverage
         if ideal_controls:
@@ -940,57 +1568,7 @@ Respond with JSON in this format:
 
         # Check for key concept coverage from ideal answer
         # Extract important terms from ideal answer (excluding common words)
-        stop_words = {
-            "the",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "will",
-            "would",
-            "should",
-            "must",
-            "can",
-            "could",
-            "may",
-            "might",
-        }
-
-        ideal_words = [
-            word.strip(".,!?()[]{}")
-            for word in ideal_lower.split()
-            if len(word) > 3 and word not in stop_words
-        ]
-        important_terms = [
-            word
-            for word in ideal_words
-            if any(
-                cyber in word
-                for cyber in [
-                    "security",
-                    "compliance",
-                    "control",
-                    "policy",
-                    "risk",
-                    "framework",
-                    "audit",
-                    "governance",
-                ]
-            )
-        ]
+        important_terms = _key_concept_terms(ideal_answer)
 
         if important_terms:
             covered_terms = sum(1 for term in important_terms if term in response_lower)
@@ -1013,16 +1591,12 @@ Respond with JSON in this format:
         question_parts = []
         if " and " in question_lower:
             question_parts = [part.strip() for part in question_lower.split(" and ")]
-        elif "list" in question_lower or "identify" in question_lower:
-            # Look for numbered or bulleted lists in response
-            has_list = bool(
-                re.search(r"^\s*\d+[\.\)]\s|\s*[-*•]\s", model_response, re.MULTILINE)
-            )
-            if not has_list:
-                score -= 0.2
-                issues.append(
-                    "Question asks for list but response lacks structured format"
-                )
+        elif (
+            "list" in question_lower or "identify" in question_lower
+        ) and not analysis.has_list_items:
+            # No numbered or bulleted list in the response
+            score -= 0.2
+            issues.append("Question asks for list but response lacks structured format")
 
         if question_parts and len(question_parts) > 1:
             coverage_count = 0
@@ -1052,19 +1626,7 @@ Respond with JSON in this format:
             or "explain" in question_lower
             or "because" in question_lower
         ):
-            explanatory_indicators = [
-                "because",
-                "since",
-                "due to",
-                "as a result",
-                "therefore",
-                "consequently",
-                "reason",
-                "purpose",
-            ]
-            explanation_count = sum(
-                1 for indicator in explanatory_indicators if indicator in response_lower
-            )
+            explanation_count = analysis.explanatory_indicator_count
 
             if explanation_count == 0:
                 score -= 0.3
@@ -1081,19 +1643,7 @@ Respond with JSON in this format:
 
         # Check for implementation details when appropriate
         if "implement" in question_lower or "how to" in question_lower:
-            implementation_terms = [
-                "configure",
-                "setup",
-                "deploy",
-                "install",
-                "enable",
-                "create",
-                "establish",
-                "develop",
-            ]
-            implementation_count = sum(
-                1 for term in implementation_terms if term in response_lower
-            )
+            implementation_count = analysis.implementation_term_count
 
             if implementation_count == 0:
                 score -= 0.2
@@ -1107,15 +1657,842 @@ Respond with JSON in this format:
 
         score = max(0.0, min(1.0, score))  # Clamp to [0, 1]
 
-        explanation = f"Completeness score: {score:.3f}"
-        if issues:
-            explanation += f" (Issues: {'; '.join(issues)})"
+        explanation = f"Completeness score: {score:.3f}"
+        if issues:
+            explanation += f" (Issues: {'; '.join(issues)})"
+
+        return ScoringResult(
+            accuracy_score=score,
+            method=ScoringMethod.COMPLETENESS,
+            explanation=explanation,
+            details=coverage_details,
+        )
+
+    def score_heuristics(
+        self,
+        question: str,
+        model_response: str,
+        ideal_answer: str,
+        methods: List[ScoringMethod],
+    ) -> Dict[ScoringMethod, ScoringResult]:
+        """Score a response with the judge-free methods among ``methods``."""
+        results = {}
+
+        for method in methods:
+            if method == ScoringMethod.EXACT_MATCH:
+                results[method] = self.exact_match_score(model_response, ideal_answer)
+            elif method == ScoringMethod.CONTROL_REFERENCE:
+                results[method] = self.control_reference_score(
+                    model_response, ideal_answer
+                )
+            elif method == ScoringMethod.STRUCTURAL_VALIDATION:
+                results[method] = self.structural_validation_score(
+                    model_response, question
+                )
+            elif method == ScoringMethod.CITATION_VERIFICATION:
+                results[method] = self.citation_verification_score(model_response)
+            elif method == ScoringMethod.CONTEXTUAL_RELEVANCE:
+                results[method] = self.contextual_relevance_score(
+                    model_response, question, ideal_answer
+                )
+            elif method == ScoringMethod.COMPLETENESS:
+                results[method] = self.completeness_score(
+                    model_response, question, ideal_answer
+                )
+
+        return results
+
+
+# Refusal phrasing that validate_response's short-answer patterns do not catch
+REFUSAL_MARKERS = (
+    "i can't help with",
+    "i cannot help with",
+    "i can't assist",
+    "i cannot assist",
+    "i can't provide",
+    "i cannot provide",
+    "i'm unable to",
+    "i am unable to",
+    "i'm not able to",
+    "i am not able to",
+    "i won't be able to",
+    "as an ai",
+)
+
+
+class PreJudge:
+    """Local CPU pre-judge that settles clear-cut responses without an LLM judge.
+
+    A cross-encoder similarity between response and ideal answer is combined
+    with the heuristic scores: refusals, off-topic answers and answers citing
+    the wrong frameworks get a confident low score, near-identical answers a
+    confident high one, and everything else goes to the LLM judge.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        model_name: str = "cross-encoder/stsb-distilroberta-base",
+        fail_similarity: float = 0.2,
+        pass_similarity: float = 0.9,
+        pass_control_overlap: float = 0.8,
+        batch_size: int = 32,
+    ):
+        """
+        Initialize the pre-judge.
+
+        Args:
+            enabled: Whether clear-cut responses skip the LLM judge
+            model_name: Cross-encoder scoring response/ideal similarity in [0, 1]
+            fail_similarity: Similarity below which wrong-framework answers fail
+            pass_similarity: Similarity at or above which an answer may pass
+            pass_control_overlap: Control reference score a passing answer needs
+            batch_size: Pairs per cross-encoder batch
+        """
+        self.enabled = enabled
+        self.model_name = model_name
+        self.fail_similarity = fail_similarity
+        self.pass_similarity = pass_similarity
+        self.pass_control_overlap = pass_control_overlap
+        self.batch_size = max(1, batch_size)
+
+        self.heuristics = HeuristicScorer()
+        self._model = None
+        self._model_unavailable = False
+        self._similarities: Dict[Tuple[str, str], float] = {}
+        self._model_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"assessed": 0, "confident_fail": 0, "confident_pass": 0}
+        )
+
+    @classmethod
+    def from_config(cls) -> "PreJudge":
+        """Create a pre-judge from the [Scoring] section of the config."""
+        return cls(
+            enabled=get_config_value("Scoring", "enable_pre_judge", False, bool),
+            model_name=get_config_value(
+                "Scoring", "pre_judge_model", "cross-encoder/stsb-distilroberta-base"
+            ),
+            fail_similarity=get_config_value(
+                "Scoring", "pre_judge_fail_similarity", 0.2, float
+            ),
+            pass_similarity=get_config_value(
+                "Scoring", "pre_judge_pass_similarity", 0.9, float
+            ),
+            pass_control_overlap=get_config_value(
+                "Scoring", "pre_judge_pass_control_overlap", 0.8, float
+            ),
+        )
+
+    def _get_model(self) -> Any:
+        """Load the cross-encoder once; heuristics alone are used if it cannot load."""
+        if self._model is None and not self._model_unavailable:
+            try:
+                from sentence_transformers import CrossEncoder
+
+                self._model = CrossEncoder(self.model_name, device="cpu")
+            except Exception as e:  # noqa: BLE001 - heuristics are used instead
+                print(f"Warning: Pre-judge model {self.model_name} unavailable: {e}")
+                self._model_unavailable = True
+        return self._model
+
+    def prime(self, pairs: List[Tuple[str, str]]) -> None:
+        """Score many (response, ideal answer) pairs with the cross-encoder at once."""
+        pending = list(dict.fromkeys(p for p in pairs if p not in self._similarities))
+        model = self._get_model() if pending else None
+        if model is None:
+            return
+
+        scores = model.predict(
+            pending, batch_size=self.batch_size, show_progress_bar=False
+        )
+        for pair, score in zip(pending, np.asarray(scores, dtype=float).ravel()):
+            self._similarities[pair] = float(score)
+
+    def similarity(self, model_response: str, ideal_answer: str) -> Optional[float]:
+        """Cross-encoder similarity for one pair, or None without a model."""
+        pair = (model_response, ideal_answer)
+        if pair not in self._similarities:
+            self.prime([pair])
+        return self._similarities.get(pair)
+
+    def _cites_wrong_frameworks(
+        self, analysis: ResponseAnalysis, ideal_answer: str
+    ) -> bool:
+        """Whether the response only cites controls from frameworks the ideal lacks."""
+        catalog = get_control_catalog()
+        ideal_controls = scan_control_references(ideal_answer)
+        if catalog is None or not ideal_controls or not analysis.controls:
+            return False
+        if set(analysis.controls) & set(ideal_controls):
+            return False
+
+        ideal_frameworks = {
+            name
+            for control in ideal_controls
+            for name in catalog.frameworks_for(control)
+        }
+        cited_frameworks = {
+            name
+            for control in analysis.controls
+            for name in catalog.frameworks_for(control)
+        }
+        return bool(ideal_frameworks and cited_frameworks) and not (
+            ideal_frameworks & cited_frameworks
+        )
+
+    def decide(
+        self, question: str, model_response: str, ideal_answer: str
+    ) -> Optional[Tuple[float, str, Optional[float]]]:
+        """
+        Decide whether a response is clear-cut.
+
+        Returns:
+            (score, reason, similarity) for a confident verdict, or None if the
+            response should go to the LLM judge
+        """
+        analysis = self.heuristics.analyze_response(model_response)
+        if not analysis.is_valid:
+            # llm_judge_score already fails invalid responses without a judge call
+            return None
+
+        opening = analysis.lower[:300]
+        if not analysis.controls and any(
+            marker in opening for marker in REFUSAL_MARKERS
+        ):
+            return 0.0, "refusal", None
+
+        if not analysis.controls and analysis.cybersecurity_term_count == 0:
+            return 0.0, "off-topic (no cybersecurity content)", None
+
+        similarity = self.similarity(model_response, ideal_answer)
+        if similarity is None:
+            return None
+
+        if similarity < self.fail_similarity and self._cites_wrong_frameworks(
+            analysis, ideal_answer
+        ):
+            return 0.0, "cites controls from the wrong frameworks", similarity
+
+        if similarity >= self.pass_similarity:
+            control_score = self.heuristics.control_reference_score(
+                model_response, ideal_answer
+            ).accuracy_score
+            if control_score >= self.pass_control_overlap:
+                return similarity, "near-identical to the ideal answer", similarity
+
+        return None
+
+    async def assess(
+        self,
+        question: str,
+        model_response: str,
+        ideal_answer: str,
+        model_name: Optional[str] = None,
+    ) -> Optional[ScoringResult]:
+        """Return a confident judge-equivalent verdict, or None to call the judge."""
+        if not self.enabled:
+            return None
+
+        stats = self._model_stats[model_name or "unknown"]
+        stats["assessed"] += 1
+        try:
+            decision = await asyncio.to_thread(
+                self.decide, question, model_response, ideal_answer
+            )
+        except Exception as e:  # noqa: BLE001 - the LLM judge scores it instead
+            print(f"  Warning: Pre-judge failed, using LLM judge: {e}")
+            return None
+        if decision is None:
+            return None
+
+        score, reason, similarity = decision
+        stats["confident_pass" if score > 0 else "confident_fail"] += 1
+        return ScoringResult(
+            accuracy_score=score,
+            method=ScoringMethod.LLM_JUDGE,
+            explanation=f"Pre-judge: {reason}",
+            details={"pre_judge": True, "reason": reason, "similarity": similarity},
+        )
+
+    async def prime_results(self, evaluation_results: Dict[str, List]) -> None:
+        """Run the cross-encoder over every valid result in batches up front."""
+        if not self.enabled:
+            return
+        pairs = [
+            (r["model_response"], r["ideal_answer"])
+            for results in evaluation_results.values()
+            for r in results
+            if isinstance(r.get("model_response"), str)
+            and isinstance(r.get("ideal_answer"), str)
+            and _analyze_response(r["model_response"]).is_valid
+        ]
+        try:
+            await asyncio.to_thread(self.prime, pairs)
+        except Exception as e:  # noqa: BLE001 - priming is only a speed-up
+            print(f"  Warning: Pre-judge priming failed: {e}")
+
+    def needs_judge(
+        self, question: str, model_response: str, ideal_answer: str
+    ) -> bool:
+        """Whether a response would still be sent to the LLM judge."""
+        if not self.enabled:
+            return True
+        try:
+            return self.decide(question, model_response, ideal_answer) is None
+        except Exception:  # noqa: BLE001 - the LLM judge scores it instead
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-model pre-judge skip statistics."""
+        models = {}
+        for model_name, stats in self._model_stats.items():
+            skipped = stats["confident_fail"] + stats["confident_pass"]
+            models[model_name] = {
+                **stats,
+                "skipped": skipped,
+                "skip_rate": skipped / max(1, stats["assessed"]),
+            }
+        return {"enabled": self.enabled, "models": models}
+
+
+# Global pre-judge shared by all judge scorers
+_pre_judge: Optional[PreJudge] = None
+
+
+def get_pre_judge() -> PreJudge:
+    """Get global pre-judge instance."""
+    global _pre_judge
+    if _pre_judge is None:
+        _pre_judge = PreJudge.from_config()
+    return _pre_judge
+
+
+class AccuracyScorer(HeuristicScorer):
+    """Scorer for evaluating model responses against ground truth answers."""
+
+    def __init__(
+        self,
+        judge_model: str = None,
+        client: Optional[openai.OpenAI] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+        verdict_cache: Optional[JsonlCache] = None,
+    ):
+        """Initialize scorer with injected dependencies.
+
+        Args:
+            judge_model: Model to use for scoring
+            client: OpenAI client for API calls
+            config_overrides: Override configuration values
+            verdict_cache: Persistent judge verdict cache (in-memory only if None)
+        """
+        self.config_overrides = config_overrides or {}
+
+        if judge_model is None:
+            judge_model = self.config_overrides.get(
+                "primary_judge", get_config_value("Scoring", "primary_judge", "")
+            )
+
+            if not judge_model:
+                # Get from judge models list
+                judge_models_str = get_config_value("Models", "judge_models", "")
+                if not judge_models_str:
+                    raise ConfigError(
+                        "No judge models configured in [Models] or [Scoring] sections"
+                    )
+
+                judge_models = [
+                    m.strip() for m in judge_models_str.split(",") if m.strip()
+                ]
+                if not judge_models:
+                    raise ConfigError("Invalid judge models configuration")
+
+                judge_model = judge_models[0]
+
+        self.judge_model = judge_model
+        self.client = client or get_openai_client()
+
+        # Hard deadline per judge call; timeouts are counted separately from errors
+        self.judge_timeout = get_config_value("Scoring", "scoring_timeout", 45, float)
+        self.judge_timeout_count = 0
+        self.hedging = get_hedging_policy()
+        self.circuit_breaker = get_circuit_breaker(self.judge_model)
+
+        # Sampling parameters sent with every judge call (part of the verdict key)
+        self.judge_sampling_params = {
+            "temperature": get_config_value("Scoring", "judge_temperature", 0.1, float),
+            "top_p": get_config_value("Scoring", "judge_top_p", 1.0, float),
+        }
+
+        # Judge verdicts keyed by judge model, prompt version and inputs
+        self.verdict_cache = verdict_cache
+        self._run_verdicts: Dict[str, Dict[str, Any]] = {}
+        self.verdict_cache_hits = 0
+        self.verdict_cache_misses = 0
+        self.batched_verdicts = 0
+
+        # Judge several responses to the same question per call when scoring in bulk
+        self.batch_judging = get_config_value("Scoring", "batch_judging", False, bool)
+
+        # Clear-cut responses are scored locally instead of by the judge
+        self.pre_judge = get_pre_judge()
+
+        # Ask for schema-constrained verdicts: auto (until the provider rejects
+        # response_format), always, or never
+        self.structured_output = str(
+            get_config_value("Scoring", "judge_structured_output", "auto")
+        ).lower()
+        self.judge_parse_failures = 0
+
+    def _verdict_key(
+        self, question: str, model_response: str, ideal_answer: str
+    ) -> str:
+        """Verdict cache key for one set of judge inputs."""
+        return make_cache_key(
+            self.judge_model,
+            JUDGE_PROMPT_VERSION,
+            self.judge_sampling_params,
+            question,
+            model_response,
+            ideal_answer,
+        )
+
+    def _get_cached_verdict(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a judge verdict, updating hit statistics."""
+        if self.verdict_cache is not None:
+            record = self.verdict_cache.get(cache_key)
+        else:
+            record = self._run_verdicts.get(cache_key)
+
+        if record is None:
+            self.verdict_cache_misses += 1
+        else:
+            self.verdict_cache_hits += 1
+        return record
+
+    def _store_verdict(self, cache_key: str, verdict: ScoringResult) -> None:
+        """Remember a successful judge verdict."""
+        record = {
+            "judge_model": self.judge_model,
+            "score": verdict.accuracy_score,
+            "explanation": verdict.explanation,
+            "details": verdict.details,
+        }
+        if self.verdict_cache is not None:
+            self.verdict_cache.put(cache_key, record)
+        else:
+            self._run_verdicts[cache_key] = record
+
+    def get_verdict_cache_stats(self) -> Dict[str, Any]:
+        """Get judge verdict cache hit/miss statistics."""
+        lookups = self.verdict_cache_hits + self.verdict_cache_misses
+        return {
+            "hits": self.verdict_cache_hits,
+            "misses": self.verdict_cache_misses,
+            "hit_rate": self.verdict_cache_hits / lookups if lookups else 0.0,
+            "persistent": self.verdict_cache is not None,
+        }
+
+    def _use_structured_output(self) -> bool:
+        """Whether to request schema-constrained verdicts from the judge."""
+        if self.structured_output in ("never", "false", "off"):
+            return False
+        if self.structured_output in ("always", "true", "on"):
+            return True
+        return self.judge_model not in _structured_output_rejected
+
+    async def _call_judge(
+        self,
+        prompt: str,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Send a prompt to the judge model through the breaker and hedging policy.
+
+        If the provider rejects ``response_format`` outright, the judge is
+        remembered as unsupported and the prompt is sent again without it.
+        """
+        params = {"max_tokens": max_tokens, **self.judge_sampling_params}
+        if response_format is not None:
+            params["response_format"] = response_format
+
+        try:
+            response = await self.circuit_breaker.call(
+                lambda: self.hedging.run(
+                    self.judge_model,
+                    lambda: chat_completion(
+                        self.client,
+                        self.judge_model,
+                        [{"role": "user", "content": prompt}],
+                        timeout=self.judge_timeout,
+                        **params,
+                    ),
+                )
+            )
+        except Exception as e:
+            if (
+                response_format is None
+                or self.structured_output != "auto"
+                or is_retryable_error(e)
+                or is_context_length_error(e)
+                or get_error_status_code(e) not in (400, 422)
+            ):
+                raise
+            _structured_output_rejected.add(self.judge_model)
+            print(
+                f"  Structured output not supported by {self.judge_model}, "
+                f"falling back to free-text verdicts: {e}"
+            )
+            return await self._call_judge(prompt, max_tokens)
+
+        return (response.choices[0].message.content or "").strip()
+
+    async def llm_judge_score(
+        self,
+        question: str,
+        model_response: str,
+        ideal_answer: str,
+        max_retries: int = 3,
+    ) -> ScoringResult:
+        """Use LLM as a judge to score the response."""
+
+        # First validate the response
+        is_valid, failure_reason = self.validate_response(model_response)
+        if not is_valid:
+            return ScoringResult(
+                accuracy_score=0.0,
+                method=ScoringMethod.LLM_JUDGE,
+                explanation=f"Invalid response: {failure_reason}",
+                details={"validation_failure": failure_reason, "judge_response": None},
+            )
+
+        question, model_response, ideal_answer = truncate_judge_inputs(
+            question, model_response, ideal_answer, self.judge_model
+        )
+
+        judge_prompt = f"""You are evaluating the accuracy of a model's response to a cybersecurity compliance question.
+
+Question: {question}
+
+Model Response: {model_response}
+
+Ground Truth Answer: {ideal_answer}
+
+CRITICAL INSTRUCTIONS FOR SCORING:
+- If the model response is empty, just error text, or completely irrelevant to cybersecurity, assign score 0.0
+- If the model response is too short to be meaningful (<20 characters), assign maximum score 0.3
+- If the model response doesn't attempt to address the question asked, assign maximum score 0.2
+
+Please evaluate the model's response on the following criteria:
+1. Correctness: Does the model identify the correct compliance requirement(s)?
+2. Completeness: Does the model address all relevant aspects mentioned in the ground truth?
+3. Specificity: Does the model provide specific control/requirement references when appropriate?
+4. Relevance: Does the response actually address the cybersecurity question asked?
+
+Rate the overall accuracy on a scale from 0.0 to 1.0, where:
+- 1.0 = Perfect match with ground truth
+- 0.8-0.9 = Minor differences but substantially correct
+- 0.6-0.7 = Partially correct but missing key elements
+- 0.4-0.5 = Some relevant information but significant errors
+- 0.2-0.3 = Minimal relevance to the correct answer
+- 0.0 = Completely incorrect, irrelevant, empty, or error response
+
+Respond with JSON in this format:
+{{"score": 0.8, "explanation": "Brief explanation of the scoring rationale"}}"""
+
+        # Reuse an earlier verdict for exactly the same judge inputs
+        cache_key = self._verdict_key(question, model_response, ideal_answer)
+        cached = self._get_cached_verdict(cache_key)
+        if cached is not None:
+            return ScoringResult(
+                accuracy_score=cached["score"],
+                method=ScoringMethod.LLM_JUDGE,
+                explanation=cached["explanation"],
+                details={**(cached.get("details") or {}), "cached": True},
+            )
+
+        async def judge_once() -> str:
+            return await self._call_judge(
+                judge_prompt,
+                max_tokens=300,
+                response_format=(
+                    JUDGE_VERDICT_FORMAT if self._use_structured_output() else None
+                ),
+            )
+
+        # Only transport errors are retried; an unparseable reply is final
+        try:
+            judge_response = await retry_with_backoff(
+                judge_once, max_retries=max_retries - 1
+            )
+            score, explanation = parse_judge_verdict(judge_response)
+            verdict = ScoringResult(
+                accuracy_score=score,
+                method=ScoringMethod.LLM_JUDGE,
+                explanation=explanation,
+                details={"judge_response": judge_response},
+            )
+        except JudgeParseError as e:
+            self.judge_parse_failures += 1
+            return ScoringResult(
+                accuracy_score=0.0,
+                method=ScoringMethod.LLM_JUDGE,
+                explanation=f"Error in LLM judge: {e}",
+                details={
+                    "error": str(e),
+                    "error_type": "parse_error",
+                    "judge_response": judge_response,
+                },
+            )
+        except CircuitOpenError as e:
+            # Judge is down; fail fast instead of retrying
+            return ScoringResult(
+                accuracy_score=0.0,
+                method=ScoringMethod.LLM_JUDGE,
+                explanation=f"Error in LLM judge: {e}",
+                details={"error": str(e), "error_type": "circuit_open"},
+            )
+        except Exception as e:  # noqa: BLE001 - reported as a judge error
+            timed_out = isinstance(e, RequestTimeoutError)
+            if timed_out:
+                self.judge_timeout_count += 1
+            return ScoringResult(
+                accuracy_score=0.0,
+                method=ScoringMethod.LLM_JUDGE,
+                explanation=f"Error in LLM judge: {e}",
+                details={
+                    "error": str(e),
+                    "error_type": "timeout" if timed_out else "error",
+                },
+            )
+
+        self._store_verdict(cache_key, verdict)
+        return verdict
+
+    async def batch_llm_judge_score(
+        self,
+        question: str,
+        ideal_answer: str,
+        model_responses: List[str],
+        max_retries: int = 3,
+    ) -> List[ScoringResult]:
+        """Judge several responses to the same question in one judge call.
+
+        Responses are shown to the judge in shuffled order under anonymous
+        labels (A, B, ...) and scored from a JSON array. Each response is
+        truncated as for single judging and each item's own verdict is stored
+        in the verdict cache under the same key as a single verdict. Responses that would push the prompt past the judge's input
+        budget, invalid, already-cached and unparsed items go through
+        ``llm_judge_score`` individually.
+        """
+        results: List[Optional[ScoringResult]] = [None] * len(model_responses)
+        judge_inputs = [
+            truncate_judge_inputs(
+                question, model_response, ideal_answer, self.judge_model
+            )
+            for model_response in model_responses
+        ]
+
+        # Only valid responses without a cached verdict that fit the budget go
+        # into the batch
+        budget = get_judge_input_budget(self.judge_model)
+        used_tokens = max(
+            (
+                estimate_tokens(q, self.judge_model)
+                + estimate_tokens(a, self.judge_model)
+                for q, _, a in judge_inputs
+            ),
+            default=0,
+        )
+        pending: List[int] = []
+        for i, model_response in enumerate(model_responses):
+            is_valid, _ = self.validate_response(model_response)
+            cache_key = self._verdict_key(*judge_inputs[i])
+            if not is_valid or self._has_cached_verdict(cache_key):
+                continue
+            item_tokens = (
+                estimate_tokens(judge_inputs[i][1], self.judge_model)
+                + BATCH_VERDICT_TOKENS
+            )
+            if pending and (
+                used_tokens + item_tokens > budget
+                or judge_inputs[i][0::2] != judge_inputs[pending[0]][0::2]
+            ):
+                continue
+            used_tokens += item_tokens
+            pending.append(i)
+
+        if len(pending) > 1:
+            # Shuffle so labels do not follow input (model) order; seeded by the
+            # batch so the same batch always gets the same prompt
+            random.Random(
+                make_cache_key(*(judge_inputs[i][1] for i in pending))
+            ).shuffle(pending)
+            labels = [_batch_label(n) for n in range(len(pending))]
+            judge_prompt = self._build_batch_judge_prompt(
+                judge_inputs[pending[0]][0],
+                judge_inputs[pending[0]][2],
+                [(label, judge_inputs[i][1]) for label, i in zip(labels, pending)],
+            )
+
+            try:
+                judge_response = await retry_with_backoff(
+                    self._call_judge,
+                    judge_prompt,
+                    BATCH_VERDICT_TOKENS * len(pending) + 100,
+                    max_retries=max_retries - 1,
+                )
+                verdicts = _parse_batch_verdicts(judge_response)
+            except Exception as e:  # noqa: BLE001 - items fall back to single judging
+                print(f"  Batched judging failed for {self.judge_model}: {e}")
+                verdicts = {}
+
+            for label, i in zip(labels, pending):
+                verdict = verdicts.get(label)
+                if verdict is None:
+                    continue
+                # Only this item's verdict, not the whole batch reply
+                result = ScoringResult(
+                    accuracy_score=verdict["score"],
+                    method=ScoringMethod.LLM_JUDGE,
+                    explanation=verdict["explanation"],
+                    details={
+                        "judge_response": json.dumps(
+                            {"label": label, **verdict}, ensure_ascii=False
+                        ),
+                        "batched": True,
+                    },
+                )
+                self._store_verdict(
+                    self._verdict_key(*judge_inputs[i]),
+                    result,
+                )
+                results[i] = result
+                self.batched_verdicts += 1
+
+        # Fall back to single judging (cache hits included) for everything else
+        for i, model_response in enumerate(model_responses):
+            if results[i] is None:
+                results[i] = await self.llm_judge_score(
+                    question, model_response, ideal_answer, max_retries
+                )
+
+        return results
+
+    def _has_cached_verdict(self, cache_key: str) -> bool:
+        """Check for a cached verdict without touching hit statistics."""
+        if self.verdict_cache is not None:
+            return cache_key in self.verdict_cache
+        return cache_key in self._run_verdicts
+
+    def _build_batch_judge_prompt(
+        self, question: str, ideal_answer: str, labeled_responses: List[tuple]
+    ) -> str:
+        """Build the judge prompt for several anonymized responses to one question."""
+        responses_text = "\n\n".join(
+            f"Response {label}:\n{model_response}"
+            for label, model_response in labeled_responses
+        )
+        labels = ", ".join(label for label, _ in labeled_responses)
+
+        return f"""You are evaluating the accuracy of several anonymous responses to the same cybersecurity compliance question. Score each response independently against the ground truth; do not compare responses with each other.
+
+Question: {question}
+
+Ground Truth Answer: {ideal_answer}
+
+{responses_text}
+
+CRITICAL INSTRUCTIONS FOR SCORING:
+- If a response is empty, just error text, or completely irrelevant to cybersecurity, assign score 0.0
+- If a response is too short to be meaningful (<20 characters), assign maximum score 0.3
+- If a response doesn't attempt to address the question asked, assign maximum score 0.2
+
+Evaluate each response on the following criteria:
+1. Correctness: Does it identify the correct compliance requirement(s)?
+2. Completeness: Does it address all relevant aspects mentioned in the ground truth?
+3. Specificity: Does it provide specific control/requirement references when appropriate?
+4. Relevance: Does it actually address the cybersecurity question asked?
+
+Rate the overall accuracy of each response on a scale from 0.0 to 1.0, where:
+- 1.0 = Perfect match with ground truth
+- 0.8-0.9 = Minor differences but substantially correct
+- 0.6-0.7 = Partially correct but missing key elements
+- 0.4-0.5 = Some relevant information but significant errors
+- 0.2-0.3 = Minimal relevance to the correct answer
+- 0.0 = Completely incorrect, irrelevant, empty, or error response
+
+Respond with a JSON array containing one object per response ({labels}), in this format:
+[{{"label": "A", "score": 0.8, "explanation": "Brief explanation of the scoring rationale"}}]"""
+
+    async def prime_batched_verdicts(
+        self, items: List[tuple], batch_size: int = None
+    ) -> None:
+        """Fill the verdict cache for (question, response, ideal_answer) items using batched judging.
+
+        Items are grouped by question and ideal answer. Each group of up to
+        ``batch_size`` distinct responses is judged in a single call.
+        """
+        if batch_size is None:
+            batch_size = get_config_value("Scoring", "judge_batch_size", 8, int)
+
+        groups: Dict[tuple, List[str]] = {}
+        for question, model_response, ideal_answer in items:
+            responses = groups.setdefault((question, ideal_answer), [])
+            if model_response not in responses:
+                responses.append(model_response)
+
+        batches = [
+            (question, ideal_answer, responses[start : start + max(1, batch_size)])
+            for (question, ideal_answer), responses in groups.items()
+            for start in range(0, len(responses), max(1, batch_size))
+        ]
+
+        semaphore = asyncio.Semaphore(
+            max(1, get_config_value("Scoring", "scoring_concurrency", 5, int))
+        )
+
+        async def judge_batch(batch: tuple) -> None:
+            async with semaphore:
+                await self.batch_llm_judge_score(*batch)
+
+        print(
+            f"Batched judging with {self.judge_model}: {len(batches)} judge calls "
+            f"for {sum(len(b[2]) for b in batches)} responses"
+        )
+        await asyncio.gather(*(judge_batch(batch) for batch in batches))
+
+    async def semantic_similarity_score(
+        self, model_response: str, ideal_answer: str
+    ) -> ScoringResult:
+        """Score by embedding cosine similarity to the ideal answer (no judge call)."""
+        is_valid, failure_reason = self.validate_response(model_response)
+        if not is_valid:
+            return ScoringResult(
+                accuracy_score=0.0,
+                method=ScoringMethod.SEMANTIC_SIMILARITY,
+                explanation=f"Invalid response: {failure_reason}",
+                details={"validation_failure": failure_reason},
+            )
+
+        try:
+            similarity = await asyncio.to_thread(
+                get_semantic_similarity_scorer().similarity,
+                model_response,
+                ideal_answer,
+            )
+        except Exception as e:  # noqa: BLE001 - reported as a scoring error
+            return ScoringResult(
+                accuracy_score=0.0,
+                method=ScoringMethod.SEMANTIC_SIMILARITY,
+                explanation=f"Error in semantic similarity: {e}",
+                details={"error": str(e)},
+            )
 
         return ScoringResult(
-            accuracy_score=score,
-            method=ScoringMethod.COMPLETENESS,
-            explanation=explanation,
-            details=coverage_details,
+            accuracy_score=max(0.0, min(1.0, similarity)),
+            method=ScoringMethod.SEMANTIC_SIMILARITY,
+            explanation=f"Cosine similarity to ideal answer: {similarity:.3f}",
+            details={"cosine_similarity": similarity},
         )
 
     async def composite_policy_score(
@@ -1130,6 +2507,7 @@ Respond with JSON in this format:
         - Conciseness (10%): Clear, focused communication
         """
         # First validate the response - CRITICAL: this prevents empty responses from getting high scores
+        # The analysis is memoized, so the component scorers below reuse this text pass
         is_valid, failure_reason = self.validate_response(model_response)
         if not is_valid:
             return ScoringResult(
@@ -1264,6 +2642,7 @@ Respond with JSON in this format:
         model_response: str,
         ideal_answer: str,
         methods: List[ScoringMethod] = None,
+        model_name: Optional[str] = None,
     ) -> Dict[ScoringMethod, ScoringResult]:
         """Score a model response using multiple methods."""
         if methods is None:
@@ -1284,9 +2663,14 @@ Respond with JSON in this format:
                     model_response, ideal_answer
                 )
             elif method == ScoringMethod.LLM_JUDGE:
-                results[method] = await self.llm_judge_score(
-                    question, model_response, ideal_answer
+                verdict = await self.pre_judge.assess(
+                    question, model_response, ideal_answer, model_name
                 )
+                if verdict is None:
+                    verdict = await self.llm_judge_score(
+                        question, model_response, ideal_answer
+                    )
+                results[method] = verdict
             elif method == ScoringMethod.STRUCTURAL_VALIDATION:
                 results[method] = self.structural_validation_score(
                     model_response, question
@@ -1305,9 +2689,23 @@ Respond with JSON in this format:
                 results[method] = self.completeness_score(
                     model_response, question, ideal_answer
                 )
+            elif method == ScoringMethod.SEMANTIC_SIMILARITY:
+                results[method] = await self.semantic_similarity_score(
+                    model_response, ideal_answer
+                )
 
         return results
 
+    async def score_result(
+        self,
+        result: Dict[str, Any],
+        scoring_methods: List[ScoringMethod] = None,
+    ) -> Dict[str, Any]:
+        """Score a single evaluation result and return a scored copy."""
+        return await score_evaluation_result(
+            self.score_response, result, scoring_methods
+        )
+
     async def score_evaluation_results(
         self,
         evaluation_results: Dict[str, List],
@@ -1317,70 +2715,52 @@ Respond with JSON in this format:
         if scoring_methods is None:
             scoring_methods = [ScoringMethod.CONTROL_REFERENCE, ScoringMethod.LLM_JUDGE]
 
-        scored_results = {}
-
-        for model_name, results in evaluation_results.items():
-            print(f"Scoring results for {model_name}...")
-            scored_model_results = []
-
-            for i, result in enumerate(results):
-                try:
-                    # Score the response
-                    scores = await self.score_response(
-                        result["question"],
-                        result["model_response"],
-                        result["ideal_answer"],
-                        scoring_methods,
+        if ScoringMethod.LLM_JUDGE in scoring_methods:
+            await self.pre_judge.prime_results(evaluation_results)
+
+        if self.batch_judging and ScoringMethod.LLM_JUDGE in scoring_methods:
+            await self.prime_batched_verdicts(
+                [
+                    (r["question"], r["model_response"], r["ideal_answer"])
+                    for results in evaluation_results.values()
+                    for r in results
+                    if self.pre_judge.needs_judge(
+                        r["question"], r["model_response"], r["ideal_answer"]
                     )
+                ]
+            )
 
-                    # Add scores to result (create a copy of the dict)
-                    result_with_scores = dict(result)
-                    result_with_scores["scores"] = {
-                        method.value: {
-                            "score": scoring_result.accuracy_score,
-                            "explanation": scoring_result.explanation,
-                            "details": scoring_result.details,
-                        }
-                        for method, scoring_result in scores.items()
-                    }
-
-                    # Set primary accuracy score (use LLM judge if available, otherwise control reference)
-                    if ScoringMethod.LLM_JUDGE in scores:
-                        result_with_scores["accuracy_score"] = scores[
-                            ScoringMethod.LLM_JUDGE
-                        ].accuracy_score
-                    elif ScoringMethod.CONTROL_REFERENCE in scores:
-                        result_with_scores["accuracy_score"] = scores[
-                            ScoringMethod.CONTROL_REFERENCE
-                        ].accuracy_score
-                    else:
-                        result_with_scores["accuracy_score"] = 0.0
-
-                    scored_model_results.append(result_with_scores)
-
-                    if (i + 1) % 5 == 0:
-                        print(f"  Scored {i + 1}/{len(results)} results")
-
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.2)
-
-                except Exception as e:
-                    print(f"  Error scoring result {i + 1}: {e}")
-                    # Add result with zero score (create a copy of the dict)
-                    result_with_scores = dict(result)
-                    result_with_scores["accuracy_score"] = 0.0
-                    result_with_scores["scores"] = {"error": str(e)}
-                    scored_model_results.append(result_with_scores)
-
-            scored_results[model_name] = scored_model_results
-            print(f"  Completed scoring for {model_name}")
+        if ScoringMethod.SEMANTIC_SIMILARITY in scoring_methods:
+            await prime_semantic_similarities(evaluation_results)
 
-        return scored_results
+        heuristic_methods = [m for m in scoring_methods if m in self.heuristic_methods]
+        if heuristic_methods and get_heuristic_workers() > 0:
+            return await score_results_offloaded(
+                self.score_response,
+                evaluation_results,
+                scoring_methods,
+                heuristic_methods,
+            )
+
+        return await score_results_concurrently(
+            lambda result: self.score_result(result, scoring_methods),
+            evaluation_results,
+        )
 
 
 class TwoJudgeScorer:
     """Dual judge scorer with graceful fallback handling."""
 
+    # Judge-free methods score_response supports, which may run in the heuristic pool
+    heuristic_methods = frozenset(
+        {
+            ScoringMethod.EXACT_MATCH,
+            ScoringMethod.CONTROL_REFERENCE,
+            ScoringMethod.STRUCTURAL_VALIDATION,
+            ScoringMethod.CITATION_VERIFICATION,
+        }
+    )
+
     def __init__(
         self,
         judge_model_1: str = None,
@@ -1389,6 +2769,7 @@ class TwoJudgeScorer:
         judge_weight_2: float = None,
         client: Optional[openai.OpenAI] = None,
         config_overrides: Optional[Dict[str, Any]] = None,
+        verdict_cache: Optional[JsonlCache] = None,
     ):
         """Initialize dual judge scorer with dependency injection.
 
@@ -1399,6 +2780,7 @@ class TwoJudgeScorer:
             judge_weight_2: Weight for secondary judge
             client: OpenAI client for API calls
             config_overrides: Override configuration values
+            verdict_cache: Persistent judge verdict cache shared by both judges
         """
         self.config_overrides = config_overrides or {}
 
@@ -1455,10 +2837,10 @@ class TwoJudgeScorer:
 
         self.client = client or get_openai_client()
         self.single_scorer_1 = AccuracyScorer(
-            self.judge_model_1, self.client, self.config_overrides
+            self.judge_model_1, self.client, self.config_overrides, verdict_cache
         )
         self.single_scorer_2 = AccuracyScorer(
-            self.judge_model_2, self.client, self.config_overrides
+            self.judge_model_2, self.client, self.config_overrides, verdict_cache
         )
 
         # Statistics tracking
@@ -1468,6 +2850,24 @@ class TwoJudgeScorer:
         self.judge_2_failure_count = 0
         self.dual_success_count = 0
         self.fallback_used_count = 0
+        self.dual_scoring_attempts = 0
+        self.batch_judging = get_config_value("Scoring", "batch_judging", False, bool)
+        self.pre_judge = get_pre_judge()
+
+        # Cascade mode: call judge 2 only when judge 1 is uncertain or disagrees
+        # with the heuristic scorers
+        self.judge_cascade = get_config_value("Scoring", "judge_cascade", False, bool)
+        self.cascade_uncertain_low = get_config_value(
+            "Scoring", "cascade_uncertain_low", 0.3, float
+        )
+        self.cascade_uncertain_high = get_config_value(
+            "Scoring", "cascade_uncertain_high", 0.7, float
+        )
+        self.cascade_heuristic_tolerance = get_config_value(
+            "Scoring", "cascade_heuristic_tolerance", 0.4, float
+        )
+        self.cascade_triggered_count = 0
+        self.cascade_skipped_count = 0
 
     def _get_fallback_judge_model(self, judge_num: int) -> str:
         """Get fallback judge model from centralized config."""
@@ -1517,10 +2917,11 @@ class TwoJudgeScorer:
         max_retries: int = 2,
     ) -> ScoringResult:
         """Use two LLMs as judges with graceful fallback handling."""
+        self.dual_scoring_attempts += 1
 
-        # Try both judges in parallel
-        judge_1_task = asyncio.create_task(
-            self._safe_judge_score(
+        if self.judge_cascade:
+            # Judge 1 first; judge 2 only when judge 1 is uncertain or suspicious
+            judge_1_result = await self._safe_judge_score(
                 self.single_scorer_1,
                 question,
                 model_response,
@@ -1528,9 +2929,26 @@ class TwoJudgeScorer:
                 "Judge 1",
                 max_retries,
             )
-        )
-        judge_2_task = asyncio.create_task(
-            self._safe_judge_score(
+            judge_1_score = self._record_judge_outcome(1, judge_1_result)
+
+            trigger = self._cascade_trigger(
+                judge_1_score, question, model_response, ideal_answer
+            )
+            if trigger is None:
+                self.cascade_skipped_count += 1
+                return ScoringResult(
+                    accuracy_score=judge_1_score,
+                    method=ScoringMethod.LLM_JUDGE,
+                    explanation=f"Judge 1 only: {judge_1_score:.3f} (cascade: judge 2 not needed)",
+                    details={
+                        "judge_1_score": judge_1_score,
+                        "judge_2_score": None,
+                        "cascade": "judge_1_confident",
+                    },
+                )
+
+            self.cascade_triggered_count += 1
+            judge_2_result = await self._safe_judge_score(
                 self.single_scorer_2,
                 question,
                 model_response,
@@ -1538,52 +2956,40 @@ class TwoJudgeScorer:
                 "Judge 2",
                 max_retries,
             )
-        )
-
-        # Wait for both to complete
-        judge_1_result, judge_2_result = await asyncio.gather(
-            judge_1_task, judge_2_task, return_exceptions=True
-        )
-
-        # Handle results and exceptions
-        judge_1_score = None
-        judge_2_score = None
-
-        if (
-            isinstance(judge_1_result, ScoringResult)
-            and judge_1_result.accuracy_score > 0
-        ):
-            judge_1_score = judge_1_result.accuracy_score
-            self.judge_1_success_count += 1
-        else:
-            self.judge_1_failure_count += 1
-            if isinstance(judge_1_result, Exception):
-                print(f"Judge 1 ({self.judge_model_1}) failed: {judge_1_result}")
-            elif isinstance(judge_1_result, ScoringResult):
-                print(
-                    f"Judge 1 ({self.judge_model_1}) returned score 0: {judge_1_result.explanation}"
-                )
+            judge_2_score = self._record_judge_outcome(2, judge_2_result)
 
-        if (
-            isinstance(judge_2_result, ScoringResult)
-            and judge_2_result.accuracy_score > 0
-        ):
-            judge_2_score = judge_2_result.accuracy_score
-            self.judge_2_success_count += 1
         else:
-            self.judge_2_failure_count += 1
-            if isinstance(judge_2_result, Exception):
-                print(f"Judge 2 ({self.judge_model_2}) failed: {judge_2_result}")
-            elif isinstance(judge_2_result, ScoringResult):
-                print(
-                    f"Judge 2 ({self.judge_model_2}) returned score 0: {judge_2_result.explanation}"
-                )
+            # Try both judges in parallel
+            judge_1_result, judge_2_result = await asyncio.gather(
+                self._safe_judge_score(
+                    self.single_scorer_1,
+                    question,
+                    model_response,
+                    ideal_answer,
+                    "Judge 1",
+                    max_retries,
+                ),
+                self._safe_judge_score(
+                    self.single_scorer_2,
+                    question,
+                    model_response,
+                    ideal_answer,
+                    "Judge 2",
+                    max_retries,
+                ),
+                return_exceptions=True,
+            )
+            judge_1_score = self._record_judge_outcome(1, judge_1_result)
+            judge_2_score = self._record_judge_outcome(2, judge_2_result)
 
         # Determine final score using graceful fallback logic
         final_score, explanation, scoring_details = self._compute_final_score(
             judge_1_score, judge_2_score, judge_1_result, judge_2_result
         )
 
+        if self.judge_cascade:
+            scoring_details["cascade"] = trigger
+
         return ScoringResult(
             accuracy_score=final_score,
             method=ScoringMethod.LLM_JUDGE,
@@ -1591,6 +2997,58 @@ class TwoJudgeScorer:
             details=scoring_details,
         )
 
+    def _record_judge_outcome(self, judge_num: int, judge_result) -> Optional[float]:
+        """Update judge success/failure counters and return the judge's score.
+
+        Returns None only if the judge failed; a verdict of 0.0 is a score.
+        """
+        judge_model = self.judge_model_1 if judge_num == 1 else self.judge_model_2
+
+        if not judge_failed(judge_result):
+            if judge_num == 1:
+                self.judge_1_success_count += 1
+            else:
+                self.judge_2_success_count += 1
+            return judge_result.accuracy_score
+
+        if judge_num == 1:
+            self.judge_1_failure_count += 1
+        else:
+            self.judge_2_failure_count += 1
+        if isinstance(judge_result, Exception):
+            print(f"Judge {judge_num} ({judge_model}) failed: {judge_result}")
+        else:
+            print(
+                f"Judge {judge_num} ({judge_model}) failed: {judge_result.explanation}"
+            )
+        return None
+
+    def _cascade_trigger(
+        self,
+        judge_1_score: Optional[float],
+        question: str,
+        model_response: str,
+        ideal_answer: str,
+    ) -> Optional[str]:
+        """Return why judge 2 is needed in cascade mode, or None if judge 1 suffices."""
+        if judge_1_score is None:
+            return "judge_1_failed"
+
+        if self.cascade_uncertain_low <= judge_1_score <= self.cascade_uncertain_high:
+            return "uncertain_band"
+
+        # Cheap heuristics as a sanity check on judge 1
+        heuristic_score = (
+            self.control_reference_score(model_response, ideal_answer).accuracy_score
+            + self.single_scorer_1.completeness_score(
+                model_response, question, ideal_answer
+            ).accuracy_score
+        ) / 2
+        if abs(judge_1_score - heuristic_score) > self.cascade_heuristic_tolerance:
+            return "heuristic_disagreement"
+
+        return None
+
     async def _safe_judge_score(
         self,
         scorer: AccuracyScorer,
@@ -1602,28 +3060,15 @@ class TwoJudgeScorer:
     ) -> ScoringResult:
         """Safely call a judge scorer with error handling."""
         try:
-            # Truncate inputs if they're too long to prevent context window issues
-            max_input_length = 8000  # Conservative limit
-            if len(question + model_response + ideal_answer) > max_input_length:
-                # Truncate model response first, then question if needed
-                available_length = max_input_length - len(ideal_answer) - 100  # Buffer
-                if len(question) + len(model_response) > available_length:
-                    if len(model_response) > available_length // 2:
-                        model_response = (
-                            model_response[: available_length // 2] + "...[truncated]"
-                        )
-                    if len(question) > available_length // 2:
-                        question = question[: available_length // 2] + "...[truncated]"
-
             return await scorer.llm_judge_score(
                 question, model_response, ideal_answer, max_retries
             )
-        except Exception as e:
+        except Exception as e:  # noqa: BLE001 - the other judge is used instead
             print(f"{judge_name} scoring failed: {e}")
             return ScoringResult(
                 accuracy_score=0.0,
                 method=ScoringMethod.LLM_JUDGE,
-                explanation=f"{judge_name} failed: {str(e)}",
+                explanation=f"{judge_name} failed: {e}",
                 details={"error": str(e), "judge": judge_name},
             )
 
@@ -1714,6 +3159,7 @@ class TwoJudgeScorer:
         model_response: str,
         ideal_answer: str,
         methods: List[ScoringMethod] = None,
+        model_name: Optional[str] = None,
     ) -> Dict[ScoringMethod, ScoringResult]:
         """Score a model response using multiple methods with dual judge support."""
         if methods is None:
@@ -1734,9 +3180,14 @@ class TwoJudgeScorer:
                     model_response, ideal_answer
                 )
             elif method == ScoringMethod.LLM_JUDGE:
-                results[method] = await self.dual_llm_judge_score(
-                    question, model_response, ideal_answer
+                verdict = await self.pre_judge.assess(
+                    question, model_response, ideal_answer, model_name
                 )
+                if verdict is None:
+                    verdict = await self.dual_llm_judge_score(
+                        question, model_response, ideal_answer
+                    )
+                results[method] = verdict
             elif method == ScoringMethod.STRUCTURAL_VALIDATION:
                 results[method] = self.single_scorer_1.structural_validation_score(
                     model_response, question
@@ -1745,9 +3196,23 @@ class TwoJudgeScorer:
                 results[method] = self.single_scorer_1.citation_verification_score(
                     model_response
                 )
+            elif method == ScoringMethod.SEMANTIC_SIMILARITY:
+                results[method] = await self.single_scorer_1.semantic_similarity_score(
+                    model_response, ideal_answer
+                )
 
         return results
 
+    async def score_result(
+        self,
+        result: Dict[str, Any],
+        scoring_methods: List[ScoringMethod] = None,
+    ) -> Dict[str, Any]:
+        """Score a single evaluation result with the dual judge system."""
+        return await score_evaluation_result(
+            self.score_response, result, scoring_methods
+        )
+
     async def score_evaluation_results(
         self,
         evaluation_results: Dict[str, List],
@@ -1757,82 +3222,63 @@ class TwoJudgeScorer:
         if scoring_methods is None:
             scoring_methods = [ScoringMethod.CONTROL_REFERENCE, ScoringMethod.LLM_JUDGE]
 
-        scored_results = {}
+        if ScoringMethod.LLM_JUDGE in scoring_methods:
+            await self.pre_judge.prime_results(evaluation_results)
 
-        for model_name, results in evaluation_results.items():
-            print(f"Scoring results for {model_name} using dual judge system...")
-            scored_model_results = []
+        if self.batch_judging and ScoringMethod.LLM_JUDGE in scoring_methods:
+            items = [
+                (r["question"], r["model_response"], r["ideal_answer"])
+                for results in evaluation_results.values()
+                for r in results
+                if self.pre_judge.needs_judge(
+                    r["question"], r["model_response"], r["ideal_answer"]
+                )
+            ]
+            # In cascade mode judge 2 only sees the items judge 1 escalates
+            primed = [self.single_scorer_1]
+            if not self.judge_cascade:
+                primed.append(self.single_scorer_2)
+            await asyncio.gather(
+                *(scorer.prime_batched_verdicts(items) for scorer in primed)
+            )
 
-            for i, result in enumerate(results):
-                try:
-                    # Score the response
-                    scores = await self.score_response(
-                        result["question"],
-                        result["model_response"],
-                        result["ideal_answer"],
-                        scoring_methods,
-                    )
+        if ScoringMethod.SEMANTIC_SIMILARITY in scoring_methods:
+            await prime_semantic_similarities(evaluation_results)
+
+        print("Scoring results using dual judge system...")
+        heuristic_methods = [m for m in scoring_methods if m in self.heuristic_methods]
+        if heuristic_methods and get_heuristic_workers() > 0:
+            scored_results = await score_results_offloaded(
+                self.score_response,
+                evaluation_results,
+                scoring_methods,
+                heuristic_methods,
+            )
+        else:
+            scored_results = await score_results_concurrently(
+                lambda result: self.score_result(result, scoring_methods),
+                evaluation_results,
+            )
 
-                    # Add scores to result
-                    result_with_scores = dict(result)
-                    result_with_scores["scores"] = {
-                        method.value: {
-                            "score": scoring_result.accuracy_score,
-                            "explanation": scoring_result.explanation,
-                            "details": scoring_result.details,
-                        }
-                        for method, scoring_result in scores.items()
-                    }
-
-                    # Set primary accuracy score (use LLM judge if available, otherwise control reference)
-                    if ScoringMethod.LLM_JUDGE in scores:
-                        result_with_scores["accuracy_score"] = scores[
-                            ScoringMethod.LLM_JUDGE
-                        ].accuracy_score
-                    elif ScoringMethod.CONTROL_REFERENCE in scores:
-                        result_with_scores["accuracy_score"] = scores[
-                            ScoringMethod.CONTROL_REFERENCE
-                        ].accuracy_score
-                    else:
-                        result_with_scores["accuracy_score"] = 0.0
-
-                    scored_model_results.append(result_with_scores)
-
-                    if (i + 1) % 5 == 0:
-                        print(f"  Scored {i + 1}/{len(results)} results")
-
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.2)
-
-                except Exception as e:
-                    print(f"  Error scoring result {i + 1}: {e}")
-                    # Add result with zero score
-                    result_with_scores = dict(result)
-                    result_with_scores["accuracy_score"] = 0.0
-                    result_with_scores["scores"] = {"error": str(e)}
-                    scored_model_results.append(result_with_scores)
-
-            scored_results[model_name] = scored_model_results
-            print(f"  Completed scoring for {model_name}")
-            print(
-                f"  Judge statistics: J1 success: {self.judge_1_success_count}, "
-                f"J1 failures: {self.judge_1_failure_count}, "
-                f"J2 success: {self.judge_2_success_count}, "
-                f"J2 failures: {self.judge_2_failure_count}, "
-                f"Dual success: {self.dual_success_count}, "
-                f"Fallbacks used: {self.fallback_used_count}"
+        print(
+            f"  Judge statistics: J1 success: {self.judge_1_success_count}, "
+            f"J1 failures: {self.judge_1_failure_count}, "
+            f"J2 success: {self.judge_2_success_count}, "
+            f"J2 failures: {self.judge_2_failure_count}, "
+            f"Dual success: {self.dual_success_count}, "
+            f"Fallbacks used: {self.fallback_used_count}"
+            + (
+                f", Judge 1 only (cascade): {self.cascade_skipped_count}"
+                if self.judge_cascade
+                else ""
             )
+        )
 
         return scored_results
 
     def get_judge_statistics(self) -> Dict[str, Any]:
         """Get statistics about judge performance."""
-        total_attempts = (
-            self.judge_1_success_count
-            + self.judge_1_failure_count
-            + self.judge_2_success_count
-            + self.judge_2_failure_count
-        ) // 2
+        total_attempts = self.dual_scoring_attempts
 
         return {
             "total_scoring_attempts": total_attempts,
@@ -1852,5 +3298,357 @@ class TwoJudgeScorer:
             },
             "dual_success_count": self.dual_success_count,
             "fallback_used_count": self.fallback_used_count,
-            "dual_success_rate": self.dual_success_count / max(1, total_attempts),
+            # Items the cascade resolved with judge 1 alone never needed judge 2
+            "dual_success_rate": self.dual_success_count
+            / max(1, total_attempts - self.cascade_skipped_count),
+            "judge_timeouts": self.single_scorer_1.judge_timeout_count
+            + self.single_scorer_2.judge_timeout_count,
+            "judge_parse_failures": self.single_scorer_1.judge_parse_failures
+            + self.single_scorer_2.judge_parse_failures,
+            "verdict_cache": self.get_verdict_cache_stats(),
+            "cascade": {
+                "enabled": self.judge_cascade,
+                "triggered": self.cascade_triggered_count,
+                "skipped": self.cascade_skipped_count,
+                "trigger_rate": self.cascade_triggered_count
+                / max(1, self.cascade_triggered_count + self.cascade_skipped_count),
+            },
+        }
+
+    def get_verdict_cache_stats(self) -> Dict[str, Any]:
+        """Get judge verdict cache statistics across both judges."""
+        stats_1 = self.single_scorer_1.get_verdict_cache_stats()
+        stats_2 = self.single_scorer_2.get_verdict_cache_stats()
+        hits = stats_1["hits"] + stats_2["hits"]
+        lookups = hits + stats_1["misses"] + stats_2["misses"]
+        return {
+            "hits": hits,
+            "misses": stats_1["misses"] + stats_2["misses"],
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "persistent": stats_1["persistent"],
+        }
+
+
+class EnsembleJudgeScorer:
+    """N-judge ensemble scorer that stops as soon as enough judges agree."""
+
+    # Judge-free methods score_response supports, which may run in the heuristic pool
+    heuristic_methods = frozenset(
+        {
+            ScoringMethod.EXACT_MATCH,
+            ScoringMethod.CONTROL_REFERENCE,
+            ScoringMethod.STRUCTURAL_VALIDATION,
+            ScoringMethod.CITATION_VERIFICATION,
+        }
+    )
+
+    def __init__(
+        self,
+        judge_models: List[str] = None,
+        client: Optional[openai.OpenAI] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+        verdict_cache: Optional[JsonlCache] = None,
+    ):
+        """Initialize ensemble scorer with dependency injection.
+
+        Args:
+            judge_models: Judge models in the order they are consulted
+            client: OpenAI client for API calls
+            config_overrides: Override configuration values
+            verdict_cache: Persistent judge verdict cache shared by all judges
+        """
+        self.config_overrides = config_overrides or {}
+
+        if judge_models is None:
+            judge_models_str = get_config_value("Models", "judge_models", "")
+            judge_models = [m.strip() for m in judge_models_str.split(",") if m.strip()]
+            max_judges = get_config_value("Models", "max_judge_models", 4, int)
+            judge_models = judge_models[:max_judges]
+
+        if len(judge_models) < 2:
+            raise ConfigError("At least 2 judge models required for ensemble scoring")
+
+        self.judge_models = judge_models
+        self.client = client or get_openai_client()
+        self.judges = [
+            AccuracyScorer(model, self.client, self.config_overrides, verdict_cache)
+            for model in judge_models
+        ]
+
+        # Stop once at least min_agreeing judges, making up min_consensus_threshold
+        # of the judges consulted so far, lie within max_score_deviation
+        self.max_score_deviation = self.config_overrides.get(
+            "max_score_deviation",
+            get_config_value("Scoring", "max_score_deviation", 0.3, float),
+        )
+        self.min_consensus_threshold = self.config_overrides.get(
+            "min_consensus_threshold",
+            get_config_value("Scoring", "min_consensus_threshold", 0.7, float),
+        )
+        self.min_agreeing = self.config_overrides.get(
+            "ensemble_min_agreeing",
+            get_config_value("Scoring", "ensemble_min_agreeing", 2, int),
+        )
+
+        # Statistics tracking
+        self.ensemble_scoring_attempts = 0
+        self.consensus_count = 0
+        self.judges_used_counts: Dict[int, int] = {}
+        self.judge_success_counts = {model: 0 for model in judge_models}
+        self.judge_failure_counts = {model: 0 for model in judge_models}
+        self.pre_judge = get_pre_judge()
+
+    def exact_match_score(
+        self, model_response: str, ideal_answer: str
+    ) -> ScoringResult:
+        """Delegate to first judge's exact match scoring."""
+        return self.judges[0].exact_match_score(model_response, ideal_answer)
+
+    def control_reference_score(
+        self, model_response: str, ideal_answer: str
+    ) -> ScoringResult:
+        """Delegate to first judge's control reference scoring."""
+        return self.judges[0].control_reference_score(model_response, ideal_answer)
+
+    def _largest_agreeing_group(self, scores: List[float]) -> List[float]:
+        """Largest set of scores whose spread is within max_score_deviation."""
+        ordered = sorted(scores)
+        best: List[float] = []
+        start = 0
+        for end in range(len(ordered)):
+            while ordered[end] - ordered[start] > self.max_score_deviation + 1e-9:
+                start += 1
+            if end - start + 1 > len(best):
+                best = ordered[start : end + 1]
+        return best
+
+    def _has_consensus(self, scores: List[float]) -> bool:
+        agreeing = self._largest_agreeing_group(scores)
+        return (
+            len(agreeing) >= self.min_agreeing
+            and len(agreeing) / len(scores) >= self.min_consensus_threshold
+        )
+
+    async def ensemble_llm_judge_score(
+        self,
+        question: str,
+        model_response: str,
+        ideal_answer: str,
+        max_retries: int = 2,
+    ) -> ScoringResult:
+        """Consult judges incrementally until enough of them agree."""
+        self.ensemble_scoring_attempts += 1
+
+        # Invalid responses score 0 without consulting any judge
+        is_valid, _ = self.judges[0].validate_response(model_response)
+        if not is_valid:
+            return await self.judges[0].llm_judge_score(
+                question, model_response, ideal_answer, max_retries
+            )
+
+        async def consult(judge: AccuracyScorer) -> Optional[float]:
+            result = await judge.llm_judge_score(
+                question, model_response, ideal_answer, max_retries
+            )
+            if not judge_failed(result):
+                self.judge_success_counts[judge.judge_model] += 1
+                return result.accuracy_score
+            self.judge_failure_counts[judge.judge_model] += 1
+            print(f"Ensemble judge ({judge.judge_model}) failed: {result.explanation}")
+            return None
+
+        # Keyed by judge index: the same model may sit in the ensemble twice.
+        # Two judges are needed before agreement means anything; add one at a time after that
+        judge_scores: Dict[int, Optional[float]] = {}
+        initial = self.judges[: self.min_agreeing]
+        for index, score in enumerate(
+            await asyncio.gather(*(consult(j) for j in initial))
+        ):
+            judge_scores[index] = score
+
+        consensus = False
+        for index in range(len(initial), len(self.judges)):
+            successful = [s for s in judge_scores.values() if s is not None]
+            if successful and self._has_consensus(successful):
+                break
+            judge_scores[index] = await consult(self.judges[index])
+
+        successful = [s for s in judge_scores.values() if s is not None]
+        judges_used = len(judge_scores)
+        self.judges_used_counts[judges_used] = (
+            self.judges_used_counts.get(judges_used, 0) + 1
+        )
+
+        if not successful:
+            final_score = 0.0
+            explanation = "All ensemble judges failed"
+        elif self._has_consensus(successful):
+            consensus = True
+            self.consensus_count += 1
+            agreeing = self._largest_agreeing_group(successful)
+            final_score = sum(agreeing) / len(agreeing)
+            explanation = (
+                f"Ensemble consensus: {final_score:.3f} "
+                f"({len(agreeing)}/{len(successful)} judges agree, {judges_used} consulted)"
+            )
+        else:
+            ordered = sorted(successful)
+            mid = len(ordered) // 2
+            final_score = (
+                ordered[mid]
+                if len(ordered) % 2
+                else (ordered[mid - 1] + ordered[mid]) / 2
+            )
+            explanation = (
+                f"Ensemble median: {final_score:.3f} "
+                f"(no consensus among {len(successful)} judges) [HIGH DISCREPANCY]"
+            )
+
+        return ScoringResult(
+            accuracy_score=final_score,
+            method=ScoringMethod.LLM_JUDGE,
+            explanation=explanation,
+            details={
+                "judge_scores": judge_scores,
+                "judges_used": judges_used,
+                "consensus": consensus,
+            },
+        )
+
+    async def score_response(
+        self,
+        question: str,
+        model_response: str,
+        ideal_answer: str,
+        methods: List[ScoringMethod] = None,
+        model_name: Optional[str] = None,
+    ) -> Dict[ScoringMethod, ScoringResult]:
+        """Score a model response using multiple methods with ensemble judging."""
+        if methods is None:
+            methods = [
+                ScoringMethod.CONTROL_REFERENCE,
+                ScoringMethod.LLM_JUDGE,
+                ScoringMethod.STRUCTURAL_VALIDATION,
+                ScoringMethod.CITATION_VERIFICATION,
+            ]
+
+        results = {}
+
+        for method in methods:
+            if method == ScoringMethod.EXACT_MATCH:
+                results[method] = self.exact_match_score(model_response, ideal_answer)
+            elif method == ScoringMethod.CONTROL_REFERENCE:
+                results[method] = self.control_reference_score(
+                    model_response, ideal_answer
+                )
+            elif method == ScoringMethod.LLM_JUDGE:
+                verdict = await self.pre_judge.assess(
+                    question, model_response, ideal_answer, model_name
+                )
+                if verdict is None:
+                    verdict = await self.ensemble_llm_judge_score(
+                        question, model_response, ideal_answer
+                    )
+                results[method] = verdict
+            elif method == ScoringMethod.STRUCTURAL_VALIDATION:
+                results[method] = self.judges[0].structural_validation_score(
+                    model_response, question
+                )
+            elif method == ScoringMethod.CITATION_VERIFICATION:
+                results[method] = self.judges[0].citation_verification_score(
+                    model_response
+                )
+            elif method == ScoringMethod.SEMANTIC_SIMILARITY:
+                results[method] = await self.judges[0].semantic_similarity_score(
+                    model_response, ideal_answer
+                )
+
+        return results
+
+    async def score_result(
+        self,
+        result: Dict[str, Any],
+        scoring_methods: List[ScoringMethod] = None,
+    ) -> Dict[str, Any]:
+        """Score a single evaluation result with the judge ensemble."""
+        return await score_evaluation_result(
+            self.score_response, result, scoring_methods
+        )
+
+    async def score_evaluation_results(
+        self,
+        evaluation_results: Dict[str, List],
+        scoring_methods: List[ScoringMethod] = None,
+    ) -> Dict[str, List]:
+        """Score all evaluation results with the judge ensemble."""
+        if scoring_methods is None:
+            scoring_methods = [ScoringMethod.CONTROL_REFERENCE, ScoringMethod.LLM_JUDGE]
+
+        if ScoringMethod.LLM_JUDGE in scoring_methods:
+            await self.pre_judge.prime_results(evaluation_results)
+
+        if ScoringMethod.SEMANTIC_SIMILARITY in scoring_methods:
+            await prime_semantic_similarities(evaluation_results)
+
+        print(f"Scoring results using {len(self.judges)}-judge ensemble...")
+        heuristic_methods = [m for m in scoring_methods if m in self.heuristic_methods]
+        if heuristic_methods and get_heuristic_workers() > 0:
+            scored_results = await score_results_offloaded(
+                self.score_response,
+                evaluation_results,
+                scoring_methods,
+                heuristic_methods,
+            )
+        else:
+            scored_results = await score_results_concurrently(
+                lambda result: self.score_result(result, scoring_methods),
+                evaluation_results,
+            )
+
+        stats = self.get_judge_statistics()
+        print(
+            f"  Ensemble statistics: consensus rate: {stats['consensus_rate']:.1%}, "
+            f"average judges per item: {stats['average_judges_used']:.2f}"
+        )
+
+        return scored_results
+
+    def get_judge_statistics(self) -> Dict[str, Any]:
+        """Get statistics about ensemble judge usage."""
+        total_attempts = self.ensemble_scoring_attempts
+        judged_items = sum(self.judges_used_counts.values())
+
+        return {
+            "total_scoring_attempts": total_attempts,
+            "judges": {
+                model: {
+                    "success_count": self.judge_success_counts[model],
+                    "failure_count": self.judge_failure_counts[model],
+                }
+                for model in self.judge_models
+            },
+            "judges_used_distribution": dict(sorted(self.judges_used_counts.items())),
+            "average_judges_used": sum(
+                used * count for used, count in self.judges_used_counts.items()
+            )
+            / max(1, judged_items),
+            "consensus_count": self.consensus_count,
+            "consensus_rate": self.consensus_count / max(1, judged_items),
+            "judge_timeouts": sum(judge.judge_timeout_count for judge in self.judges),
+            "judge_parse_failures": sum(
+                judge.judge_parse_failures for judge in self.judges
+            ),
+            "verdict_cache": self.get_verdict_cache_stats(),
+        }
+
+    def get_verdict_cache_stats(self) -> Dict[str, Any]:
+        """Get judge verdict cache statistics across all judges."""
+        judge_stats = [judge.get_verdict_cache_stats() for judge in self.judges]
+        hits = sum(stats["hits"] for stats in judge_stats)
+        misses = sum(stats["misses"] for stats in judge_stats)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "persistent": judge_stats[0]["persistent"],
         }
@@ -6,15 +6,20 @@ configuration management, API client initialization, retry logic, and error hand
 """
 
 import asyncio
+import inspect
 import json
 import logging
+import math
 import os
+import random
 import time
 from typing import Dict, Any, Optional, Union, Callable, TypeVar
 from pathlib import Path
 import configparser
 import openai
+import requests
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 
 # Type variable for generic retry functions
 T = TypeVar("T")
@@ -206,11 +211,14 @@ def get_openai_client() -> openai.OpenAI:
     """
     config = get_config()
 
+    # Retries are handled by retry_with_backoff, not inside the SDK
     # Try OpenRouter first
     openrouter_key = config.get("OpenRouter", "api_key", fallback="").strip()
     if openrouter_key and openrouter_key != "your-openrouter-key":
         return openai.OpenAI(
-            base_url="https://openrouter.ai/api/v1", api_key=openrouter_key
+            base_url="https://openrouter.ai/api/v1",
+            api_key=openrouter_key,
+            max_retries=0,
         )
 
     # Try OpenAI
@@ -219,38 +227,192 @@ def get_openai_client() -> openai.OpenAI:
         openai_url = config.get("OpenAI", "openai_compatible_url", fallback=None)
         base_url = openai_url if openai_url and openai_url.strip() else None
 
-        return openai.OpenAI(api_key=openai_key, base_url=base_url)
+        return openai.OpenAI(api_key=openai_key, base_url=base_url, max_retries=0)
 
     # No valid keys found
     raise APIError("No valid API keys found in configuration")
 
 
+# HTTP status codes worth retrying (server errors, 5xx, are retried too)
+RETRYABLE_STATUS_CODES = {408, 429}
+
+# Transport failures worth retrying (openai.APITimeoutError is a connection error)
+RETRYABLE_ERROR_TYPES = (
+    TimeoutError,
+    ConnectionError,
+    openai.APIConnectionError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+# Error message fragments for requests that can never fit the model's context
+CONTEXT_LENGTH_MARKERS = (
+    "context_length_exceeded",
+    "context length",
+    "maximum context",
+    "too many tokens",
+    "prompt is too long",
+)
+
+
+def get_error_status_code(error: Exception) -> Optional[int]:
+    """
+    Extract the HTTP status code from an API or HTTP client exception.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        Status code, or None if the error carries no HTTP response
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(error: Exception) -> str:
+    """
+    Classify an exception as ``"retryable"`` or ``"fatal"``.
+
+    Only errors known to be transient are retryable: rate limits (429),
+    request timeouts (408), server errors (5xx), timeouts and connection
+    errors. Everything else is fatal, including client errors such as
+    400/401/403/404/422, context-length overflows and programming errors.
+    Exceptions can override this with a ``retryable`` class attribute.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        "retryable" or "fatal"
+    """
+    retryable = getattr(error, "retryable", None)
+    if retryable is not None:
+        return "retryable" if retryable else "fatal"
+
+    if is_context_length_error(error):
+        return "fatal"
+
+    status = get_error_status_code(error)
+    if status is not None:
+        return (
+            "retryable"
+            if status in RETRYABLE_STATUS_CODES or status >= 500
+            else "fatal"
+        )
+
+    if isinstance(error, RETRYABLE_ERROR_TYPES):
+        return "retryable"
+
+    return "fatal"
+
+
+def is_context_length_error(error: Exception) -> bool:
+    """Check whether ``error`` reports a prompt too long for the model's context."""
+    message = str(error).lower()
+    return any(marker in message for marker in CONTEXT_LENGTH_MARKERS)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether retrying ``error`` can possibly succeed."""
+    return classify_error(error) == "retryable"
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the provider's requested delay from Retry-After style headers.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        Delay in seconds, or None if no usable header is present
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def compute_backoff_delay(
+    previous_delay: float,
+    base_delay: float,
+    max_delay: float,
+    growth_factor: float = 3.0,
+) -> float:
+    """
+    Compute the next delay using decorrelated jitter.
+
+    Each delay is drawn uniformly between ``base_delay`` and
+    ``previous_delay * growth_factor``, so concurrent tasks that failed together
+    spread out instead of retrying in lockstep.
+
+    Args:
+        previous_delay: Delay used before the previous attempt
+        base_delay: Minimum delay
+        max_delay: Maximum delay
+        growth_factor: Multiplier for the upper bound of the next delay
+
+    Returns:
+        Delay in seconds
+    """
+    upper = max(base_delay, previous_delay * growth_factor)
+    return min(max_delay, random.uniform(base_delay, upper))
+
+
 async def retry_with_backoff(
     func: Callable[..., T],
     *args,
     max_retries: int = None,
     base_delay: float = None,
     max_delay: float = 60.0,
-    exponential_base: float = 2.0,
+    exponential_base: float = 3.0,
     **kwargs,
 ) -> T:
     """
-    Retry a function with exponential backoff.
+    Retry a function with jittered backoff, honoring Retry-After headers.
+
+    Fatal errors (see ``classify_error``) are raised immediately. Retryable
+    errors wait for the provider's Retry-After delay if one is given, and
+    otherwise for a decorrelated-jitter delay.
 
     Args:
-        func: Function to retry (can be async or sync)
+        func: Function to retry (sync, async, or returning an awaitable)
         *args: Positional arguments for function
         max_retries: Maximum number of retries (from config if None)
         base_delay: Base delay between retries (from config if None)
         max_delay: Maximum delay between retries
-        exponential_base: Base for exponential backoff
+        exponential_base: Growth factor for the jitter upper bound
         **kwargs: Keyword arguments for function
 
     Returns:
         Function result
 
     Raises:
-        Last exception if all retries exhausted
+        The first fatal exception, or the last exception if all retries exhausted
     """
     if max_retries is None:
         max_retries = get_config_value("Evaluation", "max_retries", 3, int)
@@ -258,24 +420,26 @@ async def retry_with_backoff(
     if base_delay is None:
         base_delay = get_config_value("Evaluation", "retry_delay", 2, float)
 
-    last_exception = None
+    delay = base_delay
 
     for attempt in range(max_retries + 1):
         try:
-            if asyncio.iscoroutinefunction(func):
-                return await func(*args, **kwargs)
-            else:
-                return func(*args, **kwargs)
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
 
         except Exception as e:
-            last_exception = e
-
-            if attempt == max_retries:
-                # Last attempt failed, raise the exception
+            if attempt == max_retries or not is_retryable_error(e):
                 raise
 
-            # Calculate delay with exponential backoff
-            delay = min(base_delay * (exponential_base**attempt), max_delay)
+            retry_after = get_retry_after(e)
+            if retry_after is not None:
+                delay = min(retry_after, max_delay)
+            else:
+                delay = compute_backoff_delay(
+                    delay, base_delay, max_delay, exponential_base
+                )
 
             logging.warning(
                 f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
@@ -284,9 +448,6 @@ async def retry_with_backoff(
 
             await asyncio.sleep(delay)
 
-    # Should never reach here, but just in case
-    raise last_exception
-
 
 def setup_logging(
     level: str = "INFO", log_file: Optional[str] = None
@@ -409,6 +570,107 @@ def truncate_text(text: str, max_length: int, suffix: str = "...[truncated]") ->
     return text[:truncate_length] + suffix
 
 
+# Approximate characters per token by model family, matched against the
+# lower-cased model id in order; the default is deliberately conservative
+CHARS_PER_TOKEN = (
+    ("claude", 3.5),
+    ("gpt", 4.0),
+    ("openai/", 4.0),
+    ("gemini", 4.0),
+    ("llama", 3.8),
+    ("mistral", 3.7),
+    ("qwen", 3.6),
+    ("deepseek", 3.6),
+    ("kimi", 3.6),
+    ("moonshot", 3.6),
+    ("glm", 3.6),
+    ("grok", 3.8),
+    ("cross-encoder", 4.0),
+    ("minilm", 4.0),
+    ("mpnet", 4.0),
+)
+DEFAULT_CHARS_PER_TOKEN = 3.3
+
+
+def get_chars_per_token(model: Optional[str] = None) -> float:
+    """
+    Approximate tokenizer density for a model.
+
+    Args:
+        model: Model identifier (default ratio if None or unknown)
+
+    Returns:
+        Average number of characters per token
+    """
+    model_lower = (model or "").lower()
+    for fragment, ratio in CHARS_PER_TOKEN:
+        if fragment in model_lower:
+            return ratio
+    return DEFAULT_CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Estimate how many tokens ``text`` uses with a model's tokenizer.
+
+    Non-ASCII characters usually take one or more tokens each, so they are
+    counted separately from the per-family character ratio.
+
+    Args:
+        text: Text to measure
+        model: Model identifier used to pick the tokenizer approximation
+
+    Returns:
+        Estimated token count (rounded up)
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return math.ceil((len(text) - non_ascii) / get_chars_per_token(model) + non_ascii)
+
+
+def truncate_to_tokens(
+    text: str,
+    max_tokens: int,
+    model: Optional[str] = None,
+    suffix: str = "...[truncated]",
+) -> str:
+    """
+    Truncate text to an estimated token budget, preferring a sentence boundary.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum estimated tokens, including the suffix
+        model: Model identifier used to pick the tokenizer approximation
+        suffix: Suffix to add to truncated text
+
+    Returns:
+        Text whose estimated token count is at most ``max_tokens``
+    """
+    if estimate_tokens(text, model) <= max_tokens:
+        return text
+
+    budget = max_tokens - estimate_tokens(suffix, model)
+    if budget <= 0:
+        return ""
+
+    # Start from the character estimate and shrink until the estimate fits
+    max_chars = int(budget * get_chars_per_token(model))
+    truncated = text[:max_chars]
+    while truncated and estimate_tokens(truncated, model) > budget:
+        truncated = truncated[: int(len(truncated) * 0.9)]
+
+    # Cut at a sentence end in the last 30% if there is one, else at a word break
+    sentence_end = max(truncated.rfind(". "), truncated.rfind(".\n"))
+    if sentence_end > len(truncated) * 0.7:
+        return truncated[: sentence_end + 1] + suffix
+
+    word_break = truncated.rfind(" ")
+    if word_break > len(truncated) * 0.7:
+        truncated = truncated[:word_break]
+    return truncated + suffix
+
+
 def get_timestamp() -> str:
     """Get current timestamp in ISO format."""
     return datetime.now().isoformat()
@@ -0,0 +1,72 @@
+"""
+Shared test setup.
+
+Several modules read config.cfg at import time, so the configuration is seeded
+from config.example.cfg (with a dummy API key) before any test module imports
+them. Runs write to a temporary directory and never call a real model.
+"""
+
+import configparser
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import src.utils as utils  # noqa: E402
+
+_config = configparser.ConfigParser()
+_config.read(REPO_ROOT / "config.example.cfg")
+_config.set("OpenRouter", "api_key", "test-key")
+_config.set("Paths", "prompts_file", str(REPO_ROOT / "data/prompts/cyber_evals.jsonl"))
+utils._config = _config
+
+
+class FakeMessage:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class FakeChoice:
+    def __init__(self, content: str):
+        self.message = FakeMessage(content)
+
+
+class FakeResponse:
+    def __init__(self, content: str):
+        self.choices = [FakeChoice(content)]
+
+
+class FakeClient:
+    """Stand-in for the OpenAI client that answers every request locally."""
+
+    def __init__(self, reply=None):
+        self.reply = reply or (lambda **kwargs: f"Answer from {kwargs['model']}")
+        self.calls = []
+        self._lock = threading.Lock()
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs) -> FakeResponse:
+        with self._lock:
+            self.calls.append(kwargs)
+        return FakeResponse(self.reply(**kwargs))
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    """Point [Paths] output_dir and cache_dir at a temporary directory."""
+    saved = dict(_config["Paths"])
+    _config.set("Paths", "output_dir", str(tmp_path / "run"))
+    _config.set("Paths", "cache_dir", str(tmp_path / "cache"))
+    yield tmp_path / "run"
+    for key, value in saved.items():
+        _config.set("Paths", key, value)
+
+
+@pytest.fixture
+def fake_client():
+    return FakeClient()
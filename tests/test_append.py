@@ -0,0 +1,127 @@
+"""Appending models to an existing run (--append)."""
+
+import asyncio
+import json
+
+import pytest
+
+import cyber_policy_bench as bench
+from src.aggregates import aggregate_results, load_aggregates, merge_aggregates
+from src.evaluator import (
+    EVALUATION_STREAM_FILENAME,
+    CyberPolicyEvaluator,
+    EvaluationMode,
+)
+from src.result_writer import SCORED_STREAM_FILENAME
+
+
+def _result(model_name, score, mode="no_context"):
+    return {
+        "question": "Which SOC 2 criteria cover access control?",
+        "ideal_answer": "CC6.1",
+        "model_response": f"{model_name} cites CC6.1",
+        "model_name": model_name,
+        "evaluation_mode": mode,
+        "context_provided": None,
+        "accuracy_score": score,
+    }
+
+
+class FixedScorer:
+    """Scores every result with a model-specific constant."""
+
+    SCORES = {"old-model": 0.5, "new-model": 0.9}
+
+    async def score_result(self, result, scoring_methods=None):
+        return {**result, "accuracy_score": self.SCORES[result["model_name"]]}
+
+    async def score_evaluation_results(self, results, scoring_methods=None):
+        return {
+            model_name: [await self.score_result(r) for r in model_results]
+            for model_name, model_results in results.items()
+        }
+
+
+@pytest.fixture
+def benchmark(monkeypatch, fake_client):
+    """Run the bench's evaluate and score steps for two questions, locally."""
+
+    async def prepare(vector_db, num_models, num_questions, journal, resume, ids):
+        evaluator = CyberPolicyEvaluator(client=fake_client, resume=False)
+        questions = evaluator.load_evaluation_questions()[:2]
+        return evaluator, list(ids), questions, [EvaluationMode.NO_CONTEXT]
+
+    monkeypatch.setattr(bench, "prepare_evaluation", prepare)
+    monkeypatch.setattr(bench, "open_response_journal", lambda: None)
+    monkeypatch.setattr(bench, "open_verdict_cache", lambda: None)
+    monkeypatch.setattr(
+        bench, "create_scorer", lambda verdict_cache=None: FixedScorer()
+    )
+
+    async def run(model_ids, output_dir, pipelined):
+        if pipelined:
+            return await bench.run_pipelined_benchmark(
+                None, resume=False, model_ids=model_ids, output_dir=output_dir
+            )
+        evaluation_results = await bench.run_evaluation(
+            None, resume=False, model_ids=model_ids, output_dir=output_dir
+        )
+        return await bench.score_evaluation_results(evaluation_results, output_dir)
+
+    return lambda *args: asyncio.run(run(*args))
+
+
+def test_merge_aggregates_replaces_existing_models():
+    existing = aggregate_results({"a": [_result("a", 0.2)], "b": [_result("b", 0.4)]})
+    new = aggregate_results({"b": [_result("b", 1.0)], "c": [_result("c", 0.6)]})
+
+    merged = merge_aggregates(existing, new)
+
+    assert list(merged) == ["a", "b", "c"]
+    assert merged["a"] is existing["a"]
+    assert merged["b"].total_evaluations == 1
+    assert merged["b"].scores.mean == 1.0
+    assert list(existing) == ["a", "b"]
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_append_keeps_existing_run(benchmark, run_dir, pipelined):
+    # An earlier run evaluated, scored and saved old-model
+    stream_path = benchmark(["old-model"], run_dir, pipelined)
+    bench.save_results(
+        stream_path, bench.generate_summary_report(bench.aggregate_stream(stream_path))
+    )
+    old_evaluation_stream = (run_dir / EVALUATION_STREAM_FILENAME).read_bytes()
+
+    # --append evaluates new-model in the scratch directory, then merges
+    stream_path = benchmark(["new-model"], bench.get_append_dir(), pipelined)
+    aggregates = bench.append_to_run(stream_path, run_dir)
+    bench.save_results(
+        run_dir / SCORED_STREAM_FILENAME,
+        bench.generate_summary_report(aggregates),
+        aggregates=aggregates,
+    )
+
+    saved = json.loads((run_dir / "detailed_results.json").read_text())
+    assert list(saved) == ["old-model", "new-model"]
+    assert [r["accuracy_score"] for r in saved["old-model"]] == [0.5, 0.5]
+    assert [r["accuracy_score"] for r in saved["new-model"]] == [0.9, 0.9]
+    assert list(load_aggregates(run_dir)) == ["old-model", "new-model"]
+    assert (run_dir / EVALUATION_STREAM_FILENAME).read_bytes() == old_evaluation_stream
+
+
+def test_append_replaces_model_already_in_run(benchmark, run_dir):
+    stream_path = benchmark(["old-model", "new-model"], run_dir, False)
+    bench.save_results(
+        stream_path, bench.generate_summary_report(bench.aggregate_stream(stream_path))
+    )
+
+    stream_path = benchmark(["new-model"], bench.get_append_dir(), False)
+    aggregates = bench.append_to_run(stream_path, run_dir)
+
+    records = [
+        json.loads(line)
+        for line in (run_dir / SCORED_STREAM_FILENAME).read_text().splitlines()
+    ]
+    assert [r["model_name"] for r in records] == ["old-model"] * 2 + ["new-model"] * 2
+    assert aggregates["new-model"].total_evaluations == 2
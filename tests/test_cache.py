@@ -0,0 +1,60 @@
+"""Append-only JSONL cache."""
+
+from src.cache import JsonlCache, make_cache_key
+
+
+def test_records_survive_reopening_with_last_write_winning(tmp_path):
+    path = tmp_path / "cache" / "journal.jsonl"
+    with JsonlCache(path) as cache:
+        cache.put("a", {"value": 1})
+        cache.put("b", {"value": 2})
+        cache.put("a", {"value": 3})
+
+    with JsonlCache(path) as cache:
+        assert len(cache) == 2
+        assert cache.get("a") == {"value": 3}
+        assert dict(cache.items()) == {"a": {"value": 3}, "b": {"value": 2}}
+        assert cache.get_stats()["writes"] == 0
+
+
+def test_truncated_and_corrupt_lines_are_skipped(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with JsonlCache(path) as cache:
+        cache.put("a", {"value": 1})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('["not an entry"]\n{"key": "b", "record": {"val')
+
+    with JsonlCache(path) as cache:
+        assert list(cache.items()) == [("a", {"value": 1})]
+        cache.put("c", {"value": 3})
+
+    # The partial line is left behind, but records appended after it still load
+    with JsonlCache(path) as cache:
+        assert "c" in cache and "b" not in cache
+
+
+def test_hit_statistics(tmp_path):
+    cache = JsonlCache(tmp_path / "journal.jsonl")
+    cache.put("a", {"value": 1})
+
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("missing") is None
+    assert cache.get_stats()["hit_rate"] == 0.5
+
+    cache.close()
+    cache.close()
+
+
+def test_cache_keys_are_stable_and_order_sensitive():
+    assert make_cache_key("model", {"b": 1, "a": 2}) == make_cache_key(
+        "model", {"a": 2, "b": 1}
+    )
+    assert make_cache_key("a", "b") != make_cache_key("b", "a")
+
+
+def test_values_are_the_deduplicated_records(tmp_path):
+    with JsonlCache(tmp_path / "journal.jsonl") as cache:
+        cache.put("a", {"value": 1})
+        cache.put("a", {"value": 2})
+
+        assert list(cache.values()) == [{"value": 2}]
@@ -0,0 +1,67 @@
+"""Per-model circuit breakers."""
+
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+REQUEST = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+
+
+def _failing_call(status):
+    async def call():
+        raise openai.APIStatusError(
+            "error", response=httpx.Response(status, request=REQUEST), body=None
+        )
+
+    return call
+
+
+async def _ok():
+    return "ok"
+
+
+def test_fatal_errors_do_not_open_the_breaker():
+    breaker = CircuitBreaker("model-a", failure_threshold=3)
+
+    async def run():
+        for _ in range(10):
+            with pytest.raises(openai.APIStatusError):
+                await breaker.call(_failing_call(400))
+        return await breaker.call(_ok)
+
+    assert asyncio.run(run()) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.times_opened == 0
+
+
+def test_retryable_errors_open_the_breaker():
+    breaker = CircuitBreaker("model-a", failure_threshold=3)
+
+    async def run():
+        for _ in range(3):
+            with pytest.raises(openai.APIStatusError):
+                await breaker.call(_failing_call(503))
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+
+    asyncio.run(run())
+    assert breaker.times_opened == 1
+    assert breaker.rejected_calls == 1
+
+
+def test_fatal_error_on_probe_allows_another_probe():
+    breaker = CircuitBreaker("model-a", failure_threshold=1, cooldown_seconds=0)
+
+    async def run():
+        with pytest.raises(openai.APIStatusError):
+            await breaker.call(_failing_call(503))
+        with pytest.raises(openai.APIStatusError):
+            await breaker.call(_failing_call(422))
+        return await breaker.call(_ok)
+
+    assert asyncio.run(run()) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
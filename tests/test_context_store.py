@@ -0,0 +1,35 @@
+"""Content-addressed context store."""
+
+from src.context_store import ContextStore, context_hash, externalize_context
+
+
+def test_put_stores_once_without_keeping_text(tmp_path):
+    store = ContextStore(tmp_path / "contexts")
+    keys = [store.put(f"context {i}" * 100) for i in range(3)]
+
+    assert keys == [context_hash(f"context {i}" * 100) for i in range(3)]
+    assert store.put("context 0" * 100) == keys[0]
+    assert len(list(store.root.rglob("*.gz"))) == 3
+    assert not store._texts
+
+
+def test_get_keeps_only_recent_contexts(tmp_path):
+    store = ContextStore(tmp_path / "contexts", max_cached=2)
+    keys = [store.put(f"context {i}") for i in range(3)]
+
+    assert [store.get(key) for key in keys] == [f"context {i}" for i in range(3)]
+    assert list(store._texts) == keys[1:]
+    assert store.get(keys[1]) == "context 1"
+    assert list(store._texts) == [keys[2], keys[1]]
+    assert store.get("0" * 64) is None
+
+
+def test_externalize_and_resolve_round_trip(tmp_path):
+    store = ContextStore(tmp_path / "contexts")
+    result = {"question": "q", "context_provided": "framework text", "score": 1}
+
+    externalized = externalize_context(result, store)
+
+    assert list(externalized) == ["question", "context_hash", "score"]
+    assert "context_provided" in result
+    assert ContextStore(store.root).resolve(externalized) == "framework text"
@@ -0,0 +1,55 @@
+"""Control catalog use in heuristic scoring workers."""
+
+import asyncio
+
+import src.control_catalog as control_catalog
+from conftest import _config
+from src.control_catalog import ControlCatalog, get_control_catalog, set_control_catalog
+from src.scorer import ScoringMethod, score_results_offloaded
+
+
+def test_offloaded_workers_use_the_parent_catalog(monkeypatch, tmp_path):
+    index_path = tmp_path / "control_catalog.json"
+    monkeypatch.setitem(_config["Paths"], "control_catalog", str(index_path))
+    monkeypatch.setitem(_config["Paths"], "frameworks_dir", str(tmp_path / "none"))
+    monkeypatch.setattr(control_catalog, "_control_catalog", None)
+    monkeypatch.setattr(control_catalog, "_control_catalog_loaded", False)
+    set_control_catalog(ControlCatalog({"SOC 2": ["CC6.1"]}))
+
+    async def no_judge(*args, **kwargs):
+        return {}
+
+    results = {
+        "model": [
+            {
+                "question": "Which SOC 2 criteria cover logical access?",
+                "model_response": "Logical access is covered by CC6.1 and CC9.9 "
+                "of the SOC 2 Trust Services Criteria.",
+                "ideal_answer": "CC6.1",
+                "model_name": "model",
+            }
+        ]
+    }
+    method = ScoringMethod.CITATION_VERIFICATION
+    scored = asyncio.run(
+        score_results_offloaded(no_judge, results, [method], [method], max_workers=2)
+    )
+
+    details = scored["model"][0]["scores"]["citation_verification"]["details"]
+    assert details["verified_controls"] == ["CC6.1"]
+    assert details["invalid_controls"] == ["CC9.9"]
+    assert not index_path.exists()
+
+
+def test_set_catalog_is_used_without_loading_or_building(monkeypatch, tmp_path):
+    monkeypatch.setitem(
+        _config["Paths"], "control_catalog", str(tmp_path / "control_catalog.json")
+    )
+    monkeypatch.setattr(control_catalog, "_control_catalog", None)
+    monkeypatch.setattr(control_catalog, "_control_catalog_loaded", False)
+    catalog = ControlCatalog({"GDPR": ["ARTICLE 32"]})
+
+    set_control_catalog(catalog)
+
+    assert get_control_catalog() is catalog
+    assert not (tmp_path / "control_catalog.json").exists()
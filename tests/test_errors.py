@@ -0,0 +1,52 @@
+"""Retryable vs fatal error classification."""
+
+import httpx
+import openai
+import pytest
+import requests
+
+from src.llm_client import RequestTimeoutError
+from src.utils import classify_error
+
+REQUEST = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+
+
+def _status_error(status, message="error"):
+    return openai.APIStatusError(
+        message, response=httpx.Response(status, request=REQUEST), body=None
+    )
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _status_error(429),
+        _status_error(500),
+        _status_error(503),
+        openai.APIConnectionError(request=REQUEST),
+        openai.APITimeoutError(request=REQUEST),
+        TimeoutError("deadline exceeded"),
+        RequestTimeoutError("model-a", 30),
+        requests.ConnectionError("connection reset"),
+        requests.ReadTimeout("read timed out"),
+    ],
+)
+def test_transient_errors_are_retryable(error):
+    assert classify_error(error) == "retryable"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _status_error(400),
+        _status_error(401),
+        _status_error(422),
+        _status_error(500, "This model's maximum context length is 8192 tokens"),
+        KeyError("choices"),
+        AttributeError("'NoneType' object has no attribute 'content'"),
+        TypeError("unsupported operand"),
+        ValueError("bad value"),
+    ],
+)
+def test_other_errors_are_fatal(error):
+    assert classify_error(error) == "fatal"
@@ -0,0 +1,49 @@
+"""Hedged requests."""
+
+import asyncio
+
+import pytest
+
+from src.hedging import HedgingPolicy
+
+
+def test_failed_calls_are_recorded_at_their_elapsed_time():
+    policy = HedgingPolicy(enabled=True, min_samples=1)
+
+    async def timeout():
+        await asyncio.sleep(0.02)
+        raise TimeoutError("deadline exceeded")
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(policy.run("model", timeout))
+
+    assert policy.hedge_delay("model") >= 0.02
+
+
+def test_slow_call_is_hedged_and_backup_wins():
+    policy = HedgingPolicy(enabled=True, budget_ratio=1.0, min_samples=1)
+    policy.record_latency("model", 0.01)
+    delays = iter([0.5, 0.0])
+
+    async def call():
+        await asyncio.sleep(next(delays))
+        return "done"
+
+    assert asyncio.run(policy.run("model", call)) == "done"
+    assert policy.hedged_calls == 1
+    assert policy.hedge_wins == 1
+
+
+def test_hedged_call_records_latency_when_every_request_fails():
+    policy = HedgingPolicy(enabled=True, budget_ratio=1.0, min_samples=1)
+    policy.record_latency("model", 0.005)
+
+    async def fail():
+        await asyncio.sleep(0.02)
+        raise ValueError("provider error")
+
+    with pytest.raises(ValueError):
+        asyncio.run(policy.run("model", fail))
+
+    assert policy.hedged_calls == 1
+    assert len(policy._latencies["model"]) == 2
@@ -0,0 +1,204 @@
+"""Judge verdict handling in the ensemble and dual-judge scorers."""
+
+import asyncio
+import json
+
+from conftest import FakeClient, _config
+from src.scorer import (
+    AccuracyScorer,
+    EnsembleJudgeScorer,
+    ScoringMethod,
+    TwoJudgeScorer,
+)
+
+QUESTION = "Which SOC 2 criteria cover logical access control?"
+IDEAL = "CC6.1 covers logical access security over protected information assets."
+RESPONSE = (
+    "Logical access is covered by ISO 27001 A.9, which requires documented access "
+    "control policies and periodic access reviews for every system."
+)
+
+
+def _verdict(score):
+    return lambda **kwargs: json.dumps({"score": score, "explanation": "verdict"})
+
+
+def test_ensemble_counts_zero_verdicts_and_stops_early():
+    client = FakeClient(_verdict(0.0))
+    scorer = EnsembleJudgeScorer(["judge-a", "judge-b", "judge-c"], client=client)
+
+    result = asyncio.run(scorer.ensemble_llm_judge_score(QUESTION, RESPONSE, IDEAL))
+
+    assert result.accuracy_score == 0.0
+    assert result.details["consensus"] is True
+    assert result.details["judges_used"] == 2
+    assert len(client.calls) == 2
+    assert scorer.judge_failure_counts == {"judge-a": 0, "judge-b": 0, "judge-c": 0}
+
+
+def test_ensemble_keys_judge_scores_by_judge_index():
+    scorer = EnsembleJudgeScorer(
+        ["judge-a", "judge-a"], client=FakeClient(_verdict(0.7))
+    )
+
+    result = asyncio.run(scorer.ensemble_llm_judge_score(QUESTION, RESPONSE, IDEAL))
+
+    assert result.details["judge_scores"] == {0: 0.7, 1: 0.7}
+    assert result.accuracy_score == 0.7
+
+
+def test_ensemble_reports_failed_judges():
+    def fail(**kwargs):
+        raise ValueError("judge unavailable")
+
+    scorer = EnsembleJudgeScorer(["judge-a", "judge-b"], client=FakeClient(fail))
+
+    result = asyncio.run(
+        scorer.ensemble_llm_judge_score(QUESTION, RESPONSE, IDEAL, max_retries=1)
+    )
+
+    assert result.explanation == "All ensemble judges failed"
+    assert result.details["judge_scores"] == {0: None, 1: None}
+
+
+def _cascade_scorer(client):
+    scorer = TwoJudgeScorer("judge-1", "judge-2", client=client)
+    scorer.judge_cascade = True
+    return scorer
+
+
+def test_cascade_does_not_escalate_zero_verdict():
+    client = FakeClient(_verdict(0.0))
+    scorer = _cascade_scorer(client)
+
+    result = asyncio.run(scorer.dual_llm_judge_score(QUESTION, RESPONSE, IDEAL))
+
+    assert result.accuracy_score == 0.0
+    assert result.details["cascade"] == "judge_1_confident"
+    assert [call["model"] for call in client.calls] == ["judge-1"]
+    assert scorer.judge_1_failure_count == 0
+
+
+def test_cascade_resolved_items_do_not_lower_dual_success_rate():
+    def reply(messages, **kwargs):
+        score = 0.5 if "partly right" in messages[0]["content"] else 0.0
+        return json.dumps({"score": score, "explanation": "verdict"})
+
+    scorer = _cascade_scorer(FakeClient(reply))
+
+    asyncio.run(scorer.dual_llm_judge_score(QUESTION, RESPONSE, IDEAL))
+    asyncio.run(scorer.dual_llm_judge_score(QUESTION, "CC6.1, partly right", IDEAL))
+
+    stats = scorer.get_judge_statistics()
+    assert stats["cascade"]["skipped"] == 1
+    assert stats["dual_success_count"] == 1
+    assert stats["dual_success_rate"] == 1.0
+
+
+def test_cascade_escalates_failed_judge():
+    def reply(**kwargs):
+        if kwargs["model"] == "judge-1":
+            return "no verdict here"
+        return json.dumps({"score": 0.6, "explanation": "verdict"})
+
+    scorer = _cascade_scorer(FakeClient(reply))
+
+    result = asyncio.run(scorer.dual_llm_judge_score(QUESTION, RESPONSE, IDEAL))
+
+    assert result.details["cascade"] == "judge_1_failed"
+    assert result.accuracy_score == 0.6
+
+
+def test_cascade_batch_pre_pass_skips_judge_2():
+    scorer = _cascade_scorer(FakeClient(_verdict(0.0)))
+    scorer.batch_judging = True
+    primed = []
+
+    async def prime(judge, items):
+        primed.append(judge)
+
+    scorer.single_scorer_1.prime_batched_verdicts = lambda i: prime("judge-1", i)
+    scorer.single_scorer_2.prime_batched_verdicts = lambda i: prime("judge-2", i)
+
+    results = {
+        "model": [
+            {
+                "question": QUESTION,
+                "model_response": RESPONSE,
+                "ideal_answer": IDEAL,
+                "model_name": "model",
+                "evaluation_mode": "no_context",
+            }
+        ]
+    }
+    asyncio.run(scorer.score_evaluation_results(results, [ScoringMethod.LLM_JUDGE]))
+
+    assert primed == ["judge-1"]
+
+
+def test_batch_judging_shuffles_labels_and_stores_each_items_verdict():
+    responses = [
+        f"Response {n}: access control is covered by CC6.{n}, which requires "
+        f"authentication and periodic reviews (expected score 0.{n})."
+        for n in range(1, 7)
+    ]
+
+    def reply(**kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        verdicts = []
+        for block in prompt.split("\n\nResponse ")[1:]:
+            label, text = block.split(":\n", 1)
+            if "expected score" not in text:
+                continue
+            score = float(text.split("expected score ")[1][:3])
+            verdicts.append({"label": label, "score": score, "explanation": "ok"})
+        return json.dumps(verdicts)
+
+    client = FakeClient(reply)
+    scorer = AccuracyScorer("judge", client=client)
+
+    results = asyncio.run(scorer.batch_llm_judge_score(QUESTION, IDEAL, responses))
+
+    assert len(client.calls) == 1
+    assert [r.accuracy_score for r in results] == [n / 10 for n in range(1, 7)]
+    prompt = client.calls[0]["messages"][0]["content"]
+    presented = [prompt.index(response) for response in responses]
+    assert presented != sorted(presented)
+    for n, result in enumerate(results, start=1):
+        verdict = json.loads(result.details["judge_response"])
+        assert verdict["score"] == n / 10
+        assert set(verdict) == {"label", "score", "explanation"}
+
+
+def test_score_result_marks_scoring_failures():
+    async def fail(*args, **kwargs):
+        raise RuntimeError("judge unavailable")
+
+    result = {
+        "question": QUESTION,
+        "ideal_answer": IDEAL,
+        "model_response": RESPONSE,
+        "model_name": "model-a",
+    }
+    for scorer in (
+        AccuracyScorer("judge", client=FakeClient()),
+        TwoJudgeScorer("judge-1", "judge-2", client=FakeClient()),
+        EnsembleJudgeScorer(["judge-a", "judge-b"], client=FakeClient()),
+    ):
+        scorer.score_response = fail
+        scored = asyncio.run(scorer.score_result(result))
+        assert scored["accuracy_score"] == 0.0
+        assert scored["scores"] == {"error": "judge unavailable"}
+        assert "scores" not in result
+
+
+def test_judge_calls_use_configured_sampling(monkeypatch):
+    monkeypatch.setitem(_config["Scoring"], "judge_temperature", "0.3")
+    monkeypatch.setitem(_config["Scoring"], "judge_top_p", "0.9")
+    client = FakeClient(_verdict(0.8))
+    scorer = AccuracyScorer("judge", client=client)
+
+    asyncio.run(scorer.llm_judge_score(QUESTION, RESPONSE, IDEAL))
+
+    assert client.calls[0]["temperature"] == 0.3
+    assert client.calls[0]["top_p"] == 0.9
@@ -0,0 +1,89 @@
+"""Pipelined scoring (stream_into_scoring)."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.pipeline import stream_into_scoring
+from src.result_writer import ResultStreamWriter, compact_result_stream
+
+
+class SlowFirstScorer:
+    """Finishes results out of order: earlier results take longer to score."""
+
+    def __init__(self, total):
+        self.total = total
+
+    async def score_result(self, result, scoring_methods=None):
+        await asyncio.sleep(0.002 * (self.total - result["number"]))
+        return {**result, "accuracy_score": result["number"] / self.total}
+
+
+def _produce(models, per_model):
+    async def produce(sink):
+        task_index = 0
+        for model_name in models:
+            for number in range(per_model):
+                await sink(task_index, {"model_name": model_name, "number": number})
+                task_index += 1
+
+    return produce
+
+
+def test_results_are_reassembled_in_task_order():
+    scored = asyncio.run(
+        stream_into_scoring(
+            _produce(["a", "b"], 6), SlowFirstScorer(6), queue_size=3, num_workers=4
+        )
+    )
+
+    assert list(scored) == ["a", "b"]
+    for model_results in scored.values():
+        assert [r["number"] for r in model_results] == list(range(6))
+
+
+def test_result_writer_receives_every_result_and_nothing_is_kept(tmp_path):
+    stream_path = tmp_path / "scored_results.jsonl"
+    writer = ResultStreamWriter(stream_path)
+
+    scored = asyncio.run(
+        stream_into_scoring(
+            _produce(["a", "b"], 6),
+            SlowFirstScorer(6),
+            queue_size=3,
+            num_workers=4,
+            result_writer=writer,
+        )
+    )
+    writer.close()
+
+    assert scored == {}
+    lines = [json.loads(line) for line in stream_path.read_text().splitlines()]
+    assert sorted(r["task_index"] for r in lines) == list(range(12))
+
+    compacted = json.loads(
+        compact_result_stream(stream_path, tmp_path / "detailed.json").read_text()
+    )
+    assert list(compacted) == ["a", "b"]
+    for model_results in compacted.values():
+        assert [r["number"] for r in model_results] == list(range(6))
+        assert all("task_index" not in r for r in model_results)
+
+
+class FailingScorer:
+    async def score_result(self, result, scoring_methods=None):
+        raise RuntimeError("scorer crashed")
+
+
+def test_failing_scorer_stops_the_producer():
+    async def run():
+        return await asyncio.wait_for(
+            stream_into_scoring(
+                _produce(["a"], 10), FailingScorer(), queue_size=1, num_workers=1
+            ),
+            timeout=5,
+        )
+
+    with pytest.raises(RuntimeError, match="scorer crashed"):
+        asyncio.run(run())
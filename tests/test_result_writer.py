@@ -0,0 +1,114 @@
+"""Streaming result files."""
+
+import json
+
+import pytest
+
+from src.context_store import ContextStore
+from src.result_writer import (
+    ResultStreamWriter,
+    compact_result_stream,
+    iter_result_stream,
+    write_result_stream,
+)
+
+RESULTS = {
+    "model-a": [
+        {
+            "question": "Which SOC 2 criteria cover access control?",
+            "model_name": "model-a",
+            "context_provided": "SOC 2 framework text ü",
+            "accuracy_score": 0.75,
+            "scores": {"llm_judge": {"score": 0.75, "details": {"nested": [1, 2]}}},
+        },
+        {"question": "q2", "model_name": "model-a", "context_provided": None},
+    ],
+    "model-b": [{"question": "q1", "accuracy_score": None, "tags": []}],
+}
+
+
+def test_compacted_stream_matches_json_dump(tmp_path):
+    stream_path = write_result_stream(RESULTS, tmp_path / "scored.jsonl")
+
+    output_path = compact_result_stream(
+        stream_path, tmp_path / "detailed.json", exclude=("task_index", "model_name")
+    )
+
+    expected = {
+        model: [{k: v for k, v in r.items() if k != "model_name"} for r in results]
+        for model, results in RESULTS.items()
+    }
+    assert output_path.read_text(encoding="utf-8") == json.dumps(
+        expected, indent=2, ensure_ascii=False
+    )
+
+
+def test_compaction_orders_records_by_task_index(tmp_path):
+    stream_path = tmp_path / "scored.jsonl"
+    with ResultStreamWriter(stream_path) as writer:
+        for task_index in (2, 0, 3, 1):
+            model = "a" if task_index < 2 else "b"
+            writer.write(
+                {"task_index": task_index, "model_name": model, "n": task_index}
+            )
+
+    compacted = json.loads(
+        compact_result_stream(stream_path, tmp_path / "detailed.json").read_text()
+    )
+
+    assert compacted == {
+        "b": [{"model_name": "b", "n": 2}, {"model_name": "b", "n": 3}],
+        "a": [{"model_name": "a", "n": 0}, {"model_name": "a", "n": 1}],
+    }
+
+
+def test_empty_stream_compacts_to_empty_object(tmp_path):
+    stream_path = write_result_stream({}, tmp_path / "scored.jsonl")
+
+    output_path = compact_result_stream(stream_path, tmp_path / "detailed.json")
+
+    assert output_path.read_text() == json.dumps({}, indent=2)
+
+
+def test_contexts_are_stored_once_and_resolvable(tmp_path):
+    store = ContextStore(tmp_path / "contexts")
+    stream_path = write_result_stream(RESULTS, tmp_path / "scored.jsonl", store)
+
+    records = list(iter_result_stream(stream_path))
+
+    assert "context_provided" not in records[0]
+    assert records[1]["context_hash"] is None
+    assert store.resolve(records[0]) == "SOC 2 framework text ü"
+    assert len(list(store.root.rglob("*.gz"))) == 1
+
+
+def test_unreadable_lines_are_skipped(tmp_path):
+    stream_path = tmp_path / "scored.jsonl"
+    stream_path.write_text('{"n": 1}\n\nnot json\n{"n": 2}\n{"n": ', encoding="utf-8")
+
+    assert [r["n"] for r in iter_result_stream(stream_path)] == [1, 2]
+
+
+def test_write_errors_are_raised_on_close(tmp_path):
+    writer = ResultStreamWriter(tmp_path / "scored.jsonl")
+    writer.write({"n": 1})
+    circular = {"n": 0}
+    circular["self"] = circular
+    writer.write(circular)
+    writer.write({"n": 2})
+
+    with pytest.raises(ValueError):
+        writer.close()
+    assert writer.records_written == 2
+
+
+def test_unexpected_errors_do_not_stop_the_writer(tmp_path):
+    store = ContextStore(tmp_path / "contexts")
+    writer = ResultStreamWriter(tmp_path / "scored.jsonl", store, max_queued=1)
+    writer.write({"n": 1, "context_provided": 42})
+    for n in range(2, 5):
+        writer.write({"n": n, "context_provided": None})
+
+    with pytest.raises(AttributeError):
+        writer.close()
+    assert [r["n"] for r in iter_result_stream(writer.path)] == [2, 3, 4]
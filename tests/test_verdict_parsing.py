@@ -0,0 +1,79 @@
+"""Parsing judge replies into verdicts."""
+
+import asyncio
+import json
+
+import pytest
+
+from conftest import FakeClient
+from src.scorer import (
+    AccuracyScorer,
+    JudgeParseError,
+    _parse_batch_verdicts,
+    parse_judge_verdict,
+)
+
+
+@pytest.mark.parametrize(
+    "reply, expected",
+    [
+        ('{"score": 0.8, "explanation": "Mostly right"}', (0.8, "Mostly right")),
+        (
+            'Verdict:\n```json\n{"score": 0.25, "explanation": "Weak"}\n```',
+            (0.25, "Weak"),
+        ),
+        ('{"score": "0.6", "explanation": "String score"}', (0.6, "String score")),
+        ('{"score": 1.7, "explanation": "Too high"}', (1.0, "Too high")),
+        ('{"score": -2}', (0.0, "No explanation provided")),
+        ('{"score": 0.9, "explanation": "Cut off mid-sen', (0.9, "Cut off mid-sen")),
+        ("Score: 0.4 overall", (0.4, "Extracted from non-JSON response")),
+    ],
+)
+def test_parse_judge_verdict(reply, expected):
+    assert parse_judge_verdict(reply) == expected
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        '{"score": null, "explanation": "Cannot judge"}',
+        '{"score": "N/A", "explanation": "Cannot judge"}',
+        '{"score": {"value": 1}}',
+        "I cannot evaluate this response.",
+    ],
+)
+def test_parse_judge_verdict_rejects_missing_or_non_numeric_scores(reply):
+    with pytest.raises(JudgeParseError):
+        parse_judge_verdict(reply)
+
+
+def test_batch_verdicts_drop_the_same_non_numeric_scores():
+    reply = json.dumps(
+        [
+            {"label": "a", "score": 0.5, "explanation": "ok"},
+            {"label": "B", "score": None},
+            {"label": "C", "score": "N/A"},
+            {"score": 1.0},
+        ]
+    )
+
+    assert _parse_batch_verdicts(reply) == {"A": {"score": 0.5, "explanation": "ok"}}
+
+
+def test_unparseable_verdict_is_a_judge_error():
+    def reply(**kwargs):
+        return '{"score": null, "explanation": "Cannot judge"}'
+
+    scorer = AccuracyScorer("judge", client=FakeClient(reply))
+
+    result = asyncio.run(
+        scorer.llm_judge_score(
+            "Which SOC 2 criteria cover logical access control?",
+            "Logical access is covered by CC6.1, which requires access control "
+            "policies, authentication and periodic access reviews.",
+            "CC6.1",
+        )
+    )
+
+    assert result.details["error_type"] == "parse_error"
+    assert scorer.judge_parse_failures == 1